@@ -0,0 +1,230 @@
+"""
+Rendering benchmark scenes for Galaxy Shooter
+
+Runs a few representative scenes through each render backend and prints
+the average update and draw cost per frame. The world_* scenes hold the
+same entities as their sprite scenes, spawned into an ECS World (see
+core.ecs) from the sprites' to_bundle() and run by its systems.
+
+Usage (from the repository root):
+    python -m benchmarks.scenes
+    python -m benchmarks.scenes --backend sdl2 --frames 500 --headless
+    python -m benchmarks.scenes --headless --scene world_bullet_storm --scale 20
+"""
+
+import argparse
+import os
+import random
+import time
+
+
+def build_formation(count):
+    """A large formation of zigzagging enemies"""
+    from core.sprite_group import FastGroup
+    from entities.enemy import Enemy
+    from core import config
+
+    group = FastGroup()
+    columns = 12
+    for i in range(count):
+        x = 40 + (i % columns) * 45
+        y = 60 + (i // columns) * 35 % 500
+        group.add(Enemy(x, y, config.SCREEN_WIDTH))
+    return [group], None
+
+
+def build_bullet_storm(count):
+    """Enemy and player bullets filling the arena"""
+    from core.sprite_group import FastGroup
+    from entities.enemyBullets import EnemyBullet
+    from entities.bullet import Bullets
+    from core import config
+
+    enemy_bullets = FastGroup()
+    player_bullets = FastGroup()
+    for _ in range(count):
+        enemy_bullets.add(EnemyBullet(random.randrange(config.SCREEN_WIDTH), random.randrange(config.SCREEN_HEIGHT)))
+        player_bullets.add(Bullets(random.randrange(config.SCREEN_WIDTH), random.randrange(config.SCREEN_HEIGHT)))
+    return [enemy_bullets, player_bullets], None
+
+
+def build_explosions(count):
+    """Many simultaneous explosions, a finished one replaced by a new one every frame"""
+    from core.sprite_group import FastGroup
+    from entities.explosion import Explosion
+    from core import config
+
+    group = FastGroup()
+
+    def refill():
+        while len(group) < count:
+            group.add(Explosion(random.randrange(config.SCREEN_WIDTH), random.randrange(config.SCREEN_HEIGHT)))
+
+    refill()
+    return [group], refill
+
+
+def build_explosion_field(count):
+    """The same explosions through the array-backed explosion field"""
+    from entities.explosion_field import ExplosionField
+    from core import config
+
+    # No cap and no merging, so the field holds as many effects as the sprite scene
+    field = ExplosionField(max_effects=count, merge_distance=0)
+
+    def refill():
+        while len(field) < count:
+            field.add(random.randrange(config.SCREEN_WIDTH), random.randrange(config.SCREEN_HEIGHT))
+
+    refill()
+    return [field], refill
+
+
+class WorldScene:
+    """
+    An ECS World holding the entities of a sprite scene, updated by its
+    systems and drawn with one batched blit like an effect field.
+    """
+
+    def __init__(self, groups):
+        """
+        Spawn every sprite of a scene into a new World as its component bundle.
+
+        Args:
+            groups: Sprite groups whose sprites have to_bundle()
+        """
+        from core.ecs import World
+        from core.systems import add_default_systems
+        from core import config
+
+        self.world = World()
+        self.dt = 1000 / config.FPS
+        add_default_systems(self.world)
+        for group in groups:
+            self.world.spawn_batch(sprite.to_bundle() for sprite in group)
+
+    def __len__(self):
+        return len(self.world)
+
+    def update(self):
+        self.world.run(self.dt)
+
+    def blits(self):
+        from core.systems import world_blits
+        return world_blits(self.world)
+
+
+def build_world_formation(count):
+    """The formation scene run as ECS entities"""
+    groups, _ = build_formation(count)
+    return [WorldScene(groups)], None
+
+
+def build_world_bullet_storm(count):
+    """The bullet storm scene run as ECS entities"""
+    groups, _ = build_bullet_storm(count)
+    return [WorldScene(groups)], None
+
+
+def build_world_explosions(count):
+    """The explosions scene run as ECS entities, topped up the same way"""
+    from entities.explosion import Explosion
+    from core import config
+
+    groups, _ = build_explosions(count)
+    scene = WorldScene(groups)
+
+    def refill():
+        while len(scene) < count:
+            explosion = Explosion(random.randrange(config.SCREEN_WIDTH), random.randrange(config.SCREEN_HEIGHT))
+            scene.world.spawn(explosion.to_bundle())
+
+    return [scene], refill
+
+
+SCENES = {
+    "formation": (build_formation, 300),
+    "bullet_storm": (build_bullet_storm, 1000),
+    "explosions": (build_explosions, 200),
+    "explosion_field": (build_explosion_field, 200),
+    "world_formation": (build_world_formation, 300),
+    "world_bullet_storm": (build_world_bullet_storm, 1000),
+    "world_explosions": (build_world_explosions, 200),
+}
+
+
+def run_scene(backend, build, count, frames, background):
+    """
+    Run one scene and measure it.
+
+    Args:
+        backend: RenderBackend to draw with
+        build: Scene builder returning a list of sprite groups (or effect fields) and a
+            function topping finished effects back up each frame (None if nothing finishes)
+        count: Entity count passed to the builder
+        frames: Number of frames to run
+        background: Background surface
+
+    Returns:
+        Tuple of (update_ms, draw_ms) averaged per frame
+    """
+    random.seed(1234)
+    groups, refill = build(count)
+    update_time = 0.0
+    draw_time = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        for group in groups:
+            group.update()
+        if refill is not None:
+            refill()
+        middle = time.perf_counter()
+        backend.blit(background, (0, 0))
+        for group in groups:
+            if hasattr(group, "blits"):
+                backend.draw_blits(group.blits())
+            else:
+                backend.draw_group(group)
+        backend.present()
+        end = time.perf_counter()
+        update_time += middle - start
+        draw_time += end - middle
+    return update_time * 1000 / frames, draw_time * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Galaxy Shooter rendering benchmark scenes")
+    parser.add_argument("--backend", action="append", choices=["surface", "sdl2"],
+                        help="Backend to benchmark (repeatable, default: all)")
+    parser.add_argument("--scene", action="append", choices=sorted(SCENES),
+                        help="Scene to run (repeatable, default: all)")
+    parser.add_argument("--frames", type=int, default=300, help="Frames per scene")
+    parser.add_argument("--scale", type=float, default=1.0, help="Entity count multiplier")
+    parser.add_argument("--headless", action="store_true", help="Use the SDL dummy video driver")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    import pygame
+    from core.assets import load_image, clear_image_cache
+    from core.render_backend import create_backend
+
+    pygame.init()
+    print(f"{'backend':<8} {'scene':<18} {'count':>6} {'update ms':>10} {'draw ms':>9}")
+    for backend_name in args.backend or ["surface", "sdl2"]:
+        backend = create_backend(backend_name, caption="Galaxy Shooter benchmark")
+        clear_image_cache()
+        background = load_image('assets/images/background2.png')
+        for scene_name in args.scene or sorted(SCENES):
+            build, count = SCENES[scene_name]
+            count = max(1, int(count * args.scale))
+            update_ms, draw_ms = run_scene(backend, build, count, args.frames, background)
+            print(f"{backend_name:<8} {scene_name:<18} {count:>6} {update_ms:>10.3f} {draw_ms:>9.3f}")
+        pygame.display.quit()
+        pygame.display.init()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
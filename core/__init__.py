@@ -0,0 +1,4 @@
+from .ecs import Component, Archetype, World
+from .sprite_group import FastGroup
+
+__all__ = ['Component', 'Archetype', 'World', 'FastGroup']
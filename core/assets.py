@@ -0,0 +1,37 @@
+"""
+Image cache for Galaxy Shooter
+
+Every image is decoded from disk once and shared by all sprites that use
+it. Sharing surfaces also lets batched drawing group blits by source image.
+"""
+
+import pygame
+
+_image_cache = {}
+
+
+def load_image(path):
+    """
+    Load an image, returning the cached surface on repeated calls.
+
+    Images are converted to the display format when a display exists,
+    which makes every later blit of them cheaper.
+
+    Args:
+        path: Path of the image file
+
+    Returns:
+        The shared pygame Surface for the image
+    """
+    image = _image_cache.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        _image_cache[path] = image
+    return image
+
+
+def clear_image_cache():
+    """Drop all cached images"""
+    _image_cache.clear()
@@ -0,0 +1,140 @@
+"""
+Component bundles for Galaxy Shooter entities.
+
+Each function returns the components (and initial values) that together
+describe one kind of entity. The sprite classes in entities/ build them
+from their own state with to_bundle(); pass the result to World.spawn().
+"""
+
+from .components import (
+    Position, Size, Velocity, Renderable, Animation, PlayerControl, ZigzagPath,
+    Swing, CullY, Health, PlayerTag, EnemyTag, BossTag, PlayerBulletTag,
+    EnemyBulletTag, ExplosionTag
+)
+
+
+def _placed(image, rect):
+    """Common spatial components for an image drawn at a rect"""
+    return {
+        Position: (rect.x, rect.y),
+        Size: (rect.width, rect.height),
+        Renderable: image,
+    }
+
+
+def player_bundle(image, rect, speed, screen_width):
+    """
+    Components of the player ship (see entities.Player).
+
+    Args:
+        image: Ship surface
+        rect: Ship rect
+        speed: Horizontal speed in pixels per tick
+        screen_width: Arena width the ship is kept inside
+    """
+    bundle = _placed(image, rect)
+    bundle.update({
+        PlayerTag: None,
+        PlayerControl: (speed, screen_width - rect.width),
+    })
+    return bundle
+
+
+def enemy_bundle(image, rect, path, path_y, age):
+    """
+    Components of a formation enemy (see entities.Enemy).
+
+    Args:
+        image: Enemy surface
+        rect: Enemy rect
+        path: ZigzagPath the enemy follows (see entities.zigzag)
+        path_y: Top edge the path started from
+        age: Ticks since the path started
+    """
+    bundle = _placed(image, rect)
+    bundle.update({
+        EnemyTag: None,
+        # Segment end 0 makes the first tick look its segment up
+        ZigzagPath: (path, path_y, age, 0, 0),
+    })
+    return bundle
+
+
+def boss_bundle(image, rect, move_counter, move_direction, speed, screen_width, hp, max_hp):
+    """
+    Components of a boss (see entities.BaseBoss).
+
+    Args:
+        image: Boss surface
+        rect: Boss rect
+        move_counter: Ticks moved in the current direction
+        move_direction: 1 right, -1 left
+        speed: Horizontal speed in pixels per tick
+        screen_width: Arena width the boss bounces inside
+        hp: Current health
+        max_hp: Maximum health
+    """
+    bundle = _placed(image, rect)
+    bundle.update({
+        BossTag: None,
+        Swing: (move_counter, move_direction, speed, 50, screen_width - rect.width),
+        Health: (hp, max_hp),
+    })
+    return bundle
+
+
+def bullet_bundle(image, rect, speed):
+    """
+    Components of a player bullet (see entities.Bullets).
+
+    Args:
+        image: Bullet surface
+        rect: Bullet rect
+        speed: Upward speed in pixels per tick
+    """
+    bundle = _placed(image, rect)
+    bundle.update({
+        PlayerBulletTag: None,
+        Velocity: (0, -speed),
+        # Removed once its bottom edge is above the arena
+        CullY: (-rect.height, float('inf')),
+    })
+    return bundle
+
+
+def enemy_bullet_bundle(image, rect, speed, screen_height):
+    """
+    Components of an enemy bullet (see entities.EnemyBullet).
+
+    Args:
+        image: Bullet surface
+        rect: Bullet rect
+        speed: Downward speed in pixels per tick
+        screen_height: Arena height below which the bullet is removed
+    """
+    bundle = _placed(image, rect)
+    bundle.update({
+        EnemyBulletTag: None,
+        Velocity: (0, speed),
+        CullY: (float('-inf'), screen_height),
+    })
+    return bundle
+
+
+def explosion_bundle(frames, index, counter, speed, rect):
+    """
+    Components of an explosion animation (see entities.Explosion).
+
+    Args:
+        frames: Sequence of frame surfaces
+        index: Current frame index
+        counter: Ticks shown on the current frame
+        speed: Ticks per frame
+        rect: Explosion rect
+    """
+    bundle = _placed(frames[index], rect)
+    bundle.update({
+        ExplosionTag: None,
+        Animation: (frames, index, counter, speed),
+    })
+    return bundle
@@ -0,0 +1,33 @@
+"""
+Component types used by Galaxy Shooter entities.
+
+Positions are top-left corners in logical arena coordinates (see
+core.config), stored as integers the way pygame.Rect stores them, so the
+systems round exactly like the sprites they mirror.
+"""
+
+from .ecs import Component
+
+# Spatial state
+Position = Component("Position", x='i', y='i')
+Size = Component("Size", width='i', height='i')
+Velocity = Component("Velocity", dx='i', dy='i')
+
+# Rendering
+Renderable = Component("Renderable", image=None)
+Animation = Component("Animation", frames=None, index='i', counter='i', speed='i')
+
+# Behaviour
+PlayerControl = Component("PlayerControl", speed='i', max_x='i')
+ZigzagPath = Component("ZigzagPath", path=None, path_y='i', age='q', step='i', segment_end='q')
+Swing = Component("Swing", counter='i', direction='i', speed='i', limit='i', max_x='i')
+CullY = Component("CullY", min_y='d', max_y='d')
+Health = Component("Health", hp='i', max_hp='i')
+
+# Tags
+PlayerTag = Component("PlayerTag")
+EnemyTag = Component("EnemyTag")
+BossTag = Component("BossTag")
+PlayerBulletTag = Component("PlayerBulletTag")
+EnemyBulletTag = Component("EnemyBulletTag")
+ExplosionTag = Component("ExplosionTag")
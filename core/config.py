@@ -0,0 +1,145 @@
+"""
+Configuration for Galaxy Shooter
+
+This module is the single place the rest of the game reads its
+arena size, frame rate and presentation settings from.
+
+Presentation settings can be tuned per deployment through environment
+variables, without editing code:
+- GALAXY_RENDER_SCALE: Internal render scale in (0, 1]. Values below 1.0
+  draw the game world into a smaller target that is upscaled into the
+  window, trading resolution for frame rate on weak hosts. The window size
+  does not change.
+- GALAXY_WINDOW_SCALE: Integer upscale factor (1, 2, 3, ...) for large
+  displays; it alone sets the window size.
+- GALAXY_RENDER_BACKEND: "surface" (software blits, default) or "sdl2"
+  (pygame._sdl2 Renderer with cached textures).
+- GALAXY_SAVE_PATH: Where progress is saved (default ~/.galaxy_shooter/save.json).
+- GALAXY_RUNS_PATH: SQLite database of run results
+  (default ~/.galaxy_shooter/runs.sqlite3).
+- GALAXY_PREVIEW_DIR: Where level select thumbnails are cached
+  (default ~/.galaxy_shooter/previews).
+- GALAXY_BUILD: Build identifier stored with every run (default "dev").
+- GALAXY_TELEMETRY: "on" (default) or "off" to record gameplay events.
+- GALAXY_TELEMETRY_DIR: Where telemetry session files are written
+  (default ~/.galaxy_shooter/telemetry).
+- GALAXY_SOUND: "on" (default) or "off" for sound effects.
+- GALAXY_VOLUME: Sound effect volume in (0, 1] (default 0.6), until a volume
+  is chosen in the main menu and kept in the save.
+- GALAXY_SIM_THREAD: "off" (default) or "on" to run the game logic on a
+  worker thread while the main thread draws (see core.sim_thread).
+- GALAXY_INPUT_LATCH: "frame" (default) reads input at the start of each
+  tick; "late" simulates the world first and reads input just before the
+  frame is drawn (see core.latency).
+- GALAXY_LATENCY: "off" (default) or "on" to print input-to-present latency
+  every 5 seconds and on exit (not measured with GALAXY_SIM_THREAD=on).
+- GALAXY_QUALITY: "auto" (default) lowers effects, HUD refresh and the
+  world's render scale (never the window size) while frames exceed the
+  budget (see managers.quality_governor);
+  "full" keeps full quality.
+- GALAXY_DIAGNOSTICS: "off" (default) or "on" to print memory reports at
+  every level start, restart and transition (see core.diagnostics).
+"""
+
+import os
+
+# Logical arena size. All gameplay coordinates are expressed in this space.
+SCREEN_WIDTH = 600
+SCREEN_HEIGHT = 800
+
+FPS = 50
+
+
+def _read_float(name, default, minimum, maximum):
+    """
+    Read a float setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+        minimum: Smallest accepted value (exclusive)
+        maximum: Largest accepted value (inclusive)
+
+    Returns:
+        The parsed value, or default
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        print(f"Ignoring {name}={raw!r}: not a number")
+        return default
+    if not minimum < value <= maximum:
+        print(f"Ignoring {name}={raw!r}: expected a value in ({minimum}, {maximum}]")
+        return default
+    return value
+
+
+def _read_int(name, default, minimum):
+    """
+    Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+        minimum: Smallest accepted value (inclusive)
+
+    Returns:
+        The parsed value, or default
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        print(f"Ignoring {name}={raw!r}: not an integer")
+        return default
+    if value < minimum:
+        print(f"Ignoring {name}={raw!r}: expected a value >= {minimum}")
+        return default
+    return value
+
+
+def _read_choice(name, default, choices):
+    """
+    Read a setting from the environment that must be one of a fixed set.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+        choices: Accepted values
+
+    Returns:
+        The chosen value, or default
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    value = raw.strip().lower()
+    if value not in choices:
+        print(f"Ignoring {name}={raw!r}: expected one of {', '.join(choices)}")
+        return default
+    return value
+
+
+RENDER_BACKENDS = ("surface", "sdl2")
+
+RENDER_SCALE = _read_float("GALAXY_RENDER_SCALE", 1.0, 0.0, 1.0)
+WINDOW_SCALE = _read_int("GALAXY_WINDOW_SCALE", 1, 1)
+RENDER_BACKEND = _read_choice("GALAXY_RENDER_BACKEND", "surface", RENDER_BACKENDS)
+SAVE_PATH = os.environ.get("GALAXY_SAVE_PATH") or os.path.join(os.path.expanduser("~"), ".galaxy_shooter", "save.json")
+RUNS_PATH = os.environ.get("GALAXY_RUNS_PATH") or os.path.join(os.path.expanduser("~"), ".galaxy_shooter", "runs.sqlite3")
+PREVIEW_DIR = os.environ.get("GALAXY_PREVIEW_DIR") or os.path.join(os.path.expanduser("~"), ".galaxy_shooter", "previews")
+BUILD = os.environ.get("GALAXY_BUILD") or "dev"
+TELEMETRY_ENABLED = _read_choice("GALAXY_TELEMETRY", "on", ("on", "off")) == "on"
+TELEMETRY_DIR = os.environ.get("GALAXY_TELEMETRY_DIR") or os.path.join(os.path.expanduser("~"), ".galaxy_shooter", "telemetry")
+SOUND_ENABLED = _read_choice("GALAXY_SOUND", "on", ("on", "off")) == "on"
+SOUND_VOLUME = _read_float("GALAXY_VOLUME", 0.6, 0.0, 1.0)
+SIM_THREAD = _read_choice("GALAXY_SIM_THREAD", "off", ("on", "off")) == "on"
+DIAGNOSTICS = _read_choice("GALAXY_DIAGNOSTICS", "off", ("on", "off")) == "on"
+INPUT_LATCH = _read_choice("GALAXY_INPUT_LATCH", "frame", ("frame", "late"))
+LATENCY_REPORT = _read_choice("GALAXY_LATENCY", "off", ("on", "off")) == "on"
+QUALITY = _read_choice("GALAXY_QUALITY", "auto", ("auto", "full"))
@@ -0,0 +1,158 @@
+"""
+Memory diagnostics for Galaxy Shooter
+
+With GALAXY_DIAGNOSTICS=on the game reports memory use every time a level
+is started, restarted or left for the next one. A long session that
+keeps growing shows up as checkpoints that never level off:
+- Python allocations are traced with tracemalloc; each checkpoint reports
+  the traced total, the change since the previous checkpoint and the
+  source lines whose allocations grew the most
+- Live objects are counted per class for the game's own classes (sprites,
+  levels, bosses, ...) and for pygame Surfaces, so a growth can be tied to
+  what is being kept alive, not only to where it was allocated
+
+Checkpoints run a full garbage collection and walk the heap, which takes
+tens of milliseconds: they are meant for level boundaries, not for
+every tick. tools.leak_check drives the same tracker through scripted
+restarts and fails when memory keeps growing.
+"""
+
+import collections
+import gc
+import tracemalloc
+import pygame
+
+# Objects of classes defined in these packages are counted per class
+COUNTED_PACKAGES = ("core", "entities", "levels", "managers", "menus", "net")
+
+MemoryReport = collections.namedtuple(
+    'MemoryReport',
+    ['label', 'traced_bytes', 'growth_bytes', 'counts', 'count_growth', 'top_sites']
+)
+MemoryReport.__doc__ = """
+Memory use at one checkpoint.
+
+    label: Name of the checkpoint ("level 2 start", ...)
+    traced_bytes: Bytes currently allocated by Python code (tracemalloc)
+    growth_bytes: Change of traced_bytes since the previous checkpoint
+    counts: Dict of class name -> live objects
+    count_growth: Dict of class name -> change since the previous checkpoint (non-zero only)
+    top_sites: List of (file:line, growth in bytes) with the largest growth
+"""
+
+
+def count_objects(packages=COUNTED_PACKAGES):
+    """
+    Count live objects per class.
+
+    Instances of classes from the given packages are counted, as are
+    pygame Surfaces. Surfaces are not tracked by the garbage collector, so
+    they are found through the objects that reference them.
+
+    Args:
+        packages: Top-level package names whose classes are counted
+
+    Returns:
+        Dict of class name -> live objects
+    """
+    counts = collections.Counter()
+    surfaces = set()
+    surface_type = pygame.Surface
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if cls.__module__.split(".", 1)[0] in packages and cls.__module__ != __name__:
+            counts[cls.__qualname__] += 1
+        for referent in gc.get_referents(obj):
+            if isinstance(referent, surface_type):
+                surfaces.add(id(referent))
+    counts["Surface"] = len(surfaces)
+    return dict(counts)
+
+
+class MemoryTracker:
+    """
+    Reports memory growth between named checkpoints.
+    """
+
+    def __init__(self, frames=8, top=5):
+        """
+        Start tracing allocations (if nothing else already does).
+
+        Args:
+            frames: Stack frames stored per allocation
+            top: Allocation sites listed per report
+        """
+        self.top = top
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(frames)
+        self._snapshot = None
+        self._counts = {}
+        self.last_report = None
+
+    def checkpoint(self, label):
+        """
+        Measure memory now and compare it with the previous checkpoint.
+
+        Args:
+            label: Name of the checkpoint
+
+        Returns:
+            MemoryReport
+        """
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, __file__),
+        ))
+        traced = sum(stat.size for stat in snapshot.statistics('filename'))
+        counts = count_objects()
+
+        if self._snapshot is None:
+            growth = 0
+            top_sites = []
+        else:
+            growth = traced - self.last_report.traced_bytes
+            top_sites = [
+                (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff)
+                for stat in snapshot.compare_to(self._snapshot, 'lineno')[:self.top]
+                if stat.size_diff > 0
+            ]
+        count_growth = {}
+        for name in counts.keys() | self._counts.keys():
+            change = counts.get(name, 0) - self._counts.get(name, 0)
+            if change:
+                count_growth[name] = change
+
+        self._snapshot = snapshot
+        self._counts = counts
+        report = MemoryReport(label, traced, growth, counts, count_growth, top_sites)
+        self.last_report = report
+        return report
+
+    def stop(self):
+        """Stop tracing if this tracker started it"""
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._snapshot = None
+
+
+def format_report(report):
+    """
+    Render a MemoryReport as a few lines of text.
+
+    Args:
+        report: MemoryReport
+
+    Returns:
+        Report text
+    """
+    lines = [f"[memory] {report.label}: {report.traced_bytes / 1024:.1f} KiB traced "
+             f"({report.growth_bytes / 1024:+.1f} KiB)"]
+    if report.count_growth:
+        changes = ", ".join(f"{name} {change:+d}" for name, change in sorted(report.count_growth.items()))
+        lines.append(f"  objects: {changes}")
+    for site, size in report.top_sites:
+        lines.append(f"  {size / 1024:+.1f} KiB  {site}")
+    return "\n".join(lines)
@@ -0,0 +1,89 @@
+"""
+Display management for Galaxy Shooter
+
+The window has a fixed size: the logical arena size (see core.config)
+times the integer window scale. It is created once and never resized.
+
+The game world is drawn into a render target of the logical size times
+the render scale. Below 1.0 the target has fewer pixels to fill, and it
+is upscaled once per frame to the logical size, where the HUD and menus
+draw at full resolution. A window scale above 1 adds one more upscale
+onto the window when the frame is presented.
+"""
+
+import pygame
+from core import config
+
+
+class Display:
+    """
+    Owns the game window, the full-resolution screen and the world render target.
+
+    Without scaling, the world target and the screen are the window surface
+    itself and presenting costs nothing beyond the flip.
+    """
+
+    def __init__(self, caption="Galaxy Shooter", render_scale=None, window_scale=None):
+        """
+        Create the game window.
+
+        Args:
+            caption: Window caption
+            render_scale: Internal render scale in (0, 1] (config default if None)
+            window_scale: Integer upscale factor (config default if None)
+        """
+        self.logical_size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.window_scale = config.WINDOW_SCALE if window_scale is None else window_scale
+        self.window_size = (self.logical_size[0] * self.window_scale,
+                            self.logical_size[1] * self.window_scale)
+        self.window = pygame.display.set_mode(self.window_size)
+        pygame.display.set_caption(caption)
+
+        # Full-resolution frame: HUD and menus draw here
+        if self.window_scale == 1:
+            self.screen = self.window
+        else:
+            self.screen = pygame.Surface(self.logical_size).convert()
+        self.surface = self.screen
+        self.set_render_scale(config.RENDER_SCALE if render_scale is None else render_scale)
+
+    def set_render_scale(self, render_scale):
+        """
+        Change the resolution the world is drawn at. The window stays as it is.
+
+        Args:
+            render_scale: Internal render scale in (0, 1]
+        """
+        self.render_scale = render_scale
+        self.target_size = (
+            max(1, round(self.logical_size[0] * render_scale)),
+            max(1, round(self.logical_size[1] * render_scale))
+        )
+        if self.target_size == self.logical_size:
+            self.surface = self.screen
+        else:
+            self.surface = pygame.Surface(self.target_size).convert()
+
+    def is_scaled(self):
+        """Return True if the world is drawn below the logical resolution"""
+        return self.surface is not self.screen
+
+    def resolve(self):
+        """
+        Upscale this frame's world onto the screen (nothing to do at render scale 1).
+
+        Returns:
+            The full-resolution screen surface
+        """
+        if self.is_scaled():
+            pygame.transform.scale(self.surface, self.logical_size, self.screen)
+        return self.screen
+
+    def present(self):
+        """
+        Show the screen on the window and flip it. resolve() must have run for this frame.
+        """
+        if self.screen is not self.window:
+            # Nearest-neighbour scaling: exact for integer upscales
+            pygame.transform.scale(self.screen, self.window_size, self.window)
+        pygame.display.update()
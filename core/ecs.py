@@ -0,0 +1,398 @@
+"""
+Archetype-based Entity-Component-System for Galaxy Shooter
+
+Entities are plain integer ids. Each distinct set of component types forms
+an archetype, and an archetype stores its entities' components column by
+column (one array per component field). Systems are plain functions that
+run over queries and touch only the columns they need, so the cost per
+entity stays small and constant as entity counts grow.
+
+Typical use:
+
+    world = World()
+    eid = world.spawn({Position: (10, 20), Velocity: (0, -7)})
+    for arch in world.query(Position, Velocity):
+        xs, ys = arch.column(Position, 'x'), arch.column(Position, 'y')
+        ...
+
+Structural changes made while a query is being iterated (despawn, adding
+or removing components) are deferred until World.flush().
+"""
+
+from array import array
+
+
+class Component:
+    """
+    Declares a component type and the fields it stores.
+
+    Each field is given a typecode from the array module ('d' for floats,
+    'i' for integers, ...) to be stored in a packed array, or None to be
+    stored in a plain list (for surfaces, rects and other objects).
+    A component with no fields acts as a tag.
+    """
+
+    _next_id = 0
+
+    def __init__(self, name, **fields):
+        """
+        Declare a component.
+
+        Args:
+            name: Readable component name
+            **fields: Mapping of field name to array typecode (or None)
+        """
+        self.name = name
+        self.fields = tuple(fields)
+        self.typecodes = tuple(fields.values())
+        self.id = Component._next_id
+        Component._next_id += 1
+
+    def new_columns(self):
+        """Create one empty column per field"""
+        return [array(code) if code else [] for code in self.typecodes]
+
+    def normalize(self, value):
+        """
+        Turn a component value into a tuple of field values.
+
+        Args:
+            value: Tuple/list in field order, dict keyed by field name,
+                   a single value for one-field components, or None for tags
+
+        Returns:
+            Tuple of field values
+        """
+        if not self.fields:
+            return ()
+        if isinstance(value, dict):
+            return tuple(value[field] for field in self.fields)
+        if len(self.fields) == 1 and not isinstance(value, (tuple, list)):
+            return (value,)
+        return tuple(value)
+
+    def __repr__(self):
+        return f"Component({self.name})"
+
+
+class Archetype:
+    """
+    Storage for all entities that share exactly the same component types.
+    """
+
+    def __init__(self, components):
+        """
+        Create an empty archetype.
+
+        Args:
+            components: Iterable of Component types
+        """
+        self.components = frozenset(components)
+        self.entities = array('q')
+        self.columns = {}
+        for component in sorted(self.components, key=lambda c: c.id):
+            self.columns[component] = component.new_columns()
+
+    def __len__(self):
+        return len(self.entities)
+
+    def has(self, *components):
+        """Return True if this archetype stores all given components"""
+        return self.components.issuperset(components)
+
+    def column(self, component, field):
+        """
+        Get the column holding one field of a component.
+
+        Args:
+            component: Component type
+            field: Field name
+
+        Returns:
+            The array (or list) for that field, indexed by row
+        """
+        return self.columns[component][component.fields.index(field)]
+
+    def append(self, entity, values):
+        """
+        Append an entity row.
+
+        Args:
+            entity: Entity id
+            values: Dict mapping each Component to its normalized tuple
+
+        Returns:
+            Row index of the new entity
+        """
+        row = len(self.entities)
+        self.entities.append(entity)
+        for component, columns in self.columns.items():
+            for column, value in zip(columns, values[component]):
+                column.append(value)
+        return row
+
+    def read(self, row):
+        """Return a dict of Component -> tuple for one row"""
+        return {
+            component: tuple(column[row] for column in columns)
+            for component, columns in self.columns.items()
+        }
+
+    def swap_remove(self, row):
+        """
+        Remove a row by moving the last row into its place.
+
+        Args:
+            row: Row index to remove
+
+        Returns:
+            Entity id that moved into the row, or None if the last row was removed
+        """
+        last = len(self.entities) - 1
+        moved = None
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            for columns in self.columns.values():
+                for column in columns:
+                    column[row] = column[last]
+        self.entities.pop()
+        for columns in self.columns.values():
+            for column in columns:
+                column.pop()
+        return moved
+
+
+class World:
+    """
+    Owns every entity, archetype and system.
+    """
+
+    def __init__(self):
+        self.archetypes = {}
+        self.locations = {}
+        self.systems = []
+        self._next_entity = 0
+        self._query_cache = {}
+        self._pending = []
+        self._iterating = 0
+
+    def __len__(self):
+        return len(self.locations)
+
+    def _archetype_for(self, components):
+        """Get or create the archetype for a set of components"""
+        key = frozenset(components)
+        archetype = self.archetypes.get(key)
+        if archetype is None:
+            archetype = Archetype(key)
+            self.archetypes[key] = archetype
+            self._query_cache.clear()
+        return archetype
+
+    def spawn(self, bundle):
+        """
+        Create an entity from a component bundle.
+
+        Args:
+            bundle: Dict mapping Component types to their values
+
+        Returns:
+            The new entity id
+        """
+        entity = self._next_entity
+        self._next_entity += 1
+        values = {component: component.normalize(value) for component, value in bundle.items()}
+        if self._iterating:
+            self._pending.append(("spawn", entity, values))
+        else:
+            self._insert(entity, values)
+        return entity
+
+    def spawn_batch(self, bundles):
+        """
+        Create many entities at once.
+
+        Args:
+            bundles: Iterable of bundles
+
+        Returns:
+            List of new entity ids
+        """
+        return [self.spawn(bundle) for bundle in bundles]
+
+    def _insert(self, entity, values):
+        archetype = self._archetype_for(values)
+        row = archetype.append(entity, values)
+        self.locations[entity] = (archetype, row)
+
+    def is_alive(self, entity):
+        """Return True if the entity exists"""
+        return entity in self.locations
+
+    def despawn(self, entity):
+        """
+        Destroy an entity (deferred while a query is being iterated).
+
+        Args:
+            entity: Entity id
+        """
+        if self._iterating:
+            self._pending.append(("despawn", entity, None))
+        else:
+            self._remove(entity)
+
+    def _remove(self, entity):
+        location = self.locations.pop(entity, None)
+        if location is None:
+            return None
+        archetype, row = location
+        values = archetype.read(row)
+        moved = archetype.swap_remove(row)
+        if moved is not None:
+            self.locations[moved] = (archetype, row)
+        return values
+
+    def add_component(self, entity, component, value=None):
+        """
+        Add (or replace) a component on an entity, moving it to a new archetype.
+
+        Args:
+            entity: Entity id
+            component: Component type
+            value: Component value
+        """
+        self._restructure(entity, add={component: component.normalize(value)})
+
+    def remove_component(self, entity, component):
+        """
+        Remove a component from an entity.
+
+        Args:
+            entity: Entity id
+            component: Component type
+        """
+        self._restructure(entity, remove=component)
+
+    def _restructure(self, entity, add=None, remove=None):
+        if self._iterating:
+            self._pending.append(("restructure", entity, (add, remove)))
+            return
+        values = self._remove(entity)
+        if values is None:
+            return
+        if add:
+            values.update(add)
+        if remove is not None:
+            values.pop(remove, None)
+        self._insert(entity, values)
+
+    def get(self, entity, component):
+        """
+        Read one component of an entity.
+
+        Args:
+            entity: Entity id
+            component: Component type
+
+        Returns:
+            Dict of field name to value, or None if the entity lacks it
+        """
+        archetype, row = self.locations[entity]
+        columns = archetype.columns.get(component)
+        if columns is None:
+            return None
+        return {field: column[row] for field, column in zip(component.fields, columns)}
+
+    def set(self, entity, component, field, value):
+        """
+        Write one field of an entity's component.
+
+        Args:
+            entity: Entity id
+            component: Component type
+            field: Field name
+            value: New value
+        """
+        archetype, row = self.locations[entity]
+        archetype.column(component, field)[row] = value
+
+    def has(self, entity, component):
+        """Return True if the entity has the component"""
+        location = self.locations.get(entity)
+        return location is not None and component in location[0].components
+
+    def query(self, *components, exclude=()):
+        """
+        Find the archetypes storing all of the given components.
+
+        Structural changes are deferred for as long as the returned
+        iterator is being consumed.
+
+        Args:
+            *components: Required component types
+            exclude: Component types that must not be present
+
+        Yields:
+            Non-empty Archetype objects
+        """
+        key = (frozenset(components), frozenset(exclude))
+        matches = self._query_cache.get(key)
+        if matches is None:
+            matches = [
+                archetype for archetype in self.archetypes.values()
+                if archetype.components.issuperset(key[0]) and not archetype.components & key[1]
+            ]
+            self._query_cache[key] = matches
+        self._iterating += 1
+        try:
+            for archetype in matches:
+                if archetype.entities:
+                    yield archetype
+        finally:
+            self._iterating -= 1
+            if not self._iterating:
+                self.flush()
+
+    def count(self, *components):
+        """Return the number of entities having all the given components"""
+        return sum(len(archetype) for archetype in self.query(*components))
+
+    def flush(self):
+        """Apply structural changes that were deferred during iteration"""
+        while self._pending and not self._iterating:
+            pending, self._pending = self._pending, []
+            for action, entity, payload in pending:
+                if action == "spawn":
+                    self._insert(entity, payload)
+                elif action == "despawn":
+                    self._remove(entity)
+                else:
+                    self._restructure(entity, *payload)
+
+    def add_system(self, system):
+        """
+        Register a system.
+
+        Args:
+            system: Callable taking (world, dt)
+        """
+        self.systems.append(system)
+
+    def run(self, dt=0):
+        """
+        Run every registered system once, in registration order.
+
+        Args:
+            dt: Delta time in milliseconds
+        """
+        for system in self.systems:
+            system(self, dt)
+        self.flush()
+
+    def clear(self):
+        """Destroy every entity (systems are kept)"""
+        self.archetypes.clear()
+        self.locations.clear()
+        self._query_cache.clear()
+        self._pending.clear()
@@ -0,0 +1,185 @@
+"""
+Input latency for Galaxy Shooter
+
+Measures input-to-present latency in software and paces the main loop
+around input:
+- InputLatch replaces Clock.tick(): while it waits for the next tick it
+  keeps reading the event queue, so every input event is stamped with
+  the time it arrived (pygame events carry no timestamp of their own).
+  An event read for the first time is stamped with the previous read:
+  while the loop waits that is at most POLL_INTERVAL early, and input
+  that arrived during a busy tick counts from the start of that tick, so
+  the samples never understate the latency
+- When a frame is presented, each input event it consumed yields one
+  sample: present time minus arrival time. LatencyStats keeps the recent
+  samples and summarizes them
+- In late-latch mode (GALAXY_INPUT_LATCH=late) the world is simulated
+  first and the latch then waits until just before the frame is due,
+  leaving only the time needed to read input, move the player, draw and
+  present. That work time is measured every frame, so input is read as
+  late as the machine allows
+
+The pygame dummy video driver, other threads and the compositor all add
+latency after present(); these numbers cover only what the game itself
+controls.
+"""
+
+import collections
+import time
+import pygame
+
+# Events that count as player input for latency samples
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+# Longest single sleep while waiting, so new input is stamped promptly (seconds)
+POLL_INTERVAL = 0.001
+
+
+def _now_ms():
+    return time.perf_counter() * 1000
+
+
+class LatencyStats:
+    """
+    Recent input-to-present latency samples.
+    """
+
+    def __init__(self, size=500):
+        """
+        Args:
+            size: Number of most recent samples kept
+        """
+        self.samples = collections.deque(maxlen=size)
+        self.total = 0
+
+    def add(self, latency_ms):
+        """Record one sample in milliseconds"""
+        self.samples.append(latency_ms)
+        self.total += 1
+
+    def summary(self):
+        """
+        Returns:
+            Dict with count, mean, p50, p95 and max of the kept samples
+            (in milliseconds), or None if there are none
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        count = len(ordered)
+        return {
+            'count': count,
+            'mean': sum(ordered) / count,
+            'p50': ordered[count // 2],
+            'p95': ordered[min(count - 1, int(count * 0.95))],
+            'max': ordered[-1],
+        }
+
+    def format(self):
+        """Return the summary as one line of text"""
+        summary = self.summary()
+        if summary is None:
+            return "[latency] no input yet"
+        return (f"[latency] input to present over {summary['count']} inputs: "
+                f"mean {summary['mean']:.1f} ms, p50 {summary['p50']:.1f} ms, "
+                f"p95 {summary['p95']:.1f} ms, max {summary['max']:.1f} ms")
+
+
+class InputLatch:
+    """
+    Paces the main loop while stamping input events as they arrive.
+    """
+
+    def __init__(self, fps, stats=None):
+        """
+        Args:
+            fps: Frames per second
+            stats: LatencyStats receiving one sample per presented input (optional)
+        """
+        self.interval = 1000 / fps
+        self.stats = stats if stats is not None else LatencyStats()
+        self.work_ms = 0.0  # Time from reading input to present, decaying maximum
+        self._pending = []
+        self._last_poll = None
+        self._taken = []
+        self._taken_at = None
+        self._last_tick = None
+        self._deadline = None
+
+    def poll(self):
+        """Move every queued event into the latch, stamped with the time of the previous read"""
+        events = pygame.event.get()
+        now = _now_ms()
+        if events:
+            # Arrived at some point since the previous read
+            stamp = now if self._last_poll is None else self._last_poll
+            self._pending.extend((stamp, event) for event in events)
+        self._last_poll = now
+
+    def _wait_until(self, deadline):
+        while True:
+            self.poll()
+            remaining = deadline - _now_ms()
+            if remaining <= 0:
+                return
+            time.sleep(min(POLL_INTERVAL, remaining / 1000))
+
+    def _advance_deadline(self):
+        now = _now_ms()
+        if self._deadline is None:
+            self._deadline = now
+        else:
+            self._deadline += self.interval
+            if self._deadline < now - self.interval:
+                self._deadline = now  # Fell behind: don't run a burst of frames
+        return self._deadline
+
+    def tick(self):
+        """
+        Wait for the next frame, like pygame.time.Clock.tick(fps).
+
+        Returns:
+            Milliseconds since the previous call
+        """
+        self._wait_until(self._advance_deadline())
+        return self.elapsed()
+
+    def elapsed(self):
+        """
+        Start a tick without waiting (late-latch mode simulates first).
+
+        Returns:
+            Milliseconds since the previous tick started
+        """
+        now = _now_ms()
+        dt = 0 if self._last_tick is None else now - self._last_tick
+        self._last_tick = now
+        return round(dt)
+
+    def wait_late(self):
+        """Wait until the measured input-to-present work just fits before the frame is due"""
+        self._wait_until(self._advance_deadline() + self.interval - self.work_ms - 1)
+
+    def take(self):
+        """
+        Hand over every event received so far.
+
+        Returns:
+            List of pygame events in arrival order
+        """
+        self.poll()
+        pending, self._pending = self._pending, []
+        self._taken.extend(stamp for stamp, event in pending if event.type in INPUT_EVENTS)
+        self._taken_at = _now_ms()
+        return [event for _, event in pending]
+
+    def presented(self):
+        """Record that the frame built from the taken input is on screen"""
+        now = _now_ms()
+        for stamp in self._taken:
+            self.stats.add(now - stamp)
+        self._taken.clear()
+        if self._taken_at is not None:
+            work = now - self._taken_at
+            self.work_ms = max(work, self.work_ms * 0.95 + work * 0.05)
+            self._taken_at = None
@@ -0,0 +1,394 @@
+"""
+Render backends for Galaxy Shooter
+
+The game draws through a small backend interface so the presentation path
+can be chosen at launch (GALAXY_RENDER_BACKEND, see core.config):
+
+- SurfaceBackend: software Surface.blit onto the world render target
+  (see core.display). This is the original drawing path.
+- SDL2Backend: pygame._sdl2.video Renderer. Every image is uploaded to a
+  Texture once and reused; the renderer scales the logical arena to the
+  window. Below render scale 1 the world is drawn into a smaller target
+  texture that is stretched over the arena. It works with the software
+  renderer and the dummy video driver.
+
+The window never changes size while the game runs: the render scale only
+changes the resolution the world is drawn at.
+
+Menus and HUD keep drawing with the regular Surface API onto
+ui_surface(). The SDL2 backend uploads that layer only when its content
+changes: a caller passing the same key as on the previous frame gets None
+back and the texture from the last upload is shown again.
+"""
+
+from abc import ABC, abstractmethod
+import weakref
+import pygame
+from core import config
+from core.display import Display
+
+
+class RenderBackend(ABC):
+    """Abstract Base Class for render backends"""
+
+    name = None
+
+    @abstractmethod
+    def blit(self, image, dest):
+        """
+        Draw an image.
+
+        Args:
+            image: Source surface
+            dest: Top-left position (x, y) or Rect in logical coordinates
+        """
+        pass
+
+    @abstractmethod
+    def blit_many(self, image, positions):
+        """
+        Draw one image at many positions.
+
+        Args:
+            image: Source surface
+            positions: Sequence of top-left (x, y) positions
+        """
+        pass
+
+    @abstractmethod
+    def draw_group(self, group):
+        """
+        Draw every sprite of a sprite group.
+
+        Args:
+            group: Sprite group whose sprites have image and rect
+        """
+        pass
+
+    def draw_blits(self, blits):
+        """
+        Draw a sequence of (image, position) pairs, e.g. from a render snapshot.
+
+        Args:
+            blits: Iterable of (image, (x, y)) in drawing order
+        """
+        for image, dest in blits:
+            self.blit(image, dest)
+
+    def blit_screen(self, image, dest):
+        """
+        Draw an image at full resolution above the world, e.g. a cached menu.
+
+        Args:
+            image: Source surface
+            dest: Top-left position (x, y) in logical coordinates
+        """
+        self.blit(image, dest)
+
+    @abstractmethod
+    def ui_surface(self, key=None):
+        """
+        Return the surface menus and HUD should draw on this frame.
+
+        Args:
+            key: Hashable value identifying everything the caller is about to draw,
+                or None if it cannot tell
+
+        Returns:
+            The UI surface, or None when the backend still shows the UI drawn
+            under the same key on the previous frame and nothing needs drawing
+        """
+        pass
+
+    @abstractmethod
+    def present(self):
+        """Show the finished frame"""
+        pass
+
+    @abstractmethod
+    def set_render_scale(self, render_scale):
+        """
+        Change the resolution the world is drawn at while the game runs (never the window size).
+
+        Args:
+            render_scale: Render scale in (0, 1]
+        """
+        pass
+
+
+class SurfaceBackend(RenderBackend):
+    """
+    Software backend blitting onto the world render target.
+
+    Below render scale 1 every image is drawn from a copy shrunk to the
+    target's resolution, made on first use and released together with
+    the image. The HUD and menus draw at full resolution once ui_surface()
+    has upscaled the world.
+    """
+
+    name = "surface"
+
+    def __init__(self, caption="Galaxy Shooter", render_scale=None, window_scale=None):
+        """
+        Create the window and render target.
+
+        Args:
+            caption: Window caption
+            render_scale: Internal render scale (config default if None)
+            window_scale: Integer upscale factor (config default if None)
+        """
+        self.display = Display(caption, render_scale, window_scale)
+        self._scaled = weakref.WeakKeyDictionary()
+        self._begin_frame()
+
+    def _begin_frame(self):
+        """Draw the world into the render target, at its scale"""
+        self.surface = self.display.surface
+        self.scale = self.display.render_scale if self.display.is_scaled() else 1
+        self._ui = False
+        self._world_drawn = False
+
+    def _image(self, image):
+        """The image at the current scale, shrunk on first use"""
+        if self.scale == 1:
+            return image
+        scaled = self._scaled.get(image)
+        if scaled is None:
+            width, height = image.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            try:
+                scaled = pygame.transform.smoothscale(image, size)
+            except ValueError:
+                # smoothscale only takes 24 and 32 bit surfaces
+                scaled = pygame.transform.scale(image, size)
+            self._scaled[image] = scaled
+        return scaled
+
+    def _position(self, dest):
+        scale = self.scale
+        if scale == 1:
+            return dest
+        return (round(dest[0] * scale), round(dest[1] * scale))
+
+    def blit(self, image, dest):
+        self._world_drawn = True
+        self.surface.blit(self._image(image), self._position(dest))
+
+    def blit_many(self, image, positions):
+        self._world_drawn = True
+        image = self._image(image)
+        position = self._position
+        self.surface.blits([(image, position(dest)) for dest in positions], False)
+
+    def draw_group(self, group):
+        self._world_drawn = True
+        if self.scale == 1:
+            group.draw(self.surface)
+        else:
+            self.draw_blits([(sprite.image, sprite.rect.topleft) for sprite in group])
+
+    def draw_blits(self, blits):
+        self._world_drawn = True
+        if self.scale == 1:
+            self.surface.blits(blits, False)
+        else:
+            image, position = self._image, self._position
+            self.surface.blits([(image(source), position(dest)) for source, dest in blits], False)
+
+    def blit_screen(self, image, dest):
+        self.ui_surface().blit(image, dest)
+
+    def ui_surface(self, key=None):
+        # The world is drawn over the whole screen every frame, so the UI is always redrawn
+        if not self._ui:
+            # The world is finished: bring it to full resolution once, then draw on top
+            if self._world_drawn:
+                self.display.resolve()
+            self.surface = self.display.screen
+            self.scale = 1
+            self._ui = True
+        return self.surface
+
+    def present(self):
+        self.ui_surface()
+        self.display.present()
+        self._begin_frame()
+
+    def set_render_scale(self, render_scale):
+        self.display.set_render_scale(render_scale)
+        self._scaled.clear()
+        self._begin_frame()
+
+
+class SDL2Backend(RenderBackend):
+    """Texture backend built on pygame._sdl2.video"""
+
+    name = "sdl2"
+
+    def __init__(self, caption="Galaxy Shooter", render_scale=None, window_scale=None, accelerated=0):
+        """
+        Create the window and renderer.
+
+        Args:
+            caption: Window caption
+            render_scale: Internal render scale (config default if None)
+            window_scale: Integer upscale factor (config default if None)
+            accelerated: 0 for the software renderer, 1 for a GPU renderer, -1 for any
+        """
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        self._texture_class = Texture
+        self.logical_size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.render_scale = config.RENDER_SCALE if render_scale is None else render_scale
+        self.window_scale = config.WINDOW_SCALE if window_scale is None else window_scale
+
+        self.window = Window(caption, size=(self.logical_size[0] * self.window_scale,
+                                            self.logical_size[1] * self.window_scale))
+        self.renderer = Renderer(self.window, accelerated=accelerated)
+        self.renderer.logical_size = self.logical_size
+        self.renderer.draw_color = (0, 0, 0, 255)
+
+        # One texture per cached image, released together with the image
+        self._textures = weakref.WeakKeyDictionary()
+
+        self._ui = None
+        self._ui_texture = None
+        self._ui_used = False
+        # The UI texture is only uploaded again when its key changes
+        self._ui_key = None
+        self._ui_dirty = False
+
+        # Below render scale 1 the world is drawn into a smaller target texture
+        self._world = None
+        self._world_state = None  # None, "drawing" or "done" for the current frame
+        self.set_render_scale(self.render_scale)
+
+    def _begin_world(self):
+        """Point the renderer at the world target, once per frame"""
+        if self._world is not None and self._world_state is None:
+            self.renderer.target = self._world
+            self.renderer.scale = (self.render_scale, self.render_scale)
+            self.renderer.clear()
+            self._world_state = "drawing"
+
+    def _finish_world(self):
+        """Upscale the world target onto the window; later draws of the frame go to the window"""
+        if self._world_state == "drawing":
+            self.renderer.target = None
+            self._world.draw(dstrect=(0, 0, *self.logical_size))
+        self._world_state = "done"
+
+    def texture(self, image):
+        """
+        Get the texture for an image, uploading it on first use.
+
+        Args:
+            image: Source surface
+
+        Returns:
+            The Texture for the image
+        """
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = self._texture_class.from_surface(self.renderer, image)
+            self._textures[image] = texture
+        return texture
+
+    def blit(self, image, dest):
+        self._begin_world()
+        width, height = image.get_size()
+        self.texture(image).draw(dstrect=pygame.Rect(dest[0], dest[1], width, height))
+
+    def blit_many(self, image, positions):
+        self._begin_world()
+        draw = self.texture(image).draw
+        width, height = image.get_size()
+        for x, y in positions:
+            draw(dstrect=(x, y, width, height))
+
+    def draw_group(self, group):
+        self._begin_world()
+        texture = self.texture
+        for sprite in sorted(group.sprites(), key=lambda sprite: id(sprite.image)):
+            texture(sprite.image).draw(dstrect=sprite.rect)
+
+    def draw_blits(self, blits):
+        self._begin_world()
+        texture = self.texture
+        for image, (x, y) in blits:
+            width, height = image.get_size()
+            texture(image).draw(dstrect=(x, y, width, height))
+
+    def blit_screen(self, image, dest):
+        self._finish_world()
+        width, height = image.get_size()
+        self.texture(image).draw(dstrect=pygame.Rect(dest[0], dest[1], width, height))
+
+    def ui_surface(self, key=None):
+        if self._ui is None:
+            self._ui = pygame.Surface(self.logical_size, pygame.SRCALPHA)
+            self._ui_texture = self._texture_class(self.renderer, self.logical_size, streaming=True)
+            self._ui_texture.blend_mode = pygame.BLENDMODE_BLEND
+        if self._ui_used:
+            # A second caller this frame draws on top: the key no longer describes the content
+            self._ui_key = None
+            self._ui_dirty = True
+            return self._ui
+        self._ui_used = True
+        if key is not None and key == self._ui_key:
+            # The texture already holds this UI
+            return None
+        self._ui.fill((0, 0, 0, 0))
+        self._ui_key = key
+        self._ui_dirty = True
+        return self._ui
+
+    def present(self):
+        self._finish_world()
+        if self._ui_used:
+            if self._ui_dirty:
+                self._ui_texture.update(self._ui)
+                self._ui_dirty = False
+            self._ui_texture.draw()
+            self._ui_used = False
+        self.renderer.present()
+        self.renderer.clear()
+        self._world_state = None
+
+    def set_render_scale(self, render_scale):
+        # Only the world target changes; the window keeps its size
+        if self._world_state == "drawing":
+            self._finish_world()
+        self.render_scale = render_scale
+        size = (max(1, round(self.logical_size[0] * render_scale)),
+                max(1, round(self.logical_size[1] * render_scale)))
+        if size == self.logical_size:
+            self._world = None
+        else:
+            self._world = self._texture_class(self.renderer, size, target=True)
+
+
+BACKENDS = {
+    SurfaceBackend.name: SurfaceBackend,
+    SDL2Backend.name: SDL2Backend,
+}
+
+
+def create_backend(name=None, caption="Galaxy Shooter", **kwargs):
+    """
+    Create a render backend by name.
+
+    Args:
+        name: "surface" or "sdl2" (config.RENDER_BACKEND if None)
+        caption: Window caption
+        **kwargs: Extra arguments for the backend constructor
+
+    Returns:
+        A RenderBackend instance
+    """
+    name = config.RENDER_BACKEND if name is None else name
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown render backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    return backend_class(caption, **kwargs)
@@ -0,0 +1,143 @@
+"""
+Memory-bounded rewind buffer for Galaxy Shooter
+
+The buffer keeps the packed TickStates (see core.tick_state) of the last
+few seconds of play in a ring. Every keyframe_interval-th tick is stored
+as a full, compressed frame; the ticks in between store only the XOR of
+their bytes with the previous tick, compressed. Since consecutive ticks
+share almost all of their bytes, a delta frame is a few dozen bytes.
+
+XOR deltas work in both directions: the current state XOR the newest
+delta gives the tick before it, so rewinding one tick costs a single
+decompress no matter how far back the nearest keyframe is.
+
+Memory is bounded twice: by the number of ticks kept and by a total byte
+budget. When either is exceeded the oldest keyframe is dropped together
+with the deltas that depend on it, so the cost never grows with the
+length of a run and the byte budget holds whatever the entity count.
+"""
+
+from collections import deque
+import zlib
+from core import config
+
+
+def _xor(a, b):
+    """XOR two byte strings, padding the shorter one with zeros"""
+    length = max(len(a), len(b))
+    value = int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')
+    return value.to_bytes(length, 'little')
+
+
+class RewindBuffer:
+    """
+    Ring of keyframes and XOR delta frames for the most recent ticks.
+    """
+
+    def __init__(self, seconds=10, fps=config.FPS, keyframe_interval=None,
+                 max_bytes=4 * 1024 * 1024, compression_level=1):
+        """
+        Args:
+            seconds: Seconds of play kept
+            fps: Ticks per second
+            keyframe_interval: Ticks between full frames (one second if None)
+            max_bytes: Upper bound on the stored (compressed) bytes
+            compression_level: zlib level used for every frame
+        """
+        self.max_frames = max(1, int(seconds * fps))
+        self.keyframe_interval = keyframe_interval or max(1, int(fps))
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        # Each frame is (is_keyframe, previous_length, length, compressed bytes)
+        self._frames = deque()
+        self._bytes = 0
+        self._current = None
+        self._since_keyframe = 0
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def stored_bytes(self):
+        """Compressed bytes currently held by the buffer"""
+        return self._bytes
+
+    def clear(self):
+        """Forget every stored tick"""
+        self._frames.clear()
+        self._bytes = 0
+        self._current = None
+        self._since_keyframe = 0
+
+    def push(self, state):
+        """
+        Record the state of the tick that just finished.
+
+        Args:
+            state: Packed state bytes (TickState.to_bytes())
+        """
+        if self._current is None or self._since_keyframe >= self.keyframe_interval:
+            frame = (True, 0, len(state), zlib.compress(state, self.compression_level))
+            self._since_keyframe = 1
+        else:
+            delta = _xor(state, self._current)
+            frame = (False, len(self._current), len(state), zlib.compress(delta, self.compression_level))
+            self._since_keyframe += 1
+        self._frames.append(frame)
+        self._bytes += len(frame[3])
+        self._current = state
+        self._evict()
+
+    def _evict(self):
+        """Drop the oldest keyframe and its deltas while over a limit"""
+        frames = self._frames
+        while len(frames) > 1 and (len(frames) > self.max_frames or self._bytes > self.max_bytes):
+            self._bytes -= len(frames.popleft()[3])
+            while frames and not frames[0][0]:
+                self._bytes -= len(frames.popleft()[3])
+        if not frames:
+            self._current = None
+
+    def peek(self):
+        """Return the newest stored state, or None if the buffer is empty"""
+        return self._current
+
+    def pop(self):
+        """
+        Remove and return the newest stored state.
+
+        Returns:
+            Packed state bytes, or None if the buffer is empty
+        """
+        if not self._frames:
+            return None
+        state = self._current
+        is_keyframe, previous_length, _, data = self._frames.pop()
+        self._bytes -= len(data)
+        if not self._frames:
+            self._current = None
+        elif is_keyframe:
+            self._current = self._rebuild_newest()
+        else:
+            self._current = _xor(state, zlib.decompress(data))[:previous_length]
+        self._since_keyframe = self._ticks_since_keyframe()
+        return state
+
+    def _rebuild_newest(self):
+        """Decode the newest frame forward from the keyframe it depends on"""
+        start = len(self._frames) - self._ticks_since_keyframe()
+        state = None
+        for index in range(start, len(self._frames)):
+            is_keyframe, _, length, data = self._frames[index]
+            decoded = zlib.decompress(data)
+            state = decoded if is_keyframe else _xor(state, decoded)[:length]
+        return state
+
+    def _ticks_since_keyframe(self):
+        """Count the frames from the newest keyframe to the end"""
+        count = 0
+        for is_keyframe, _, _, _ in reversed(self._frames):
+            count += 1
+            if is_keyframe:
+                break
+        return count
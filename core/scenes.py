@@ -0,0 +1,258 @@
+"""
+Scene stack for Galaxy Shooter
+
+The game is a stack of scenes: gameplay at the bottom, menus pushed on
+top of it. Only the top scene receives input. Each scene declares two
+things:
+- opaque: the scene covers the whole screen, so nothing below it is drawn
+- needs_simulation: the scene must be updated every tick. A scene that
+  does not need simulation only changes on input, so what it shows can
+  be drawn once and reused
+
+A menu that does not need simulation (main menu, level select, pause)
+is drawn once into a cached image together with its backdrop and only
+redrawn after input. The pause menu's backdrop is the frozen game
+world, captured once when the game is paused, so a paused game costs one
+blit per frame.
+
+Scenes are changed by the simulation and may be drawn on another thread
+(see core.sim_thread). A scene therefore hands the renderer a view of its
+state each tick (SceneStack.views()): a menu's view is a copy of the menu,
+taken again only when the menu may have changed, and drawing reads the
+view alone.
+"""
+
+import collections
+import copy
+
+MenuView = collections.namedtuple('MenuView', ['visit', 'menu'])
+MenuView.__doc__ = """
+What a MenuScene draws: the visit it belongs to and a copy of the menu.
+"""
+
+
+class Scene:
+    """
+    One layer of the game, built from callbacks.
+    """
+
+    def __init__(self, name, handle_event=None, update=None, draw=None, opaque=False,
+                 needs_simulation=True):
+        """
+        Args:
+            name: Scene name (PLAYING, PAUSED, ...)
+            handle_event: Callable (event) run for input while the scene is on top (optional)
+            update: Callable (dt) run every tick while the scene is on top (optional)
+            draw: Callable (renderer, frame) drawing the scene (optional)
+            opaque: True if the scene covers everything below it
+            needs_simulation: False if the scene only changes on input
+        """
+        self.name = name
+        self._handle_event = handle_event
+        self._update = update
+        self._draw = draw
+        self.opaque = opaque
+        self.needs_simulation = needs_simulation
+
+    def enter(self):
+        """Called when the scene is pushed"""
+        pass
+
+    def view(self):
+        """
+        Returns:
+            The state draw() needs for this tick, safe to read on another
+            thread (None for a scene drawn from the frame alone)
+        """
+        return None
+
+    def handle_event(self, event):
+        """
+        Handle an input event (top scene only).
+
+        Args:
+            event: pygame event
+        """
+        if self._handle_event is not None:
+            self._handle_event(event)
+
+    def update(self, dt):
+        """
+        Advance the scene by one tick (top scene only).
+
+        Args:
+            dt: Delta time in milliseconds
+        """
+        if self._update is not None:
+            self._update(dt)
+
+    def draw(self, renderer, frame, view=None):
+        """
+        Draw the scene.
+
+        Args:
+            renderer: RenderBackend to draw with
+            frame: RenderFrame of the tick being drawn
+            view: What view() returned for that tick
+        """
+        if self._draw is not None:
+            self._draw(renderer, frame)
+
+    def __repr__(self):
+        return f"Scene({self.name!r})"
+
+
+class MenuScene(Scene):
+    """
+    A menu as a scene. Menus that only change on input are cached.
+    """
+
+    def __init__(self, name, menu, on_action, backdrop=None, update=None, opaque=False,
+                 needs_simulation=False):
+        """
+        Args:
+            name: Scene name
+            menu: BaseMenu to show
+            on_action: Callable (action) receiving the menu's actions
+            backdrop: Callable (frame) returning the full-screen image drawn
+                under a cached menu, built once per push (optional)
+            update: Callable (dt) run every tick, for menus that need simulation (optional)
+            opaque: True if the scene covers everything below it
+            needs_simulation: True if the menu changes without input (timers)
+        """
+        super().__init__(name, update=update, opaque=opaque or backdrop is not None,
+                         needs_simulation=needs_simulation)
+        self.menu = menu
+        self.on_action = on_action
+        self.backdrop = backdrop
+        self._visit = 0
+        self._view = None
+        # Render side: the images drawn for the last view
+        self._backdrop_visit = None
+        self._backdrop_image = None
+        self._drawn_view = None
+        self._image = None
+
+    def enter(self):
+        # A new visit: the backdrop (e.g. the paused world) has changed
+        self._visit += 1
+        self._view = None
+
+    def invalidate(self):
+        """Redraw the cached menu on the next frame"""
+        self._view = None
+
+    def handle_event(self, event):
+        action = self.menu.handle_input(event)
+        self._view = None
+        if action:
+            self.on_action(action)
+
+    def view(self):
+        # Cached menus only change on input or a new visit; live ones may change every tick
+        if self._view is None or self.backdrop is None:
+            self._view = MenuView(self._visit, copy.copy(self.menu))
+        return self._view
+
+    def draw(self, renderer, frame, view=None):
+        if view is None:
+            view = self.view()
+        if self.backdrop is None:
+            # Drawn live over the scenes below
+            view.menu.draw(renderer.ui_surface())
+            return
+        if self._drawn_view is not view:
+            if self._backdrop_visit != view.visit:
+                self._backdrop_image = self.backdrop(frame)
+                self._backdrop_visit = view.visit
+            # A new surface each time: backends cache uploads per surface
+            image = self._backdrop_image.copy()
+            view.menu.draw(image)
+            self._image = image
+            self._drawn_view = view
+        renderer.blit_screen(self._image, (0, 0))
+
+
+class SceneStack:
+    """
+    Ordered scenes, top last.
+    """
+
+    def __init__(self, *scenes):
+        """
+        Args:
+            *scenes: Initial scenes, bottom first
+        """
+        self._scenes = []
+        for scene in scenes:
+            self.push(scene)
+
+    @property
+    def top(self):
+        """The scene receiving input (None if the stack is empty)"""
+        return self._scenes[-1] if self._scenes else None
+
+    def __len__(self):
+        return len(self._scenes)
+
+    def __contains__(self, scene):
+        return scene in self._scenes
+
+    def push(self, scene):
+        """Put a scene on top"""
+        self._scenes.append(scene)
+        scene.enter()
+
+    def pop(self):
+        """
+        Remove the top scene.
+
+        Returns:
+            The removed scene
+        """
+        return self._scenes.pop()
+
+    def replace(self, scene):
+        """Swap the top scene for another"""
+        if self._scenes:
+            self._scenes.pop()
+        self.push(scene)
+
+    def reset(self, *scenes):
+        """Drop every scene and push new ones, bottom first"""
+        self._scenes.clear()
+        for scene in scenes:
+            self.push(scene)
+
+    def handle_event(self, event):
+        """Give an input event to the top scene"""
+        if self._scenes:
+            self._scenes[-1].handle_event(event)
+
+    def update(self, dt):
+        """Update the top scene if it needs simulation"""
+        top = self.top
+        if top is not None and top.needs_simulation:
+            top.update(dt)
+
+    def views(self):
+        """
+        Returns:
+            Tuple of (scene, view) pairs of the visible scenes, bottom first
+        """
+        return tuple((scene, scene.view()) for scene in self.visible())
+
+    def visible(self):
+        """
+        Returns:
+            Tuple of the scenes that must be drawn, bottom first: the top
+            opaque scene and everything above it
+        """
+        scenes = self._scenes
+        first = 0
+        for index in range(len(scenes) - 1, -1, -1):
+            if scenes[index].opaque:
+                first = index
+                break
+        return tuple(scenes[first:])
+
@@ -0,0 +1,158 @@
+"""
+Simulation thread for Galaxy Shooter
+
+With GALAXY_SIM_THREAD=on the game logic runs on a worker thread at a
+fixed tick rate while the main thread only pumps events and draws:
+- The main thread forwards input events to the simulation (SDL events
+  must be read on the thread that created the window)
+- After every tick the simulation publishes an immutable RenderFrame:
+  blit lists of (image, position) pairs, the HUD values and copies of the
+  menus shown, taken out of the live game objects
+- The main thread draws the newest published frame
+
+Frames are exchanged through two slots: the simulation fills the back
+slot and then makes it the front one, so the renderer always reads a
+complete frame and never sees objects the simulation is changing.
+pygame's blits and display updates release the GIL, so a slow present no
+longer delays the simulation tick, and a slow tick no longer delays the
+present.
+"""
+
+import collections
+import queue
+import threading
+import time
+
+RenderFrame = collections.namedtuple(
+    'RenderFrame',
+    ['scenes', 'sprites', 'field_image', 'field_positions', 'overlay', 'level', 'boss']
+)
+RenderFrame.__doc__ = """
+Everything needed to draw one tick, detached from the game objects.
+
+    scenes: Tuple of (scene, view) pairs to draw, bottom first (see SceneStack.views())
+    sprites: Tuple of (image, (x, y)) drawn below the bullet field
+    field_image: Image of every bullet field bullet (None if there are none)
+    field_positions: Tuple of (x, y) top-left positions of field bullets
+    overlay: Tuple of (image, (x, y)) drawn above the bullet field
+    level: (number, name, enemies on screen, total enemies) or None
+    boss: (name, hp, max hp) or None
+"""
+
+
+class FrameExchange:
+    """
+    Double buffer of render frames between one producer and one consumer.
+    """
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self._sequence = 0
+        self._published = threading.Condition()
+
+    def publish(self, frame):
+        """
+        Make a frame the latest one.
+
+        Args:
+            frame: Immutable RenderFrame
+        """
+        back = 1 - self._front
+        self._slots[back] = frame
+        with self._published:
+            self._front = back
+            self._sequence += 1
+            self._published.notify_all()
+
+    def latest(self):
+        """
+        Returns:
+            Tuple (sequence, frame) of the newest frame (frame is None before the first)
+        """
+        with self._published:
+            return self._sequence, self._slots[self._front]
+
+    def wait(self, seen, timeout=None):
+        """
+        Wait for a frame newer than the one already drawn.
+
+        Args:
+            seen: Sequence number of the frame already drawn
+            timeout: Seconds to wait at most
+
+        Returns:
+            Tuple (sequence, frame); the sequence equals seen on timeout
+        """
+        with self._published:
+            self._published.wait_for(lambda: self._sequence != seen, timeout)
+            return self._sequence, self._slots[self._front]
+
+    def wake(self):
+        """Release every waiting consumer (the producer has stopped)"""
+        with self._published:
+            self._published.notify_all()
+
+
+class SimulationThread(threading.Thread):
+    """
+    Runs the game's tick function at a fixed rate on a worker thread.
+    """
+
+    def __init__(self, step, fps):
+        """
+        Args:
+            step: Callable (events, dt) -> RenderFrame, or None to stop
+            fps: Ticks per second
+        """
+        super().__init__(name="simulation", daemon=True)
+        self.step = step
+        self.fps = fps
+        self.frames = FrameExchange()
+        self.error = None
+        self.step_ms = 0.0  # Duration of the last tick
+        self._events = queue.SimpleQueue()
+        self._running = True
+
+    def post(self, event):
+        """Forward an input event to the simulation (main thread)"""
+        self._events.put(event)
+
+    def stop(self):
+        """Ask the thread to finish after its current tick"""
+        self._running = False
+
+    def _drain(self):
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def run(self):
+        interval = 1.0 / self.fps
+        last = next_tick = time.perf_counter()
+        try:
+            while self._running:
+                now = time.perf_counter()
+                dt = round((now - last) * 1000)
+                last = now
+                frame = self.step(self._drain(), dt)
+                self.step_ms = (time.perf_counter() - now) * 1000
+                if frame is None:
+                    break
+                self.frames.publish(frame)
+                next_tick += interval
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.perf_counter()  # Fell behind: don't run a burst of ticks
+        except Exception as e:
+            self.error = e
+            raise
+        finally:
+            self._running = False
+            # Wake a renderer waiting for a frame that will never come
+            self.frames.wake()
@@ -0,0 +1,131 @@
+"""
+Fast sprite container for Galaxy Shooter
+
+FastGroup is a drop-in replacement for pygame.sprite.Group tuned for
+large numbers of short-lived sprites such as bullets:
+- Add and remove are O(1) (swap-with-last removal)
+- Sprites are stored in one contiguous list, so iteration is a list copy
+- draw() issues a single batched blit call, ordered by source surface
+
+Because removal swaps, the order of sprites inside a group is not stable.
+"""
+
+import pygame
+
+
+def _source_key(blit):
+    """Sort key grouping blits by their source surface"""
+    return id(blit[0])
+
+
+class FastGroup(pygame.sprite.AbstractGroup):
+    """
+    Sprite group with O(1) membership changes and batched drawing.
+
+    Works with pygame.sprite.spritecollide/groupcollide, Sprite.kill()
+    and Sprite.add() exactly like pygame.sprite.Group.
+    """
+
+    def __init__(self, *sprites):
+        """
+        Initialize the group.
+
+        Args:
+            *sprites: Sprites (or iterables of sprites) to add initially
+        """
+        super().__init__()
+        self._sprites = []
+        self._index = {}
+        self.add(*sprites)
+
+    def sprites(self):
+        """Return a list of the sprites in the group (safe to mutate the group while looping)"""
+        return self._sprites[:]
+
+    def add_internal(self, sprite, layer=None):
+        """Append a sprite to the group"""
+        self._index[sprite] = len(self._sprites)
+        self._sprites.append(sprite)
+
+    def remove_internal(self, sprite):
+        """Remove a sprite by swapping the last sprite into its slot"""
+        index = self._index.pop(sprite)
+        last = self._sprites.pop()
+        if last is not sprite:
+            self._sprites[index] = last
+            self._index[last] = index
+
+    def has_internal(self, sprite):
+        """Check whether a sprite is in the group"""
+        return sprite in self._index
+
+    def copy(self):
+        """Return a new group of the same class with the same sprites"""
+        return self.__class__(self._sprites)
+
+    def __iter__(self):
+        return iter(self._sprites[:])
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def __bool__(self):
+        return bool(self._sprites)
+
+    def empty(self):
+        """Remove all sprites from the group"""
+        for sprite in self._sprites:
+            sprite.remove_internal(self)
+        self._sprites.clear()
+        self._index.clear()
+
+    def update(self, *args, **kwargs):
+        """Call update() on every sprite in the group"""
+        for sprite in self._sprites[:]:
+            sprite.update(*args, **kwargs)
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        """
+        Draw every sprite onto the surface with one batched blit call.
+
+        Blits are sorted by source surface so that sprites sharing an image
+        are drawn back to back.
+
+        Args:
+            surface: Surface to draw on
+            bgsurf: Unused, accepted for compatibility with pygame groups
+            special_flags: Blend flags passed to every blit
+
+        Returns:
+            Empty list (dirty rects are not tracked; see clear())
+        """
+        if not self._sprites:
+            return []
+        blit_sequence = [(sprite.image, sprite.rect) for sprite in self._sprites]
+        blit_sequence.sort(key=_source_key)
+        fblits = getattr(surface, "fblits", None)
+        if fblits is not None:
+            fblits(blit_sequence, special_flags)
+        elif special_flags:
+            surface.blits([(image, rect, None, special_flags) for image, rect in blit_sequence], False)
+        else:
+            surface.blits(blit_sequence, False)
+        return []
+
+    def clear(self, surface, bgd):
+        """
+        Erase the area under every sprite in the group.
+
+        Unlike pygame.sprite.Group, previous positions are not tracked, so this
+        clears the sprites' current rects. Call it before update(), right after
+        the frame that drew them.
+
+        Args:
+            surface: Surface to clear
+            bgd: Background surface, or a callable taking (surface, rect)
+        """
+        if callable(bgd):
+            for sprite in self._sprites:
+                bgd(surface, sprite.rect)
+        else:
+            surface.blits([(bgd, sprite.rect, sprite.rect) for sprite in self._sprites], False)
@@ -0,0 +1,278 @@
+"""
+Per-tick world state hashes for Galaxy Shooter
+
+Gameplay is deterministic for a given seed, input and clock, and that is
+easy to break without noticing: an optimization of Enemy.update(),
+collisions or firing that changes one value on one tick makes every
+later tick different. A HashStream makes such a change visible at once:
+- Every tick the TickState that rewind already builds (core.tick_state)
+  is hashed field by field: one CRC-32 per table column (enemy x, enemy
+  y, boss HP, level timer, ...) and one for the RNG state. Hashing a
+  column is a single zlib.crc32 call over its packed values
+- Every tick is chained into a running digest, so two whole runs can be
+  compared through one number. A saved stream only holds the fields whose
+  CRC changed since the previous tick (six bytes each), well under a
+  hundred bytes per tick
+- Two streams are compared tick by tick; the first tick whose fields
+  differ is reported together with the names of those fields
+
+Streams are saved in a small binary format:
+    header:  magic (4 bytes), version (u8)
+    records: type (u8), then
+             NAME: field id (u16), name length (u8), name (utf-8)
+             TICK: tick (u32), changed count (u16), dropped count (u16),
+                   (field id u16, crc u32) per changed field,
+                   field id (u16) per field gone since the previous tick
+
+tools.determinism records and compares streams of a scripted headless
+session.
+"""
+
+from array import array
+import collections
+import struct
+import zlib
+
+STREAM_MAGIC = b"GSHS"
+STREAM_VERSION = 1
+
+_HEADER = struct.Struct('<4sB')
+_TYPE = struct.Struct('<B')
+_NAME = struct.Struct('<HB')
+_TICK = struct.Struct('<IHH')
+_DROPPED = struct.Struct('<H')
+_FIELD = struct.Struct('<HI')
+_NAME_RECORD = 0
+_TICK_RECORD = 1
+
+# Column names of the TickState tables, for readable reports
+# (columns that are not listed are reported by index)
+COLUMNS = {
+    "timers": ("level_elapsed", "fire_time"),
+    "player": ("x", "y", "last_shot"),
+    "level": ("level_time", "enemies_killed", "pool_index", "is_complete",
+              "boss_spawned", "enemies_phase_complete"),
+    "enemies": ("alive", "x", "y", "move_counter", "move_direction", "speed",
+                "shoot_chance", "last_shot", "shoot_delay", "age"),
+    "bullets": ("x", "y"),
+    "enemy_bullets": ("x", "y"),
+    "boss_bullets": ("x", "y", "dx", "dy"),
+    "boss": ("x", "y", "hp", "alive", "move_counter", "move_direction", "last_shot"),
+    "boss_patterns": ("index", "timer", "volleys_left"),
+}
+
+Divergence = collections.namedtuple('Divergence', ['tick', 'fields'])
+Divergence.__doc__ = """
+The first difference between two hash streams.
+
+    tick: Tick number of the first differing record
+    fields: Sorted names of the fields that differ on that tick (a field
+        present in only one stream counts as differing)
+"""
+
+
+def column_name(table, column):
+    """
+    Name of one column of a TickState table.
+
+    Args:
+        table: Table name
+        column: Column index
+
+    Returns:
+        "table.column" name
+    """
+    names = COLUMNS.get(table, ())
+    return f"{table}.{names[column] if column < len(names) else column}"
+
+
+def hash_state(state):
+    """
+    Hash every field of a TickState.
+
+    Args:
+        state: TickState of one tick
+
+    Returns:
+        Dict of field name -> CRC-32
+    """
+    version, internal, gauss_next = state.rng_state
+    rng = array('I', internal).tobytes() + struct.pack('<Bd', gauss_next is not None, gauss_next or 0.0)
+    digests = {"rng": zlib.crc32(rng, version)}
+    for table, (width, values) in state.tables.items():
+        if width == 1:
+            digests[column_name(table, 0)] = zlib.crc32(values)
+            continue
+        for column in range(width):
+            digests[column_name(table, column)] = zlib.crc32(values[column::width])
+    return digests
+
+
+class HashStream:
+    """
+    Field hashes of consecutive ticks, with a running digest.
+    """
+
+    def __init__(self):
+        self.names = []
+        self._ids = {}
+        self._ticks = array('I')
+        self._offsets = array('I', [0])
+        self._fields = array('I')  # Interleaved field id, CRC
+        self.digest = 0
+
+    def __len__(self):
+        return len(self._ticks)
+
+    def _field_id(self, name):
+        field_id = self._ids.get(name)
+        if field_id is None:
+            field_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return field_id
+
+    def add(self, tick, digests):
+        """
+        Append the field hashes of one tick.
+
+        Args:
+            tick: Tick number
+            digests: Dict of field name -> CRC-32 (see hash_state())
+        """
+        fields = self._fields
+        for name, crc in digests.items():
+            fields.append(self._field_id(name))
+            fields.append(crc)
+        self._ticks.append(tick)
+        self._offsets.append(len(fields))
+        # By field name, so the digest does not depend on the order fields were added in
+        ordered = array('I', [digests[name] for name in sorted(digests)])
+        self.digest = zlib.crc32(ordered, zlib.crc32(_TICK.pack(tick, len(ordered), 0), self.digest))
+
+    def record(self, tick, state):
+        """
+        Hash a TickState and append it.
+
+        Args:
+            tick: Tick number
+            state: TickState of that tick
+        """
+        self.add(tick, hash_state(state))
+
+    def tick(self, index):
+        """
+        Return one record.
+
+        Args:
+            index: Record index (0 is the first recorded tick)
+
+        Returns:
+            Tuple of (tick, dict of field name -> CRC-32)
+        """
+        fields = self._fields[self._offsets[index]:self._offsets[index + 1]]
+        names = self.names
+        return self._ticks[index], {names[fields[i]]: fields[i + 1] for i in range(0, len(fields), 2)}
+
+    def compare(self, other):
+        """
+        Find the first tick where two streams differ.
+
+        Args:
+            other: HashStream to compare with (e.g. a reference run)
+
+        Returns:
+            Divergence, or None if the streams agree on every tick both
+            recorded and have the same length
+        """
+        for index in range(min(len(self), len(other))):
+            tick, mine = self.tick(index)
+            other_tick, theirs = other.tick(index)
+            if tick != other_tick:
+                return Divergence(min(tick, other_tick), ["tick"])
+            if mine != theirs:
+                differing = [name for name in mine.keys() | theirs.keys() if mine.get(name) != theirs.get(name)]
+                return Divergence(tick, sorted(differing))
+        if len(self) != len(other):
+            longer = self if len(self) > len(other) else other
+            return Divergence(longer.tick(min(len(self), len(other)))[0], ["length"])
+        return None
+
+    def to_bytes(self):
+        """Pack the stream into bytes, each tick as the changes since the one before"""
+        parts = [_HEADER.pack(STREAM_MAGIC, STREAM_VERSION)]
+        named = 0
+        previous = {}
+        for index in range(len(self)):
+            tick, digests = self.tick(index)
+            changed = [(name, crc) for name, crc in digests.items() if previous.get(name) != crc]
+            dropped = [name for name in previous if name not in digests]
+            previous = digests
+            for name, _ in changed:
+                # Names are written just before the first tick that uses them
+                field_id = self._ids[name]
+                while named <= field_id:
+                    encoded = self.names[named].encode('utf-8')
+                    parts.append(_TYPE.pack(_NAME_RECORD) + _NAME.pack(named, len(encoded)) + encoded)
+                    named += 1
+            parts.append(_TYPE.pack(_TICK_RECORD) + _TICK.pack(tick, len(changed), len(dropped)))
+            parts.extend(_FIELD.pack(self._ids[name], crc) for name, crc in changed)
+            parts.extend(_DROPPED.pack(self._ids[name]) for name in dropped)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Unpack a stream produced by to_bytes().
+
+        Args:
+            data: Bytes-like packed stream
+
+        Returns:
+            HashStream instance
+
+        Raises:
+            ValueError: If the data is not a hash stream of this version
+        """
+        data = memoryview(data)
+        magic, version = _HEADER.unpack_from(data, 0)
+        if magic != STREAM_MAGIC or version != STREAM_VERSION:
+            raise ValueError("not a Galaxy Shooter hash stream (or an unsupported version)")
+        stream = cls()
+        names = {}
+        digests = {}
+        offset = _HEADER.size
+        while offset < len(data):
+            (record_type,) = _TYPE.unpack_from(data, offset)
+            offset += _TYPE.size
+            if record_type == _NAME_RECORD:
+                field_id, length = _NAME.unpack_from(data, offset)
+                offset += _NAME.size
+                names[field_id] = bytes(data[offset:offset + length]).decode('utf-8')
+                offset += length
+            elif record_type == _TICK_RECORD:
+                tick, changed, dropped = _TICK.unpack_from(data, offset)
+                offset += _TICK.size
+                digests = dict(digests)
+                for _ in range(changed):
+                    field_id, crc = _FIELD.unpack_from(data, offset)
+                    offset += _FIELD.size
+                    digests[names[field_id]] = crc
+                for _ in range(dropped):
+                    (field_id,) = _DROPPED.unpack_from(data, offset)
+                    offset += _DROPPED.size
+                    del digests[names[field_id]]
+                stream.add(tick, digests)
+            else:
+                raise ValueError(f"unknown record type {record_type} in hash stream")
+        return stream
+
+    def save(self, path):
+        """Write the stream to a file"""
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a stream written by save()"""
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
@@ -0,0 +1,168 @@
+"""
+Systems for the Galaxy Shooter ECS.
+
+Every system is a function taking (world, dt) that loops over the
+columns of the archetypes matched by a query. Each one applies the same
+per-tick rules as the update() method of the sprite class it stands for
+in entities/, so an entity moves exactly like its sprite would:
+- Player: keyboard movement clamped to the arena (Player.update)
+- Enemy: the shared closed-form zigzag path (Enemy.update, entities.zigzag)
+- Boss: side-to-side swing bouncing off the edges (BaseBoss.update)
+- Bullets: straight movement, removed once off screen (Bullets, EnemyBullet)
+- Explosion: frame animation, removed after the last frame (Explosion.update)
+
+Shooting and collisions stay with the game's play rules (see
+managers.play_session). tools/ecs_check.py steps sprites and a World side
+by side and fails if they ever disagree.
+"""
+
+from array import array
+from operator import add
+import pygame
+from .components import (
+    Position, Velocity, Renderable, Animation, PlayerControl, ZigzagPath,
+    Swing, CullY
+)
+
+
+def player_control_system(world, dt):
+    """Move player-controlled entities from the keyboard state"""
+    keys = pygame.key.get_pressed()
+    direction = 0
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        direction -= 1
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        direction += 1
+    for arch in world.query(Position, PlayerControl):
+        xs = arch.column(Position, 'x')
+        speeds = arch.column(PlayerControl, 'speed')
+        max_xs = arch.column(PlayerControl, 'max_x')
+        for i in range(len(arch)):
+            x = xs[i] + direction * speeds[i]
+            xs[i] = 0 if x < 0 else min(x, max_xs[i])
+
+
+def zigzag_system(world, dt):
+    """Advance formation enemies one tick along their zigzag paths"""
+    for arch in world.query(Position, ZigzagPath):
+        xs = arch.column(Position, 'x')
+        ys = arch.column(Position, 'y')
+        paths = arch.column(ZigzagPath, 'path')
+        path_ys = arch.column(ZigzagPath, 'path_y')
+        ages = arch.column(ZigzagPath, 'age')
+        steps = arch.column(ZigzagPath, 'step')
+        segment_ends = arch.column(ZigzagPath, 'segment_end')
+        for i in range(len(arch)):
+            age = ages[i] + 1
+            ages[i] = age
+            if age < segment_ends[i]:
+                # Inside a straight stretch of the path nothing turns or bounces
+                xs[i] += steps[i]
+            else:
+                x, dy, _, _, steps[i], segment_ends[i] = paths[i].segment_at(age)
+                xs[i] = x
+                ys[i] = path_ys[i] + dy
+
+
+def swing_system(world, dt):
+    """Swing bosses from side to side, turning at the counter limit and the edges"""
+    for arch in world.query(Position, Swing):
+        xs = arch.column(Position, 'x')
+        counters = arch.column(Swing, 'counter')
+        directions = arch.column(Swing, 'direction')
+        speeds = arch.column(Swing, 'speed')
+        limits = arch.column(Swing, 'limit')
+        max_xs = arch.column(Swing, 'max_x')
+        for i in range(len(arch)):
+            xs[i] += directions[i] * speeds[i]
+            counters[i] += 1
+            if abs(counters[i]) > limits[i]:
+                directions[i] = -directions[i]
+                counters[i] *= directions[i]
+            if xs[i] < 0:
+                xs[i] = 0
+                directions[i] = 1
+            if xs[i] > max_xs[i]:
+                xs[i] = max_xs[i]
+                directions[i] = -1
+
+
+def movement_system(world, dt):
+    """Apply velocities to positions, one whole column at a time"""
+    for arch in world.query(Position, Velocity):
+        xs = arch.column(Position, 'x')
+        ys = arch.column(Position, 'y')
+        dxs = arch.column(Velocity, 'dx')
+        dys = arch.column(Velocity, 'dy')
+        if any(dxs):
+            xs[:] = array(xs.typecode, map(add, xs, dxs))
+        ys[:] = array(ys.typecode, map(add, ys, dys))
+
+
+def cull_system(world, dt):
+    """Despawn entities whose top edge left their vertical bounds"""
+    for arch in world.query(Position, CullY):
+        ys = arch.column(Position, 'y')
+        min_ys = arch.column(CullY, 'min_y')
+        max_ys = arch.column(CullY, 'max_y')
+        for entity, y, min_y, max_y in zip(arch.entities, ys, min_ys, max_ys):
+            if not min_y <= y <= max_y:
+                world.despawn(entity)
+
+
+def animation_system(world, dt):
+    """Step frame animations and despawn them after the last frame"""
+    for arch in world.query(Animation, Renderable):
+        frames = arch.column(Animation, 'frames')
+        indices = arch.column(Animation, 'index')
+        counters = arch.column(Animation, 'counter')
+        speeds = arch.column(Animation, 'speed')
+        images = arch.column(Renderable, 'image')
+        entities = arch.entities
+        for i in range(len(arch)):
+            counter = counters[i] + 1
+            if counter < speeds[i]:
+                # Most ticks only count towards the next frame
+                counters[i] = counter
+                continue
+            last = len(frames[i]) - 1
+            if indices[i] < last:
+                counter = 0
+                indices[i] += 1
+                images[i] = frames[i][indices[i]]
+            counters[i] = counter
+            if indices[i] >= last and counter >= speeds[i]:
+                world.despawn(entities[i])
+
+
+DEFAULT_SYSTEMS = (
+    player_control_system,
+    zigzag_system,
+    swing_system,
+    movement_system,
+    cull_system,
+    animation_system,
+)
+
+
+def add_default_systems(world):
+    """Register the standard movement and animation systems on a world, in update order"""
+    for system in DEFAULT_SYSTEMS:
+        world.add_system(system)
+
+
+def world_blits(world):
+    """
+    Image and top-left position of every renderable entity, for one batched blit.
+
+    Args:
+        world: World to draw
+
+    Returns:
+        List of (image, (x, y))
+    """
+    blits = []
+    for arch in world.query(Position, Renderable):
+        positions = zip(arch.column(Position, 'x'), arch.column(Position, 'y'))
+        blits.extend(zip(arch.column(Renderable, 'image'), positions))
+    return blits
@@ -0,0 +1,129 @@
+"""
+Compact per-tick game state for Galaxy Shooter
+
+A TickState holds everything needed to put the game back into the state of
+one tick: named tables of numbers (positions, HP, timers, ...) and the
+state of the random number generator. It packs into a flat byte string
+with a stable layout, so consecutive ticks differ in few bytes and delta
+encode well (see core.rewind).
+
+Layout:
+    RNG:    version (u8), 625 words (u32), has_gauss (u8), gauss_next (f64)
+    count:  number of tables (u16)
+    tables: name length (u8), row width (u8), value count (u32),
+            name (utf-8), values (f64 each)
+"""
+
+from array import array
+import random
+import struct
+
+_RNG_WORDS = 625
+_RNG_HEADER = struct.Struct('<B')
+_RNG_TAIL = struct.Struct('<Bd')
+_COUNT = struct.Struct('<H')
+_TABLE = struct.Struct('<BBI')
+
+
+class TickState:
+    """
+    Named numeric tables plus the RNG state of one tick.
+    """
+
+    def __init__(self, rng_state=None):
+        """
+        Args:
+            rng_state: random.getstate() tuple (the current state if None)
+        """
+        self.rng_state = random.getstate() if rng_state is None else rng_state
+        self.tables = {}
+
+    def set_table(self, name, width, values):
+        """
+        Store a table of rows.
+
+        Args:
+            name: Table name
+            width: Number of values per row
+            values: Flat iterable of numbers, row after row
+        """
+        self.tables[name] = (width, array('d', values))
+
+    def rows(self, name):
+        """
+        Iterate over the rows of a table.
+
+        Args:
+            name: Table name
+
+        Returns:
+            List of row tuples (empty if the table is missing)
+        """
+        if name not in self.tables:
+            return []
+        width, values = self.tables[name]
+        return [tuple(values[i:i + width]) for i in range(0, len(values), width)]
+
+    def row(self, name, default=None):
+        """Return the first row of a table, or default if it is missing or empty"""
+        rows = self.rows(name)
+        return rows[0] if rows else default
+
+    def values(self, name):
+        """Return the flat values array of a table (empty if missing)"""
+        return self.tables[name][1] if name in self.tables else array('d')
+
+    def to_bytes(self):
+        """Pack the state into bytes"""
+        version, internal, gauss_next = self.rng_state
+        parts = [
+            _RNG_HEADER.pack(version),
+            array('I', internal).tobytes(),
+            _RNG_TAIL.pack(gauss_next is not None, gauss_next or 0.0),
+            _COUNT.pack(len(self.tables)),
+        ]
+        for name, (width, values) in self.tables.items():
+            encoded = name.encode('utf-8')
+            parts.append(_TABLE.pack(len(encoded), width, len(values)))
+            parts.append(encoded)
+            parts.append(values.tobytes())
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Unpack a state produced by to_bytes().
+
+        Args:
+            data: Bytes-like packed state
+
+        Returns:
+            TickState instance
+        """
+        data = memoryview(data)
+        offset = 0
+        (version,) = _RNG_HEADER.unpack_from(data, offset)
+        offset += _RNG_HEADER.size
+        internal = array('I')
+        internal.frombytes(data[offset:offset + _RNG_WORDS * internal.itemsize])
+        offset += _RNG_WORDS * internal.itemsize
+        has_gauss, gauss_next = _RNG_TAIL.unpack_from(data, offset)
+        offset += _RNG_TAIL.size
+        state = cls((version, tuple(internal), gauss_next if has_gauss else None))
+
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            name_length, width, value_count = _TABLE.unpack_from(data, offset)
+            offset += _TABLE.size
+            name = bytes(data[offset:offset + name_length]).decode('utf-8')
+            offset += name_length
+            values = array('d')
+            values.frombytes(data[offset:offset + value_count * values.itemsize])
+            offset += value_count * values.itemsize
+            state.tables[name] = (width, values)
+        return state
+
+    def restore_rng(self):
+        """Put the random number generator back into the captured state"""
+        random.setstate(self.rng_state)
@@ -8,8 +8,12 @@ from .base_boss import BaseBoss
 from .boss3 import Boss3
 from .boss4 import Boss4
 from .boss5 import Boss5
+from .bullet_patterns import BulletPattern, PatternEngine, Volley
+from .bullet_field import BulletField
+from .explosion_field import ExplosionField
 
 __all__ = [
     'Player', 'Enemy', 'EnemyBullet', 'Explosion',
-    'BaseBoss', 'Boss3', 'Boss4', 'Boss5'
+    'BaseBoss', 'Boss3', 'Boss4', 'Boss5',
+    'BulletPattern', 'PatternEngine', 'Volley', 'BulletField', 'ExplosionField'
 ]
\ No newline at end of file
@@ -2,8 +2,50 @@ from abc import ABC, abstractmethod
 import pygame
 import random
 import os
+from core.assets import load_image
+from core.bundles import boss_bundle
 from .enemy import Enemy
 from .enemyBullets import EnemyBullet
+from .bullet_patterns import PatternEngine
+from managers.telemetry import BOSS_DAMAGE
+
+
+def draw_hp_bar(surface, x, y, current_hp, max_hp, width=200, height=20):
+    """
+    Draw a boss HP bar from HP values, e.g. ones copied into a render snapshot.
+    
+    Args:
+        surface: Surface to draw on
+        x: X position of the HP bar
+        y: Y position of the HP bar
+        current_hp: Remaining HP
+        max_hp: Maximum HP
+        width: Width of the HP bar
+        height: Height of the HP bar
+    """
+    background_rect = pygame.Rect(x, y, width, height)
+    pygame.draw.rect(surface, (100, 20, 20), background_rect)
+    
+    hp_percentage = current_hp / max_hp if max_hp > 0 else 0
+    hp_width = int(width * hp_percentage)
+    
+    if hp_width > 0:
+        hp_rect = pygame.Rect(x, y, hp_width, height)
+        if hp_percentage > 0.6:
+            color = (50, 200, 50)
+        elif hp_percentage > 0.3:
+            color = (200, 200, 50)
+        else:
+            color = (200, 50, 50)
+        pygame.draw.rect(surface, color, hp_rect)
+    
+    pygame.draw.rect(surface, (255, 255, 255), background_rect, 2)
+    
+    font = pygame.font.Font(None, 24)
+    hp_text = font.render(f"{current_hp}/{max_hp}", True, (255, 255, 255))
+    text_rect = hp_text.get_rect(center=(x + width // 2, y + height // 2))
+    surface.blit(hp_text, text_rect)
+
 
 class BaseBoss(Enemy, ABC):
     """
@@ -14,7 +56,7 @@ class BaseBoss(Enemy, ABC):
     - Health points (level 3: 5 HP, level 4: 8 HP, level 5: 12 HP)
     - Boss images from assets/images directory
     - Stationary behavior (doesn't move down like regular enemies)
-    - Shooting patterns
+    - Shooting patterns (BULLET_PATTERNS, see entities.bullet_patterns)
     
     Design Principles:
     - Inheritance: Inherits from Enemy class for common functionality
@@ -23,6 +65,10 @@ class BaseBoss(Enemy, ABC):
     - Encapsulation: Boss state and logic are encapsulated in the class
     """
     
+    # Pattern dicts played in a loop by the pattern engine.
+    # Bosses without patterns fall back to single straight shots.
+    BULLET_PATTERNS = ()
+    
     def __init__(self, x, y, screen_width, screen_height, level):
         """
         Initialize the base boss.
@@ -39,19 +85,38 @@ class BaseBoss(Enemy, ABC):
         
         super().__init__(x, y, screen_width)
         
-        self._load_boss_image()
+        self.start_position = (x, y)
+        self.max_hp = self._get_max_hp_by_level()
+        self.horizontal_speed = 2
+        self.pattern_engine = PatternEngine(self.BULLET_PATTERNS) if self.BULLET_PATTERNS else None
+        self.telemetry = None  # Telemetry sink for damage events (set by the level)
         
-        self.rect.centerx = x
-        self.rect.y = y
+        self.restart()
+        
+    def restart(self):
+        """
+        Restore the boss to its initial state so it can be fought again
+        without being recreated.
+        """
+        self.rect.centerx, self.rect.y = self.start_position
         
-        self.max_hp = self._get_max_hp_by_level()
         self.current_hp = self.max_hp
         self.is_alive = True
         
         self.speed = 0 
         self.move_direction = 1
         self.move_counter = 0
-        self.horizontal_speed = 2
+        self.last_shot = pygame.time.get_ticks()
+        
+        if self.pattern_engine is not None:
+            self.pattern_engine.reset()
+        
+    def _load_image(self):
+        """
+        Bosses use their own image instead of a random alien.
+        """
+        self._load_boss_image()
+        return self.image
         
     def _load_boss_image(self):
         """
@@ -62,7 +127,7 @@ class BaseBoss(Enemy, ABC):
         if os.path.exists(image_path):
             try:
                 # Load and scale the boss image
-                original_image = pygame.image.load(image_path)
+                original_image = load_image(image_path)
                 # Scale the boss image to be larger than regular enemies
                 self.image = pygame.transform.scale(original_image, (120, 90))
             except pygame.error as e:
@@ -126,6 +191,16 @@ class BaseBoss(Enemy, ABC):
             return EnemyBullet(self.rect.centerx, self.rect.bottom)
         return None
     
+    def to_bundle(self):
+        """
+        Return the ECS components describing this boss's current state.
+        
+        Returns:
+            Bundle dict for World.spawn() (see core.bundles)
+        """
+        return boss_bundle(self.image, self.rect, self.move_counter, self.move_direction,
+                           self.horizontal_speed, self.screen_width, self.current_hp, self.max_hp)
+    
     def take_damage(self, damage=1):
         """
         Reduce boss health by damage amount.
@@ -141,9 +216,11 @@ class BaseBoss(Enemy, ABC):
         if self.current_hp <= 0:
             self.current_hp = 0
             self.is_alive = False
-            return False
+        
+        if self.telemetry is not None:
+            self.telemetry.record(BOSS_DAMAGE, self.rect.centerx, self.rect.centery, self.current_hp)
             
-        return True
+        return self.is_alive
     
     def get_hp_percentage(self):
         """
@@ -174,40 +251,62 @@ class BaseBoss(Enemy, ABC):
             width: Width of the HP bar
             height: Height of the HP bar
         """
-        background_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(surface, (100, 20, 20), background_rect)
-        
-        hp_percentage = self.get_hp_percentage()
-        hp_width = int(width * hp_percentage)
-        
-        if hp_width > 0:
-            hp_rect = pygame.Rect(x, y, hp_width, height)
-            if hp_percentage > 0.6:
-                color = (50, 200, 50)
-            elif hp_percentage > 0.3:
-                color = (200, 200, 50)
-            else:
-                color = (200, 50, 50)
-            pygame.draw.rect(surface, color, hp_rect)
-        
-        pygame.draw.rect(surface, (255, 255, 255), background_rect, 2)
+        draw_hp_bar(surface, x, y, self.current_hp, self.max_hp, width, height)
         
-        font = pygame.font.Font(None, 24)
-        hp_text = font.render(f"{self.current_hp}/{self.max_hp}", True, (255, 255, 255))
-        text_rect = hp_text.get_rect(center=(x + width // 2, y + height // 2))
-        surface.blit(hp_text, text_rect)
-        
-    def update_shooting(self, dt):
+    def update_shooting(self, dt, target=None):
         """
         Update boss shooting behavior. This method is called by the main game loop.
         
         Args:
             dt: Delta time in milliseconds
+            target: (x, y) position aimed patterns fire at, or None
             
         Returns:
-            EnemyBullet if boss shoots, None otherwise
+            List of Volley objects if the boss has bullet patterns,
+            otherwise EnemyBullet if boss shoots, None otherwise
+        """
+        if self.pattern_engine is None:
+            return self.shoot()
+        return self.pattern_engine.update(dt, self.rect.centerx, self.rect.bottom, target)
+        
+    def capture_state(self, state):
+        """
+        Write the boss's per-tick state into a TickState (see core.tick_state).
+        
+        Args:
+            state: TickState to fill in
+        """
+        state.set_table("boss", 7, (
+            self.rect.x, self.rect.y, self.current_hp, self.is_alive,
+            self.move_counter, self.move_direction,
+            self.last_shot - pygame.time.get_ticks()
+        ))
+        engine = self.pattern_engine
+        if engine is not None:
+            state.set_table("boss_patterns", 3 + len(engine.spin_angles),
+                            (engine.index, engine.timer, engine.volleys_left, *engine.spin_angles))
+    
+    def restore_state(self, state):
+        """
+        Put the boss back into a state written by capture_state().
+        
+        Args:
+            state: TickState to read from
         """
-        return self.shoot()
+        (self.rect.x, self.rect.y, current_hp, is_alive,
+         move_counter, move_direction, last_shot) = state.row("boss")
+        self.current_hp = int(current_hp)
+        self.is_alive = bool(is_alive)
+        self.move_counter = int(move_counter)
+        self.move_direction = int(move_direction)
+        self.last_shot = pygame.time.get_ticks() + int(last_shot)
+        engine = self.pattern_engine
+        patterns = state.row("boss_patterns")
+        if engine is not None and patterns is not None:
+            engine.index = int(patterns[0])
+            engine.timer = patterns[1]
+            engine.volleys_left = int(patterns[2])
+            engine.spin_angles = list(patterns[3:])
         
     @abstractmethod
     def get_boss_name(self):
@@ -9,11 +9,17 @@ class Boss3(BaseBoss):
     - 5 HP (5 bullets to kill)
     - Horizontal movement only
     - Faster shooting than regular enemies
+    - Aimed and spread bullet patterns
     - Boss3.jpeg image from assets/images
     
     This boss introduces players to boss mechanics with moderate challenge.
     """
     
+    BULLET_PATTERNS = (
+        {"kind": "aimed", "count": 3, "spread": 30, "speed": 3, "cooldown": 1200},
+        {"kind": "spread", "count": 5, "spread": 60, "speed": 3, "cooldown": 1500},
+    )
+    
     def __init__(self, screen_width, screen_height):
         x = screen_width // 2
         y = 50
@@ -9,11 +9,18 @@ class Boss4(BaseBoss):
     - 8 HP (8 bullets to kill)
     - Horizontal movement only
     - Faster shooting than Boss3
+    - Ring, aimed burst and wide spread bullet patterns
     - Boss4.jpeg image from assets/images
     
     This boss provides a moderate challenge with increased durability.
     """
     
+    BULLET_PATTERNS = (
+        {"kind": "ring", "count": 12, "speed": 2.5, "cooldown": 1300},
+        {"kind": "aimed", "count": 1, "speed": 4, "bursts": 3, "burst_interval": 120, "cooldown": 900},
+        {"kind": "spread", "count": 7, "spread": 90, "speed": 3, "cooldown": 1300},
+    )
+    
     def __init__(self, screen_width, screen_height):
         # Start boss at top center of screen
         x = screen_width // 2
@@ -9,11 +9,18 @@ class Boss5(BaseBoss):
     - 12 HP (12 bullets to kill)
     - Horizontal movement only
     - Fastest shooting rate
+    - Spiral, double ring and aimed burst bullet patterns
     - Boss5.jpeg image from assets/images
     
     The final challenge with maximum health and aggressive shooting.
     """
     
+    BULLET_PATTERNS = (
+        {"kind": "spiral", "count": 4, "spin": 13, "speed": 3, "bursts": 16, "burst_interval": 90, "cooldown": 700},
+        {"kind": "ring", "count": 20, "speed": 2.5, "bursts": 2, "burst_interval": 250, "cooldown": 900},
+        {"kind": "aimed", "count": 5, "spread": 40, "speed": 3.5, "bursts": 3, "burst_interval": 150, "cooldown": 1000},
+    )
+    
     def __init__(self, screen_width, screen_height):
         # Start boss at top center of screen
         x = screen_width // 2
@@ -1,9 +1,11 @@
 import pygame
+from core.assets import load_image
+from core.bundles import bullet_bundle
 
 class Bullets(pygame.sprite.Sprite):
     def __init__(self, x, y):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load('assets/images/bullet.png')
+        self.image = load_image('assets/images/bullet.png')
         self.rect = self.image.get_rect()
         self.rect.center = [x, y]
         self.speed = 7
@@ -12,3 +14,7 @@ class Bullets(pygame.sprite.Sprite):
         self.rect.y -= self.speed
         if self.rect.bottom < 0:
             self.kill()
+
+    def to_bundle(self):
+        """Return the ECS components describing this bullet"""
+        return bullet_bundle(self.image, self.rect, self.speed)
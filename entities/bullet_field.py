@@ -0,0 +1,111 @@
+"""
+Array-backed store for large numbers of enemy bullets.
+
+Bullets fired by boss patterns are not sprites: their positions and
+velocities live in parallel arrays, a whole volley is appended with a few
+bulk array operations, and every bullet is moved, culled and drawn in a
+single pass.
+"""
+
+from array import array
+from core.assets import load_image
+from core import config
+
+
+class BulletField:
+    """
+    A set of identical bullets stored as parallel position/velocity arrays.
+    """
+
+    def __init__(self, image_path="assets/images/alien_bullet.png",
+                 width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT):
+        """
+        Args:
+            image_path: Image drawn for every bullet
+            width: Arena width; bullets leaving it are removed
+            height: Arena height; bullets leaving it are removed
+        """
+        self.image = load_image(image_path)
+        self.half_width = self.image.get_width() / 2
+        self.half_height = self.image.get_height() / 2
+        self.width = width
+        self.height = height
+        self.xs = array('d')
+        self.ys = array('d')
+        self.dxs = array('d')
+        self.dys = array('d')
+
+    def __len__(self):
+        return len(self.xs)
+
+    def emit(self, volley):
+        """
+        Add every bullet of a volley at once.
+
+        Args:
+            volley: Volley from a bullet pattern
+        """
+        count = len(volley.dxs)
+        self.xs.extend(array('d', (volley.x,)) * count)
+        self.ys.extend(array('d', (volley.y,)) * count)
+        self.dxs.extend(volley.dxs)
+        self.dys.extend(volley.dys)
+
+    def clear(self):
+        """Remove all bullets"""
+        del self.xs[:], self.ys[:], self.dxs[:], self.dys[:]
+
+    def update(self):
+        """Move every bullet and drop those that left the arena"""
+        xs, ys, dxs, dys = self.xs, self.ys, self.dxs, self.dys
+        min_x = -self.half_width
+        max_x = self.width + self.half_width
+        min_y = -self.half_height
+        max_y = self.height + self.half_height
+        kept = 0
+        for i in range(len(xs)):
+            x = xs[i] + dxs[i]
+            y = ys[i] + dys[i]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                xs[kept] = x
+                ys[kept] = y
+                dxs[kept] = dxs[i]
+                dys[kept] = dys[i]
+                kept += 1
+        if kept < len(xs):
+            del xs[kept:], ys[kept:], dxs[kept:], dys[kept:]
+
+    def collide_rect(self, rect, dokill=True):
+        """
+        Check whether any bullet overlaps a rect.
+
+        Args:
+            rect: pygame Rect to test against (e.g. the player's rect)
+            dokill: Remove the bullets that hit
+
+        Returns:
+            Number of bullets that hit
+        """
+        left = rect.left - self.half_width
+        right = rect.right + self.half_width
+        top = rect.top - self.half_height
+        bottom = rect.bottom + self.half_height
+        xs, ys = self.xs, self.ys
+        hits = [
+            i for i in range(len(xs))
+            if top < ys[i] < bottom and left < xs[i] < right
+        ]
+        if dokill:
+            for i in reversed(hits):
+                del self.xs[i], self.ys[i], self.dxs[i], self.dys[i]
+        return len(hits)
+
+    def positions(self):
+        """Top-left draw positions of every bullet"""
+        half_width, half_height = self.half_width, self.half_height
+        return [(x - half_width, y - half_height) for x, y in zip(self.xs, self.ys)]
+
+    def draw(self, surface):
+        """Draw every bullet with one batched blit call"""
+        image = self.image
+        surface.blits([(image, position) for position in self.positions()], False)
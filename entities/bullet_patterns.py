@@ -0,0 +1,222 @@
+"""
+Data-driven bullet patterns for bosses.
+
+A boss describes its attacks as a sequence of plain dicts, for example:
+
+    {"kind": "ring", "count": 16, "speed": 2.5, "cooldown": 1400}
+
+Supported kinds:
+- "spread": count bullets fanned over `spread` degrees around `angle`
+- "ring":   count bullets evenly spaced over a full circle
+- "spiral": a ring whose base angle turns by `spin` degrees every volley
+- "aimed":  a spread whose center points at the player
+
+Any pattern can fire `bursts` volleys, `burst_interval` ms apart, before
+waiting `cooldown` ms and moving on to the next pattern.
+
+Each pattern precomputes its velocity tables (dx and dy per bullet, already
+multiplied by speed) for every quantized base angle, so firing a volley is
+a lookup that hands whole arrays to the BulletField.
+"""
+
+from array import array
+import math
+
+# Base angles are quantized to this many steps around the circle
+ANGLE_STEPS = 256
+
+PATTERN_KINDS = ("spread", "ring", "spiral", "aimed")
+
+
+class Volley:
+    """
+    One burst of bullets: a shared origin and a precomputed velocity table.
+    """
+
+    __slots__ = ("x", "y", "dxs", "dys")
+
+    def __init__(self, x, y, dxs, dys):
+        """
+        Args:
+            x: Origin x position
+            y: Origin y position
+            dxs: array('d') of horizontal velocities
+            dys: array('d') of vertical velocities
+        """
+        self.x = x
+        self.y = y
+        self.dxs = dxs
+        self.dys = dys
+
+    def __len__(self):
+        return len(self.dxs)
+
+
+class BulletPattern:
+    """
+    A compiled bullet pattern with cached velocity tables.
+    """
+
+    def __init__(self, kind, count=1, speed=3.0, spread=0.0, angle=90.0, spin=0.0,
+                 bursts=1, burst_interval=100, cooldown=1000):
+        """
+        Args:
+            kind: One of PATTERN_KINDS
+            count: Bullets per volley
+            speed: Bullet speed in pixels per tick
+            spread: Fan width in degrees (spread and aimed patterns)
+            angle: Base angle in degrees, 90 points straight down
+            spin: Degrees the base angle turns per volley (spiral patterns)
+            bursts: Volleys fired in a row before the cooldown
+            burst_interval: Milliseconds between volleys of a burst
+            cooldown: Milliseconds after the last volley before the next pattern
+        """
+        if kind not in PATTERN_KINDS:
+            raise ValueError(f"Unknown bullet pattern kind {kind!r}, expected one of {', '.join(PATTERN_KINDS)}")
+        if count < 1 or bursts < 1:
+            raise ValueError("Bullet patterns need count >= 1 and bursts >= 1")
+        if cooldown <= 0 or burst_interval < 0:
+            raise ValueError("Bullet patterns need cooldown > 0 and burst_interval >= 0")
+        self.kind = kind
+        self.count = count
+        self.speed = speed
+        self.spread = spread
+        self.angle = angle
+        self.spin = spin
+        self.bursts = bursts
+        self.burst_interval = burst_interval
+        self.cooldown = cooldown
+        self.offsets = self._compute_offsets()
+        self._tables = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a pattern from its dict description"""
+        return cls(**data)
+
+    def _compute_offsets(self):
+        """Angular offset in degrees of every bullet relative to the base angle"""
+        if self.kind in ("ring", "spiral"):
+            step = 360.0 / self.count
+            return tuple(i * step for i in range(self.count))
+        if self.count == 1:
+            return (0.0,)
+        step = self.spread / (self.count - 1)
+        return tuple(-self.spread / 2 + i * step for i in range(self.count))
+
+    def table(self, angle_index):
+        """
+        Get the velocity table for a quantized base angle.
+
+        Args:
+            angle_index: Base angle in 1/ANGLE_STEPS turns
+
+        Returns:
+            Tuple of (dxs, dys) arrays
+        """
+        angle_index %= ANGLE_STEPS
+        table = self._tables.get(angle_index)
+        if table is None:
+            base = angle_index * 2 * math.pi / ANGLE_STEPS
+            radians = [base + math.radians(offset) for offset in self.offsets]
+            table = (
+                array('d', (math.cos(r) * self.speed for r in radians)),
+                array('d', (math.sin(r) * self.speed for r in radians))
+            )
+            self._tables[angle_index] = table
+        return table
+
+    def volley(self, x, y, angle):
+        """
+        Create a volley fired from (x, y) around a base angle.
+
+        Args:
+            x: Origin x position
+            y: Origin y position
+            angle: Base angle in degrees
+        """
+        dxs, dys = self.table(round(angle * ANGLE_STEPS / 360.0))
+        return Volley(x, y, dxs, dys)
+
+
+_compiled = {}
+
+
+def compile_patterns(specs):
+    """
+    Compile pattern dicts into BulletPattern objects.
+
+    Compiled patterns (and their velocity tables) are cached and shared by
+    every boss using the same description.
+
+    Args:
+        specs: Sequence of pattern dicts
+
+    Returns:
+        Tuple of BulletPattern objects
+    """
+    key = tuple(tuple(sorted(spec.items())) for spec in specs)
+    patterns = _compiled.get(key)
+    if patterns is None:
+        patterns = tuple(BulletPattern.from_dict(spec) for spec in specs)
+        _compiled[key] = patterns
+    return patterns
+
+
+class PatternEngine:
+    """
+    Plays a boss's patterns in order, one after another, in a loop.
+    """
+
+    def __init__(self, specs, initial_delay=1000):
+        """
+        Args:
+            specs: Sequence of pattern dicts
+            initial_delay: Milliseconds before the first volley
+        """
+        self.patterns = compile_patterns(specs)
+        self.initial_delay = initial_delay
+        self.reset()
+
+    def reset(self):
+        """Restart from the first pattern"""
+        self.index = 0
+        self.timer = self.initial_delay
+        self.volleys_left = self.patterns[0].bursts
+        self.spin_angles = [pattern.angle for pattern in self.patterns]
+
+    def _base_angle(self, pattern, x, y, target):
+        if pattern.kind == "aimed" and target is not None:
+            return math.degrees(math.atan2(target[1] - y, target[0] - x))
+        if pattern.kind == "spiral":
+            angle = self.spin_angles[self.index]
+            self.spin_angles[self.index] = (angle + pattern.spin) % 360.0
+            return angle
+        return pattern.angle
+
+    def update(self, dt, x, y, target=None):
+        """
+        Advance the pattern clock and fire every volley that came due.
+
+        Args:
+            dt: Delta time in milliseconds
+            x: Muzzle x position
+            y: Muzzle y position
+            target: (x, y) the aimed patterns fire at, or None
+
+        Returns:
+            List of Volley objects (empty if nothing fired)
+        """
+        volleys = []
+        self.timer -= dt
+        while self.timer <= 0:
+            pattern = self.patterns[self.index]
+            volleys.append(pattern.volley(x, y, self._base_angle(pattern, x, y, target)))
+            self.volleys_left -= 1
+            if self.volleys_left > 0:
+                self.timer += pattern.burst_interval
+            else:
+                self.timer += pattern.cooldown
+                self.index = (self.index + 1) % len(self.patterns)
+                self.volleys_left = self.patterns[self.index].bursts
+        return volleys
@@ -1,43 +1,82 @@
 import pygame
 import random
+from core.assets import load_image
+from core.bundles import enemy_bundle
 from .enemyBullets import EnemyBullet
+from .zigzag import zigzag_path
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, screen_width):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load(f"assets/images/alien{random.randint(1, 5)}.png")
+        self.image = self._load_image()
         self.rect = self.image.get_rect()
+        self.screen_width = screen_width
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Put the enemy back in its freshly spawned state at (x, y), keeping its image"""
         self.rect.center = [x, y]
         self.move_counter = 0
         self.move_direction = 1
         self.speed = 1
-        self.screen_width = screen_width
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = 0  # Game time, kept by the EnemyFireScheduler
         self.shoot_delay = random.randint(1000, 3000) 
         self.shoot_chance = 0.002  
+        # Zigzag path from this spawn, built on the first move (after the level sets the speed)
+        self.path = None
+        self.path_y = y
+        self.age = 0
+        self._step = 0
+        self._segment_end = 0
+
+    def _load_image(self):
+        """Pick one of the alien images at random"""
+        return load_image(f"assets/images/alien{random.randint(1, 5)}.png")
 
     def update(self):
-        
-        self.rect.x += self.move_direction * self.speed
-        self.move_counter += 1
-        
-        if abs(self.move_counter) > 75:
-            self.move_direction *= -1
-            self.move_counter *= self.move_direction
-            self.rect.y += 20 
-        
-        if self.rect.left < 0:
-            self.rect.left = 0
-            self.move_direction = 1
-        if self.rect.right > self.screen_width:
-            self.rect.right = self.screen_width
-            self.move_direction = -1
-
-    def shoot(self):
-        """Randomly shoot bullets to keep the game easy to play"""
-        now = pygame.time.get_ticks()
-        if now - self.last_shot > self.shoot_delay and random.random() < self.shoot_chance:
-            self.last_shot = now
-            self.shoot_delay = random.randint(1000, 3000)
-            return EnemyBullet(self.rect.centerx, self.rect.bottom)
-        return None
\ No newline at end of file
+        """Move one tick along the zigzag path"""
+        age = self.age + 1
+        if age < self._segment_end:
+            # Inside a straight stretch of the path nothing turns or bounces
+            self.rect.x += self._step
+            self.move_counter += 1
+            self.age = age
+        else:
+            self.seek(age)
+
+    def start_path(self):
+        """Start a new zigzag path from the current position, counter, direction and speed"""
+        self.path = zigzag_path(self.rect.x, self.move_counter, self.move_direction, self.speed,
+                                self.screen_width - self.rect.width)
+        self.path_y = self.rect.y
+        self.age = 0
+        self._segment_end = 0
+
+    def seek(self, age):
+        """
+        Jump to any tick of the path without simulating the ticks in between.
+
+        The path moves 1 speed per tick, turns around and drops 20 px after
+        75 moves and bounces off the screen edges (see entities.zigzag).
+
+        Args:
+            age: Ticks since the path started
+        """
+        if self.path is None:
+            self.start_path()
+        x, dy, self.move_counter, self.move_direction, self._step, self._segment_end = self.path.segment_at(age)
+        self.rect.x = x
+        self.rect.y = self.path_y + dy
+        self.age = age
+
+    def fire(self, now):
+        """Shoot a bullet at game time now and start a new random shoot delay"""
+        self.last_shot = now
+        self.shoot_delay = random.randint(1000, 3000)
+        return EnemyBullet(self.rect.centerx, self.rect.bottom)
+
+    def to_bundle(self):
+        """Return the ECS components describing this enemy's current state"""
+        if self.path is None:
+            self.start_path()
+        return enemy_bundle(self.image, self.rect, self.path, self.path_y, self.age)
@@ -1,15 +1,21 @@
 import pygame
+from core.assets import load_image
+from core.config import SCREEN_HEIGHT
+from core.bundles import enemy_bullet_bundle
 
 class EnemyBullet(pygame.sprite.Sprite):
     def __init__(self, x, y):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load("assets/images/alien_bullet.png")
+        self.image = load_image("assets/images/alien_bullet.png")
         self.rect = self.image.get_rect()
         self.rect.center = [x, y]
         self.speed = 3
 
     def update(self):
         self.rect.y += self.speed
-        if self.rect.top > 800:
+        if self.rect.top > SCREEN_HEIGHT:
             self.kill()
-			
\ No newline at end of file
+
+    def to_bundle(self):
+        """Return the ECS components describing this bullet"""
+        return enemy_bullet_bundle(self.image, self.rect, self.speed, SCREEN_HEIGHT)
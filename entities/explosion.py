@@ -1,15 +1,26 @@
 import pygame
 import random
+from core.assets import load_image
+from core.bundles import explosion_bundle
+
+_frames = None
+
+
+def explosion_frames():
+    """Return the animation frames shared by every explosion"""
+    global _frames
+    # Rebuilt when the image cache has been cleared (new display)
+    first = load_image("assets/images/exp1.png")
+    if _frames is None or _frames[0] is not first:
+        _frames = (first,) + tuple(load_image(f"assets/images/exp{i}.png") for i in range(2, 6))
+    return _frames
+
 
 class Explosion(pygame.sprite.Sprite):
     def __init__(self, x, y):
         pygame.sprite.Sprite.__init__(self)
-        self.explosion_images = []
-        
-        
-        for i in range(1, 6):
-            img = pygame.image.load(f"assets/images/exp{i}.png")
-            self.explosion_images.append(img)
+        # One tuple for all explosions, not a list of five surfaces each
+        self.explosion_images = explosion_frames()
         
         self.index = 0
         self.image = self.explosion_images[self.index]
@@ -18,8 +29,9 @@ class Explosion(pygame.sprite.Sprite):
         self.counter = 0
         self.animation_speed = 4  
 
-    def update(self):
-        self.counter += 1
+    def update(self, steps=1):
+        # steps > 1 skips animation frames (lower quality, shorter explosion)
+        self.counter += steps
         
         if self.counter >= self.animation_speed and self.index < len(self.explosion_images) - 1:
             self.counter = 0
@@ -28,3 +40,8 @@ class Explosion(pygame.sprite.Sprite):
         
         if self.index >= len(self.explosion_images) - 1 and self.counter >= self.animation_speed:
             self.kill()
+
+    def to_bundle(self):
+        """Return the ECS components describing this explosion's current state"""
+        return explosion_bundle(self.explosion_images, self.index, self.counter,
+                                self.animation_speed, self.rect)
@@ -1,28 +1,46 @@
 import pygame
+from core.assets import load_image
+from core.bundles import player_bundle
 from .bullet import Bullets
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y, screen_width):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load('assets/images/spaceship.png')
+        self.image = load_image('assets/images/spaceship.png')
         self.rect = self.image.get_rect()
-        self.rect.center = [x, y]
         self.speed = 5
         self.screen_width = screen_width
-        self.last_shot = pygame.time.get_ticks()
         self.shoot_delay = 300  # milliseconds between shots
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Put the player back at (x, y) as if newly created"""
+        self.rect.center = [x, y]
+        self.last_shot = pygame.time.get_ticks()
         
     def update(self):
         # Get key presses
         keys = pygame.key.get_pressed()
+        direction = 0
         
         # Move left
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.rect.x -= self.speed
+            direction -= 1
             
         # Move right
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.rect.x += self.speed
+            direction += 1
+        
+        self.move(direction)
+    
+    def move(self, direction):
+        """
+        Move one tick's worth to the left (-1), right (1) or not at all (0).
+        
+        Used with keyboard input by update() and with network input by the
+        co-op server and the client's prediction.
+        """
+        self.rect.x += direction * self.speed
             
         # Keep player on screen
         if self.rect.left < 0:
@@ -37,3 +55,7 @@ class Player(pygame.sprite.Sprite):
             # Play shooting sound effect
             return Bullets(self.rect.centerx, self.rect.top)
         return None
+
+    def to_bundle(self):
+        """Return the ECS components describing this ship's current state"""
+        return player_bundle(self.image, self.rect, self.speed, self.screen_width)
@@ -0,0 +1,172 @@
+"""
+Closed-form zigzag motion of formation enemies.
+
+An enemy moves sideways every tick, turns around and drops when its move
+counter passes the limit, and bounces off the arena edges. Everything
+about that path follows from the state it starts in, so a ZigzagPath
+works out where an enemy is at any tick without stepping through the
+ticks before it:
+- The path is split into straight segments between events (a turn or an
+  edge bounce). Within a segment the position is start + step * ticks
+- Enemies only ever reach a few distinct (x, counter, direction) states at
+  the start of a segment, so the segments soon repeat. The path records
+  them up to the first repeat; later ticks are folded back into that cycle
+  and only the drop keeps growing
+- Positions are rounded the way pygame.Rect rounds rect.x += speed, so a
+  path matches Enemy.update() stepping tick by tick, fractional speeds
+  and edge clamps included
+
+Seeking is a division and a binary search over a handful of segments,
+whatever the tick.
+"""
+
+from bisect import bisect_right
+import math
+
+# Paths shared by enemies that start in the same state (a formation column)
+_path_cache = {}
+_PATH_CACHE_SIZE = 512
+
+
+def zigzag_path(x, counter, direction, speed, max_x, limit=75, drop=20):
+    """
+    Return the shared path for a start state, building it on first use.
+
+    Args:
+        x: Start left edge
+        counter: Start move counter
+        direction: Start direction (1 right, -1 left)
+        speed: Horizontal speed in pixels per tick
+        max_x: Largest left edge inside the arena (screen width - enemy width)
+        limit: Counter value past which the enemy turns around
+        drop: Pixels dropped on every turn
+
+    Returns:
+        ZigzagPath
+    """
+    key = (x, counter, direction, speed, max_x, limit, drop)
+    path = _path_cache.get(key)
+    if path is None:
+        if len(_path_cache) >= _PATH_CACHE_SIZE:
+            _path_cache.clear()
+        path = _path_cache[key] = ZigzagPath(x, counter, direction, speed, max_x, limit, drop)
+    return path
+
+
+def _edge_ticks(x, step, offset, max_x):
+    """
+    Ticks until a mover leaves the arena on either side.
+
+    Args:
+        x: Current left edge
+        step: Rounded move per tick
+        offset: Unrounded move per tick (direction * speed)
+        max_x: Largest left edge inside the arena
+
+    Returns:
+        Tuple of (left, right): the smallest k >= 1 such that the k-th move
+        ends past that edge, or None if it never does
+    """
+    # pygame rounds halves away from zero, so a move ending at -0.5 already lands on -1
+    threshold = -0.5 - offset
+    if step < 0:
+        left = max(0, math.ceil((x - threshold) / -step)) + 1
+    else:
+        left = 1 if x <= threshold else None
+    if step > 0:
+        right = max(1, (max_x - x) // step + 1)
+    else:
+        right = 1 if x + step > max_x else None
+    return left, right
+
+
+class ZigzagPath:
+    """
+    The position of a zigzagging enemy as a function of its age in ticks.
+    """
+
+    def __init__(self, x, counter, direction, speed, max_x, limit=75, drop=20):
+        """
+        Work out the segments of the path up to the first repeat.
+
+        Args:
+            x: Start left edge
+            counter: Start move counter
+            direction: Start direction (1 right, -1 left)
+            speed: Horizontal speed in pixels per tick
+            max_x: Largest left edge inside the arena (screen width - enemy width)
+            limit: Counter value past which the enemy turns around
+            drop: Pixels dropped on every turn
+        """
+        steps = {1: math.floor(speed + 0.5), -1: math.floor(0.5 - speed)}
+        # Segment starts: tick, x, y offset, counter, direction
+        self.starts = []
+        self.segments = []
+        seen = {}
+        tick = dy = 0
+        while (x, counter, direction) not in seen:
+            seen[(x, counter, direction)] = len(self.starts)
+            self.starts.append(tick)
+            self.segments.append((x, dy, counter, direction, steps[direction]))
+
+            step = steps[direction]
+            # Next turn: the counter goes past the limit on either side
+            ticks = 1 if abs(counter + 1) > limit else limit + 1 - counter
+            left, right = _edge_ticks(x, step, direction * speed, max_x)
+            for edge in (left, right):
+                if edge is not None and edge < ticks:
+                    ticks = edge
+
+            tick += ticks
+            x += step * ticks
+            counter += ticks
+            if abs(counter) > limit:
+                direction = -direction
+                counter *= direction
+                dy += drop
+            if ticks == left:
+                x = 0
+                direction = 1
+            if x > max_x:
+                x = max_x
+                direction = -1
+
+        first = seen[(x, counter, direction)]
+        self.cycle_start = self.starts[first]
+        self.period = tick - self.cycle_start
+        self.cycle_drop = dy - self.segments[first][1]
+
+    def at(self, age):
+        """
+        Evaluate the path.
+
+        Args:
+            age: Ticks since the start state (0 is the start state itself)
+
+        Returns:
+            Tuple of (x, y offset, counter, direction) after that many ticks
+        """
+        return self.segment_at(age)[:4]
+
+    def segment_at(self, age):
+        """
+        Evaluate the path and the straight segment it is on.
+
+        Args:
+            age: Ticks since the start state
+
+        Returns:
+            Tuple of (x, y offset, counter, direction, step, end): until age
+            end, each tick only adds step to x and 1 to the counter
+        """
+        base = extra = 0
+        if age >= self.cycle_start + self.period:
+            cycles = (age - self.cycle_start) // self.period
+            base = cycles * self.period
+            extra = cycles * self.cycle_drop
+        folded = age - base
+        index = bisect_right(self.starts, folded) - 1
+        x, dy, counter, direction, step = self.segments[index]
+        ticks = folded - self.starts[index]
+        end = self.starts[index + 1] if index + 1 < len(self.starts) else self.cycle_start + self.period
+        return x + step * ticks, dy + extra, counter + ticks, direction, step, base + end
@@ -4,5 +4,9 @@ from .level_2 import Level2
 from .level_3 import Level3
 from .level_4 import Level4
 from .level_5 import Level5
+from .level_file import FileLevel, LevelFileError, load_level_files
 
-__all__ = ['BaseLevel', 'Level1', 'Level2', 'Level3', 'Level4', 'Level5']
+__all__ = [
+    'BaseLevel', 'Level1', 'Level2', 'Level3', 'Level4', 'Level5',
+    'FileLevel', 'LevelFileError', 'load_level_files'
+]
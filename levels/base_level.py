@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections import deque
 import pygame
 from entities.enemy import Enemy
+from core.sprite_group import FastGroup
+from core import config
+from managers import telemetry as events
 
 
 class BaseLevel(ABC):
@@ -13,6 +17,7 @@ class BaseLevel(ABC):
     - Enemy speed
     - Enemy behavior (shooting frequency)
     - Level layout and patterns
+    - Enemy waves (get_waves), spawned over time within a live-enemy budget
     
     Design Principles:
     - Reusability: Common level logic is implemented once in base class
@@ -21,6 +26,10 @@ class BaseLevel(ABC):
     - Encapsulation: Level state and logic are encapsulated in the class
     """
     
+    # Streaming limits: enemies alive at once, and enemies created per tick
+    max_live_enemies = 40
+    max_spawns_per_tick = 8
+    
     def __init__(self, screen_width, screen_height, level_number):
         """
         Initialize the base level.
@@ -33,17 +42,32 @@ class BaseLevel(ABC):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.level_number = level_number
-        self.enemy_group = pygame.sprite.Group()
+        self.enemy_group = FastGroup()
         self.is_complete = False
         self.total_enemies = 0
         self.enemies_killed = 0
         
+        # Wave streaming: (start_time_ms, x, y) entries not spawned yet
+        self.spawn_queue = deque()
+        self.spawned = []
+        self.level_time = 0
+        
+        # Restart snapshot: the initial spawn timeline (taken once), plus the
+        # enemies and boss created on earlier runs, reused on later ones
+        self._initial_spawn_queue = None
+        self._enemy_pool = []
+        self._pool_index = 0
+        self._boss_instance = None
+        
         # Boss support
         self.has_boss = self.level_has_boss()
         self.boss = None
         self.boss_spawned = False
         self.enemies_phase_complete = False
         
+        # Telemetry sink for kills and boss events (set by the LevelManager)
+        self.telemetry = None
+        
     @abstractmethod
     def get_level_name(self):
         """
@@ -76,6 +100,21 @@ class BaseLevel(ABC):
         """
         pass
     
+    def get_level_id(self):
+        """
+        Return an identifier of the level that does not change when levels
+        are added or reordered, for keying stored results.
+        Can be overridden by subclasses (default: the class name).
+        """
+        return type(self).__name__
+    
+    def get_description(self):
+        """
+        Return a one-line description of the level for menus.
+        Can be overridden by subclasses.
+        """
+        return f"{self.get_enemy_count()} enemies"
+    
     def level_has_boss(self):
         """
         Return whether this level has a boss.
@@ -110,20 +149,68 @@ class BaseLevel(ABC):
         enemy.shoot_chance *= self.get_enemy_shoot_chance_multiplier()
         return enemy
     
+    def get_waves(self):
+        """
+        Return the enemy waves of this level.
+        Can be overridden by subclasses (default: one wave at time 0 made of
+        get_enemy_positions()).
+        
+        Returns:
+            List of (start_time_ms, positions) tuples in start order
+        """
+        return [(0, self.get_enemy_positions())]
+    
+    def get_definition(self):
+        """
+        Return everything that defines this level's layout, as plain JSON data.
+        Used to tell whether a cached level preview is still current.
+        
+        Returns:
+            Dictionary of class name, arena size, waves, multipliers and boss
+        """
+        boss = None
+        if self.has_boss:
+            # Kept for the level's first run, which restarts it instead of creating one
+            if self._boss_instance is None:
+                self._boss_instance = self.create_boss()
+            boss = type(self._boss_instance).__name__
+        return {
+            'class': type(self).__name__,
+            'arena': [self.screen_width, self.screen_height],
+            'waves': [[start, [list(position) for position in positions]]
+                      for start, positions in self.get_waves()],
+            'speed_multiplier': self.get_enemy_speed_multiplier(),
+            'shoot_chance_multiplier': self.get_enemy_shoot_chance_multiplier(),
+            'has_boss': self.has_boss,
+            'boss': boss,
+        }
+    
     def spawn_enemies(self):
         """
-        Spawn all enemies for this level based on the pattern defined by subclass.
-        This is a template method that calls get_enemy_positions() which must be
-        implemented by subclasses.
+        Prepare the level's enemy timeline based on the waves defined by subclass.
+        This is a template method that calls get_waves() (by default built from
+        get_enemy_positions(), which must be implemented by subclasses).
+        
+        Enemies are not created here: update() creates them as their wave
+        comes due, a few per tick and never more than max_live_enemies alive.
+        
+        The timeline is computed on the first call only. Later calls restore
+        it from that snapshot and reuse the enemy objects of the previous run,
+        so restarting a level costs no level load.
         """
         self.enemy_group.empty()
-        positions = self.get_enemy_positions()
+        if self._initial_spawn_queue is None:
+            self._initial_spawn_queue = tuple(
+                (start, x, y)
+                for start, positions in self.get_waves()
+                for x, y in positions
+            )
+        self.spawn_queue = deque(self._initial_spawn_queue)
+        self._pool_index = 0
+        self.spawned = []
+        self.level_time = 0
         
-        for x, y in positions:
-            enemy = self.create_enemy(x, y)
-            self.enemy_group.add(enemy)
-        
-        self.total_enemies = len(positions)
+        self.total_enemies = len(self.spawn_queue)
         self.enemies_killed = 0
         self.is_complete = False
         
@@ -143,20 +230,93 @@ class BaseLevel(ABC):
         """
         pass
     
-    def update(self):
+    def spawn_due_enemies(self):
+        """
+        Create the enemies whose wave has started, within the spawn budget.
+        If the field is empty, the next wave is brought forward.
+        """
+        queue = self.spawn_queue
+        if queue and len(self.enemy_group) == 0 and queue[0][0] > self.level_time:
+            self.level_time = queue[0][0]
+        
+        budget = min(self.max_spawns_per_tick, self.max_live_enemies - len(self.enemy_group))
+        while budget > 0 and queue and queue[0][0] <= self.level_time:
+            _, x, y = queue.popleft()
+            enemy = self._acquire_enemy(x, y)
+            self.enemy_group.add(enemy)
+            self.spawned.append(enemy)
+            budget -= 1
+    
+    def _acquire_enemy(self, x, y):
+        """
+        Get an enemy for a spawn, reusing one from a previous run if possible.
+        
+        Args:
+            x: X position for the enemy
+            y: Y position for the enemy
+            
+        Returns:
+            Enemy instance configured for this level
+        """
+        if self._pool_index < len(self._enemy_pool):
+            enemy = self._enemy_pool[self._pool_index]
+            enemy.reset(x, y)
+            enemy.speed *= self.get_enemy_speed_multiplier()
+            enemy.shoot_chance *= self.get_enemy_shoot_chance_multiplier()
+        else:
+            enemy = self.create_enemy(x, y)
+            self._enemy_pool.append(enemy)
+        self._pool_index += 1
+        return enemy
+    
+    def _acquire_boss(self):
+        """Get the boss, restarting the one from a previous run if possible"""
+        if self._boss_instance is None:
+            self._boss_instance = self.create_boss()
+        else:
+            self._boss_instance.restart()
+        boss = self._boss_instance
+        if boss is not None:
+            boss.telemetry = self.telemetry
+            if self.telemetry is not None:
+                self.telemetry.record(events.BOSS_SPAWN, boss.rect.centerx, boss.rect.centery, boss.max_hp)
+        return boss
+    
+    def take_spawned(self):
+        """
+        Hand over the enemies created since the last call.
+        
+        Returns:
+            List of newly spawned Enemy instances
+        """
+        spawned = self.spawned
+        self.spawned = []
+        return spawned
+    
+    def get_pending_count(self):
+        """Return the number of enemies still waiting to spawn"""
+        return len(self.spawn_queue)
+    
+    def update(self, dt=None):
         """
         Update the level state.
-        Handles both regular enemies and boss encounters.
+        Handles wave spawning, regular enemies and boss encounters.
+        
+        Args:
+            dt: Delta time in milliseconds (one frame at config.FPS if None)
         """
+        self.level_time += 1000 / config.FPS if dt is None else dt
+        self.spawn_due_enemies()
+        
         self.enemy_group.update()
         
         # Check if all regular enemies are defeated
-        if len(self.enemy_group) == 0 and not self.enemies_phase_complete:
+        if len(self.enemy_group) == 0 and not self.spawn_queue and not self.enemies_phase_complete:
             self.enemies_phase_complete = True
             
             # If this level has a boss, spawn it
             if self.has_boss and not self.boss_spawned:
-                self.boss = self.create_boss()
+                self.boss = self._acquire_boss()
                 self.boss_spawned = True
             elif not self.has_boss:
                 # No boss, level is complete
@@ -169,6 +329,72 @@ class BaseLevel(ABC):
             # Boss is defeated, level is complete
             self.is_complete = True
     
+    def capture_state(self, state):
+        """
+        Write the level's per-tick state into a TickState (see core.tick_state).
+        
+        Enemies are recorded by their index in the spawn order, so restoring
+        reuses the same objects instead of creating new ones.
+        
+        Args:
+            state: TickState to fill in
+        """
+        state.set_table("level", 6, (
+            self.level_time, self.enemies_killed, self._pool_index,
+            self.is_complete, self.boss_spawned, self.enemies_phase_complete
+        ))
+        enemy_group = self.enemy_group
+        rows = []
+        for enemy in self._enemy_pool[:self._pool_index]:
+            rows.extend((
+                enemy in enemy_group, enemy.rect.x, enemy.rect.y,
+                enemy.move_counter, enemy.move_direction, enemy.speed,
+                enemy.shoot_chance, enemy.last_shot, enemy.shoot_delay, enemy.age
+            ))
+        state.set_table("enemies", 10, rows)
+        if self.boss is not None:
+            self.boss.capture_state(state)
+    
+    def restore_state(self, state):
+        """
+        Put the level back into a state written by capture_state().
+        
+        Args:
+            state: TickState to read from
+            
+        Returns:
+            List of the enemies alive in the restored state
+        """
+        (self.level_time, enemies_killed, pool_index,
+         is_complete, boss_spawned, enemies_phase_complete) = state.row("level")
+        self.enemies_killed = int(enemies_killed)
+        self._pool_index = int(pool_index)
+        self.is_complete = bool(is_complete)
+        self.boss_spawned = bool(boss_spawned)
+        self.enemies_phase_complete = bool(enemies_phase_complete)
+        self.spawn_queue = deque(self._initial_spawn_queue[self._pool_index:])
+        self.spawned = []
+        
+        self.enemy_group.empty()
+        alive = []
+        for enemy, row in zip(self._enemy_pool, state.rows("enemies")):
+            (is_alive, enemy.rect.x, enemy.rect.y, move_counter, move_direction,
+             enemy.speed, enemy.shoot_chance, last_shot, shoot_delay, age) = row
+            enemy.move_counter = int(move_counter)
+            enemy.move_direction = int(move_direction)
+            # An enemy keeps its path for the whole run: place it by age
+            enemy.seek(int(age))
+            enemy.last_shot = int(last_shot)
+            enemy.shoot_delay = int(shoot_delay)
+            if is_alive:
+                alive.append(enemy)
+        self.enemy_group.add(alive)
+        
+        self.boss = self._boss_instance if self.boss_spawned else None
+        if self.boss is not None:
+            self.boss.restore_state(state)
+        return alive
+    
     def get_boss(self):
         """
         Get the current boss instance.
@@ -178,12 +404,18 @@ class BaseLevel(ABC):
         """
         return self.boss if self.boss_spawned else None
     
-    def enemy_killed(self):
+    def enemy_killed(self, enemy=None):
         """
         Called when an enemy is killed.
         Tracks the number of enemies killed for stats/scoring.
+        
+        Args:
+            enemy: The enemy that was killed (optional, for telemetry)
         """
         self.enemies_killed += 1
+        if self.telemetry is not None:
+            x, y = enemy.rect.center if enemy is not None else (0, 0)
+            self.telemetry.record(events.KILL, x, y, self.enemies_killed)
     
     def boss_killed(self):
         """
@@ -210,6 +442,15 @@ class BaseLevel(ABC):
         """
         return self.is_complete
     
+    def release(self):
+        """
+        Drop the live enemies and the boss when another level is loaded.
+        The enemy pool and restart snapshot are kept for the next run.
+        """
+        self.enemy_group.empty()
+        self.spawned = []
+        self.boss = None
+    
     def reset(self):
         """
         Reset the level to its initial state.
@@ -228,6 +469,7 @@ class BaseLevel(ABC):
         return {
             'level_number': self.level_number,
             'level_name': self.get_level_name(),
+            'description': self.get_description(),
             'total_enemies': self.total_enemies,
             'enemies_killed': self.enemies_killed,
             'is_complete': self.is_complete,
@@ -20,6 +20,10 @@ class Level1(BaseLevel):
         """Return the name of Level 1"""
         return "First Contact"
     
+    def get_description(self):
+        """Return the Level 1 description shown in the level select menu"""
+        return "Beginner - 4 enemies, normal speed"
+    
     def get_enemy_count(self):
         """Level 1 has 4 enemies"""
         return 4
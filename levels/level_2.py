@@ -20,6 +20,10 @@ class Level2(BaseLevel):
         """Return the name of Level 2"""
         return "Escalation"
     
+    def get_description(self):
+        """Return the Level 2 description shown in the level select menu"""
+        return "Intermediate - 8 enemies, faster movement"
+    
     def get_enemy_count(self):
         """Level 2 has 8 enemies"""
         return 8
@@ -21,6 +21,10 @@ class Level3(BaseLevel):
         """Return the name of Level 3"""
         return "Invasion Force"
     
+    def get_description(self):
+        """Return the Level 3 description shown in the level select menu"""
+        return "Advanced - 10 enemies, rapid fire"
+    
     def get_enemy_count(self):
         """Level 3 has 10 enemies"""
         return 10
@@ -21,6 +21,10 @@ class Level4(BaseLevel):
         """Return the name of Level 4"""
         return "Massive Assault"
     
+    def get_description(self):
+        """Return the Level 4 description shown in the level select menu"""
+        return "Expert - 14 enemies, two wide rows"
+    
     def get_enemy_count(self):
         """Level 4 has 14 enemies"""
         return 14
@@ -21,6 +21,10 @@ class Level5(BaseLevel):
         """Return the name of Level 5"""
         return "Final Confrontation"
     
+    def get_description(self):
+        """Return the Level 5 description shown in the level select menu"""
+        return "Master - 18 enemies, ultimate challenge"
+    
     def get_enemy_count(self):
         """Level 5 has 18 enemies"""
         return 18
@@ -0,0 +1,291 @@
+"""
+Declarative level files for Galaxy Shooter
+
+A level can be described by a small JSON file instead of a Python class:
+
+    {
+        "name": "Swarm Front",
+        "description": "Veteran - 21 enemies in a V, War Machine boss",
+        "speed_multiplier": 1.8,
+        "shoot_chance_multiplier": 2.5,
+        "boss": "Boss4",
+        "waves": [
+            {"at": 0, "formation": {"type": "grid", "rows": 2, "columns": 6, "spacing": 85, "top": 60}},
+            {"at": 4000, "formation": {"type": "v", "count": 9, "spacing": 55, "top": 60}}
+        ]
+    }
+
+"formation" may be given instead of "waves" for a single wave at time 0.
+Waves enter at their "at" time (ms), or as soon as the field is cleared.
+"max_live_enemies" optionally overrides the level's live-enemy budget.
+"boss" is optional and names one of the boss classes in entities.
+
+Formation types:
+- "grid":   rows x columns, centered, with spacing/row_spacing/top
+- "v":      count enemies in a V pointing down, with spacing/row_spacing/top
+- "points": explicit list of [x, y] positions
+
+Parsed files and compiled formations are cached, so loading the same
+level again does not touch the disk or recompute any positions. Every
+formation is compiled while the file is read, so a malformed file raises
+LevelFileError there and is skipped by load_level_files.
+"""
+
+import json
+import os
+from core import config
+from entities.boss3 import Boss3
+from entities.boss4 import Boss4
+from entities.boss5 import Boss5
+from .base_level import BaseLevel
+
+LEVEL_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+BOSSES = {
+    "Boss3": Boss3,
+    "Boss4": Boss4,
+    "Boss5": Boss5,
+}
+
+FORMATION_TYPES = ("grid", "v", "points")
+
+_file_cache = {}
+_formation_cache = {}
+
+
+class LevelFileError(ValueError):
+    """Raised when a level file is malformed"""
+    pass
+
+
+def _compute_formation(formation, screen_width):
+    """Compute the (x, y) positions of one formation"""
+    kind = formation.get("type")
+    if kind == "grid":
+        rows = formation.get("rows", 1)
+        columns = formation["columns"]
+        spacing = formation.get("spacing", 100)
+        row_spacing = formation.get("row_spacing", 60)
+        top = formation.get("top", 80)
+        start_x = (screen_width - (columns - 1) * spacing) // 2
+        return tuple(
+            (start_x + col * spacing, top + row * row_spacing)
+            for row in range(rows)
+            for col in range(columns)
+        )
+    if kind == "v":
+        count = formation["count"]
+        spacing = formation.get("spacing", 60)
+        row_spacing = formation.get("row_spacing", 30)
+        top = formation.get("top", 60)
+        center = screen_width // 2
+        positions = []
+        for i in range(count):
+            arm = (i + 1) // 2
+            side = -1 if i % 2 else 1
+            positions.append((center + side * arm * spacing, top + arm * row_spacing))
+        return tuple(positions)
+    if kind == "points":
+        return tuple((x, y) for x, y in formation["points"])
+    raise LevelFileError(f"Unknown formation type {kind!r}, expected one of {', '.join(FORMATION_TYPES)}")
+
+
+def compile_formation(formation, screen_width):
+    """
+    Get the positions of a formation, computing them only once.
+
+    Args:
+        formation: Formation dict from a level file
+        screen_width: Width of the game screen
+
+    Returns:
+        Tuple of (x, y) positions
+    """
+    key = (json.dumps(formation, sort_keys=True), screen_width)
+    positions = _formation_cache.get(key)
+    if positions is None:
+        positions = _compute_formation(formation, screen_width)
+        _formation_cache[key] = positions
+    return positions
+
+
+def _is_number(value):
+    """Check for a JSON number (bool is an int in Python, but not a number here)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_formation(formation, path):
+    """Compile a formation once, turning any error in it into a LevelFileError"""
+    if not isinstance(formation, dict):
+        raise LevelFileError(f"{path}: a formation must be a JSON object")
+    try:
+        positions = compile_formation(formation, config.SCREEN_WIDTH)
+    except LevelFileError as e:
+        raise LevelFileError(f"{path}: {e}") from e
+    except KeyError as e:
+        raise LevelFileError(f"{path}: {formation.get('type')!r} formation needs {e.args[0]!r}") from e
+    except (TypeError, ValueError) as e:
+        raise LevelFileError(f"{path}: malformed {formation.get('type')!r} formation: {e}") from e
+    for x, y in positions:
+        if not _is_number(x) or not _is_number(y):
+            raise LevelFileError(f"{path}: formation position {[x, y]!r} is not a pair of numbers")
+
+
+def _validate(spec, path):
+    """Check a parsed level file and compile its formations"""
+    if not isinstance(spec, dict):
+        raise LevelFileError(f"{path}: a level file must contain a JSON object")
+    if not isinstance(spec.get("name"), str):
+        raise LevelFileError(f"{path}: missing 'name'")
+    if "waves" not in spec and "formation" not in spec:
+        raise LevelFileError(f"{path}: needs 'waves' or 'formation'")
+    boss = spec.get("boss")
+    if boss is not None and boss not in BOSSES:
+        raise LevelFileError(f"{path}: unknown boss {boss!r}, expected one of {', '.join(BOSSES)}")
+    for key in ("speed_multiplier", "shoot_chance_multiplier"):
+        if not _is_number(spec.get(key, 1.0)):
+            raise LevelFileError(f"{path}: {key!r} must be a number")
+    max_live_enemies = spec.get("max_live_enemies", 1)
+    if not isinstance(max_live_enemies, int) or isinstance(max_live_enemies, bool) or max_live_enemies < 1:
+        raise LevelFileError(f"{path}: 'max_live_enemies' must be a positive integer")
+    if "waves" in spec:
+        if not isinstance(spec["waves"], list):
+            raise LevelFileError(f"{path}: 'waves' must be a list")
+        for wave in spec["waves"]:
+            if not isinstance(wave, dict) or "formation" not in wave:
+                raise LevelFileError(f"{path}: every wave needs a 'formation'")
+            if not _is_number(wave.get("at", 0)):
+                raise LevelFileError(f"{path}: a wave's 'at' must be a number of milliseconds")
+            _check_formation(wave["formation"], path)
+    else:
+        _check_formation(spec["formation"], path)
+
+
+def read_level_file(path):
+    """
+    Parse a level file, reusing the cached result while the file is unchanged.
+
+    Args:
+        path: Path of the JSON level file
+
+    Returns:
+        The level description dict
+
+    Raises:
+        LevelFileError: The file is not valid JSON or does not describe a playable level
+    """
+    mtime = os.path.getmtime(path)
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8") as level_file:
+            spec = json.load(level_file)
+    except json.JSONDecodeError as e:
+        raise LevelFileError(f"{path}: {e}") from e
+    _validate(spec, path)
+    _file_cache[path] = (mtime, spec)
+    return spec
+
+
+class FileLevel(BaseLevel):
+    """
+    A level built from a level file description.
+    """
+
+    def __init__(self, screen_width, screen_height, level_number, spec, level_id=None):
+        """
+        Initialize a level from its description.
+
+        Args:
+            screen_width: Width of the game screen
+            screen_height: Height of the game screen
+            level_number: The level number (1, 2, 3, etc.)
+            spec: Level description dict (see read_level_file)
+            level_id: Stable identifier, e.g. from the file name (the level name if None)
+        """
+        self.spec = spec
+        self.level_id = level_id
+        self._waves = None
+        super().__init__(screen_width, screen_height, level_number)
+        self.max_live_enemies = spec.get("max_live_enemies", self.max_live_enemies)
+
+    def get_level_name(self):
+        return self.spec["name"]
+
+    def get_level_id(self):
+        return self.level_id if self.level_id is not None else f"file:{self.spec['name']}"
+
+    def get_description(self):
+        return self.spec.get("description", super().get_description())
+
+    def get_waves(self):
+        """
+        Return the waves of this level.
+
+        Returns:
+            List of (start_time_ms, positions) tuples in start order
+        """
+        if self._waves is None:
+            if "waves" in self.spec:
+                waves = [
+                    (wave.get("at", 0), compile_formation(wave["formation"], self.screen_width))
+                    for wave in self.spec["waves"]
+                ]
+            else:
+                waves = [(0, compile_formation(self.spec["formation"], self.screen_width))]
+            self._waves = sorted(waves, key=lambda wave: wave[0])
+        return self._waves
+
+    def get_enemy_count(self):
+        return sum(len(positions) for _, positions in self.get_waves())
+
+    def get_enemy_speed_multiplier(self):
+        return self.spec.get("speed_multiplier", 1.0)
+
+    def get_enemy_shoot_chance_multiplier(self):
+        return self.spec.get("shoot_chance_multiplier", 1.0)
+
+    def level_has_boss(self):
+        return self.spec.get("boss") is not None
+
+    def create_boss(self):
+        return BOSSES[self.spec["boss"]](self.screen_width, self.screen_height)
+
+    def get_enemy_positions(self):
+        return [position for _, positions in self.get_waves() for position in positions]
+
+    def get_definition(self):
+        definition = super().get_definition()
+        definition['boss'] = self.spec.get("boss")
+        return definition
+
+
+def load_level_files(screen_width, screen_height, first_level_number, directory=LEVEL_DATA_DIR):
+    """
+    Create a level for every .json file in a directory, in file name order.
+
+    Args:
+        screen_width: Width of the game screen
+        screen_height: Height of the game screen
+        first_level_number: Level number given to the first file
+        directory: Directory holding the level files
+
+    Returns:
+        List of FileLevel instances
+    """
+    if not os.path.isdir(directory):
+        return []
+    levels = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".json"):
+            continue
+        path = os.path.join(directory, file_name)
+        try:
+            spec = read_level_file(path)
+        except (OSError, LevelFileError) as e:
+            print(f"Skipping level file {path}: {e}")
+            continue
+        levels.append(FileLevel(screen_width, screen_height, first_level_number + len(levels), spec,
+                                f"file:{os.path.splitext(file_name)[0]}"))
+    return levels
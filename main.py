@@ -1,12 +1,26 @@
 import pygame
-import random
+import time
+from collections import namedtuple
 from pygame.locals import *
 from entities.player import Player
-from entities.enemy import Enemy
-from entities.explosion import Explosion
+from entities.explosion_field import MAX_EFFECTS
+from entities.base_boss import draw_hp_bar
 from menus import MainMenu, GameOverMenu, PauseMenu, LevelCompleteMenu, LevelSelectMenu
-from levels import Level1, Level2, Level3, Level4, Level5
 from managers.level_manager import LevelManager
+from managers.save_manager import SaveManager
+from managers.run_store import RunStore
+from managers.level_previews import LevelPreviews
+from managers.play_session import PlaySession, DEATH, COMPLETE
+from managers.telemetry import Telemetry
+from managers.sound_manager import SoundManager
+from managers import sound_manager as sounds
+from managers.quality_governor import QualityGovernor
+from core import config
+from core.render_backend import create_backend
+from core.sim_thread import SimulationThread, RenderFrame
+from core.scenes import Scene, MenuScene, SceneStack
+from core.diagnostics import MemoryTracker, format_report
+from core.latency import InputLatch, LatencyStats
 
 # Game states
 MAIN_MENU = "MAIN_MENU"
@@ -16,17 +30,23 @@ PAUSED = "PAUSED"
 GAME_OVER = "GAME_OVER"
 LEVEL_COMPLETE = "LEVEL_COMPLETE"
 
-def main():
-    pygame.init()
-
-    clock = pygame.time.Clock()
-    fps = 50
+# What create_game() hands to the main loop (and to tools that play the game headless)
+Game = namedtuple('Game', 'tick latch_tick update draw_frame govern running close scenes session')
 
-    screenWidth = 600
-    screenHeight = 800
+def create_game(renderer):
+    """
+    Build the game: managers, menus, the play session and the scene stack.
+    
+    Args:
+        renderer: RenderBackend the game draws with
+    
+    Returns:
+        Game holding the callables a main loop runs
+    """
+    fps = config.FPS
 
-    screen = pygame.display.set_mode((screenWidth, screenHeight))
-    pygame.display.set_caption('Galaxy Shooter')
+    screenWidth = config.SCREEN_WIDTH
+    screenHeight = config.SCREEN_HEIGHT
 
     font = pygame.font.Font(None, 74)
     small_font = pygame.font.Font(None, 36)
@@ -37,7 +57,7 @@ def main():
     bg_y = 0
 
     def draw_bg():
-        screen.blit(bg, (bg_x, bg_y))
+        renderer.blit(bg, (bg_x, bg_y))
     
     # Initialize menus
     main_menu = MainMenu(screenWidth, screenHeight)
@@ -46,19 +66,36 @@ def main():
     pause_menu = PauseMenu(screenWidth, screenHeight)
     level_complete_menu = LevelCompleteMenu(screenWidth, screenHeight)
     
-    # Game state
-    current_state = MAIN_MENU
+    save_manager = SaveManager()
+    telemetry = Telemetry() if config.TELEMETRY_ENABLED else None
+    run_store = RunStore()
+    # The volume chosen in the main menu is kept in the save
+    volume = save_manager.get_setting("volume")
+    if not isinstance(volume, (int, float)) or not 0 <= volume <= 1:
+        volume = config.SOUND_VOLUME
+    main_menu.set_volume(volume)
+    sound = SoundManager(volume=volume)
+    level_manager = LevelManager(screenWidth, screenHeight, save_manager, telemetry, run_store, LevelPreviews())
+    level_select_menu.set_levels(level_manager.get_all_levels_info(), level_manager.get_level_preview)
+    level_complete_menu.total_levels = level_manager.get_level_count()
+    # The level being played and the rules of a PLAYING tick (see managers.play_session)
+    session = PlaySession(level_manager, telemetry, sound)
+    session.add_player(Player(screenWidth // 2, screenHeight - 130, screenWidth))
+    explosion_field = session.explosion_field
+    memory_tracker = MemoryTracker() if config.DIAGNOSTICS else None
     
-    level_manager = LevelManager(screenWidth, screenHeight)
-    current_level = None
-
-    player = None
-    player_group = pygame.sprite.Group()
-    bullet_group = pygame.sprite.Group()
-    enemy_group = pygame.sprite.Group()
-    enemy_bullet_group = pygame.sprite.Group()
-    explosion_group = pygame.sprite.Group()
-    boss_group = pygame.sprite.Group()  # New boss group
+    def apply_quality(old, new):
+        """Apply a new quality level: the explosion cap and the world's internal resolution"""
+        explosion_field.max_effects = new.max_explosions or MAX_EFFECTS
+        if new.render_scale != old.render_scale:
+            renderer.set_render_scale(config.RENDER_SCALE * new.render_scale)
+    
+    governor = QualityGovernor(on_change=apply_quality)
+    hud_level = hud_boss = None  # HUD values shown, refreshed every hud_interval frames
+    hud_age = 0
+    hud_texts = {}
+    # Late latch: the player moves from input read just before the frame is drawn
+    late_input = config.INPUT_LATCH == "late" and not config.SIM_THREAD
 
     def initialize_game(level_index=0):
         """
@@ -67,250 +104,418 @@ def main():
         Args:
             level_index: Index of the level to start (0 = Level 1, 1 = Level 2, etc.)
         """
-        nonlocal player, current_level
-        
-        # Load the level using level manager
-        current_level = level_manager.load_level(level_index)
-        
-        # Clear all sprite groups
-        bullet_group.empty()
-        enemy_group.empty()
-        enemy_bullet_group.empty()
-        explosion_group.empty()
-        player_group.empty()
-        boss_group.empty()  # Clear boss group too
-        
-        # Create new player
-        player = Player(screenWidth // 2, screenHeight - 130, screenWidth)
-        player_group.add(player)
-        
-        # Copy enemies from level to game enemy_group
-        if current_level:
-            for enemy in current_level.enemy_group:
-                enemy_group.add(enemy)
+        session.start(level_index)
         
         # Reset game over menu timer
         game_over_menu.reset_timer()
-
-    run = True
-    while run:
-        dt = clock.tick(fps)
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-            elif event.type == pygame.KEYDOWN:
-                # Handle state-specific input
-                if current_state == MAIN_MENU:
-                    action = main_menu.handle_input(event)
-                    if action == "START_GAME":
-                        initialize_game()  # Start with Level 1
-                        current_state = PLAYING
-                    elif action == "SELECT_LEVEL":
-                        current_state = LEVEL_SELECT
-                    elif action == "QUIT_GAME":
-                        run = False
-                
-                elif current_state == LEVEL_SELECT:
-                    action = level_select_menu.handle_input(event)
-                    if action == "MAIN_MENU":
-                        current_state = MAIN_MENU
-                    elif action and action.startswith("LEVEL_"):
-                        # Extract level number from action (LEVEL_1, LEVEL_2, etc.)
-                        level_num = int(action.split("_")[1])
-                        initialize_game(level_num - 1)  # Convert to 0-based index
-                        current_state = PLAYING
-                
-                elif current_state == PLAYING:
-                    # Pause key
-                    if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
-                        current_state = PAUSED
-                    # Shooting
-                    elif event.key == pygame.K_SPACE:
-                        bullet = player.shoot()
-                        if bullet:
-                            bullet_group.add(bullet)
-                
-                elif current_state == PAUSED:
-                    # Resume with ESC or P
-                    if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
-                        current_state = PLAYING
-                    else:
-                        action = pause_menu.handle_input(event)
-                        if action == "RESUME_GAME":
-                            current_state = PLAYING
-                        elif action == "RESTART_GAME":
-                            current_level_index = level_manager.get_current_level_index()
-                            initialize_game(current_level_index)
-                            current_state = PLAYING
-                        elif action == "MAIN_MENU":
-                            current_state = MAIN_MENU
-                
-                elif current_state == GAME_OVER:
-                    action = game_over_menu.handle_input(event)
-                    if action == "RESTART_GAME":
-                        # Restart current level
-                        current_level_index = level_manager.get_current_level_index()
-                        initialize_game(current_level_index)
-                        current_state = PLAYING
-                    elif action == "MAIN_MENU":
-                        current_state = MAIN_MENU
-                
-                elif current_state == LEVEL_COMPLETE:
-                    action = level_complete_menu.handle_input(event)
-                    if action == "NEXT_LEVEL":
-                        # Load next level
-                        next_level = level_manager.load_next_level()
-                        if next_level:
-                            initialize_game(level_manager.get_current_level_index())
-                            current_state = PLAYING
-                    elif action == "RESTART_LEVEL":
-                        # Restart current level
-                        current_level_index = level_manager.get_current_level_index()
-                        initialize_game(current_level_index)
-                        current_state = PLAYING
-                    elif action == "SELECT_LEVEL":
-                        current_state = LEVEL_SELECT
-                    elif action == "MAIN_MENU":
-                        current_state = MAIN_MENU
+        # Every start, restart and level transition passes through here
+        if memory_tracker is not None:
+            print(format_report(memory_tracker.checkpoint(f"level {session.level.level_number} start")))
 
-        # Update game logic based on current state
-        if current_state == PLAYING:
-
-            for enemy in enemy_group:
-                enemy_bullet = enemy.shoot()
-                if enemy_bullet:
-                    enemy_bullet_group.add(enemy_bullet)
-            
-            boss = current_level.get_boss() if current_level else None
-            if boss and not boss.is_defeated():
-                boss_bullet = boss.update_shooting(dt)
-                if boss_bullet:
-                    if isinstance(boss_bullet, list):
-                        for bullet in boss_bullet:
-                            enemy_bullet_group.add(bullet)
-                    else:
-                        enemy_bullet_group.add(boss_bullet)
-                
-                if boss not in boss_group:
-                    boss_group.add(boss)
-
-            for bullet in bullet_group:
-                hit_enemies = pygame.sprite.spritecollide(bullet, enemy_group, True)
-                if hit_enemies:
-                    bullet.kill()
-                    for enemy in hit_enemies:
-                        explosion = Explosion(enemy.rect.centerx, enemy.rect.centery)
-                        explosion_group.add(explosion)
-                        current_level.enemy_killed()
-            
-            if boss and not boss.is_defeated():
-                hit_bullets = pygame.sprite.spritecollide(boss, bullet_group, True)
-                for bullet in hit_bullets:
-                    if not boss.take_damage(1):
-                        
-                        explosion = Explosion(boss.rect.centerx, boss.rect.centery)
-                        explosion_group.add(explosion)
-                        current_level.boss_killed()
-                        boss_group.remove(boss)
-            
-            for enemy in enemy_group:
-                if enemy.rect.bottom >= screenHeight - 100:  # Near bottom edge
-                    explosion = Explosion(player.rect.centerx, player.rect.centery)
-                    explosion_group.add(explosion)
-                    player.kill()
-                    game_over_menu.reset_timer()
-                    current_state = GAME_OVER
-                    break
-            
-            # Player-enemy bullet collision (game over)
-            if pygame.sprite.spritecollide(player, enemy_bullet_group, True):
-                explosion = Explosion(player.rect.centerx, player.rect.centery)
-                explosion_group.add(explosion)
-                player.kill()
-                game_over_menu.reset_timer()
-                current_state = GAME_OVER
-            
-            # Check for level completion
-            if current_level and current_level.is_level_complete():
-                level_manager.mark_level_completed(level_manager.get_current_level_index())
-                level_complete_menu.set_level_info(
-                    current_level.level_number,
-                    current_level.get_level_name()
-                )
-                current_state = LEVEL_COMPLETE
-            
-            # Update all game sprites
-            player_group.update()
-            bullet_group.update()
-            enemy_group.update()
-            enemy_bullet_group.update()
-            explosion_group.update()
-            boss_group.update(dt)  # Boss group needs dt for timing
-            
-            # Update level
-            if current_level is not None:
-                current_level.update()
+    def handle_event(event):
+        """
+        Apply one input event to the game: quitting, or input for the top scene.
+        
+        Args:
+            event: pygame event
+        """
+        nonlocal run
+        if event.type == pygame.QUIT:
+            run = False
+        elif event.type == pygame.KEYDOWN:
+            scenes.handle_event(event)
+    
+    def play_input(event):
+        """Input while playing: pause and shoot"""
+        # Pause key
+        if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
+            scenes.push(pause_scene)
+        # Shooting
+        elif event.key == pygame.K_SPACE:
+            session.shoot(session.player)
+    
+    def start_level(level_index):
+        """Start (or restart) a level and play it"""
+        nonlocal hud_level
+        initialize_game(level_index)
+        hud_level = None  # Show the new level's HUD at once
+        scenes.reset(play_scene)
+    
+    def main_menu_action(action):
+        nonlocal run
+        if action == "START_GAME":
+            start_level(0)  # Start with Level 1
+        elif action == "SELECT_LEVEL":
+            scenes.reset(level_select_scene)
+        elif action == "VOLUME":
+            sound.volume = main_menu.volume
+            save_manager.set_setting("volume", main_menu.volume)
+            sound.play(sounds.SHOT)  # Let the player hear the new volume
+        elif action == "QUIT_GAME":
+            run = False
+    
+    def level_select_action(action):
+        if action == "MAIN_MENU":
+            scenes.reset(main_menu_scene)
+        elif action.startswith("LEVEL_"):
+            # Extract level number from action (LEVEL_1, LEVEL_2, etc.)
+            level_num = int(action.split("_")[1])
+            start_level(level_num - 1)  # Convert to 0-based index
+    
+    def pause_action(action):
+        if action == "RESUME_GAME":
+            scenes.pop()
+        elif action == "RESTART_GAME":
+            session.end_run("abandoned")
+            start_level(level_manager.get_current_level_index())
+        elif action == "MAIN_MENU":
+            session.end_run("abandoned")
+            scenes.reset(main_menu_scene)
+    
+    def game_over_action(action):
+        if action == "RESTART_GAME":
+            # Restart current level
+            start_level(level_manager.get_current_level_index())
+        elif action == "MAIN_MENU":
+            scenes.reset(main_menu_scene)
+    
+    def level_complete_action(action):
+        if action == "NEXT_LEVEL":
+            # Load next level
+            next_level = level_manager.load_next_level()
+            if next_level:
+                start_level(level_manager.get_current_level_index())
+        elif action == "RESTART_LEVEL":
+            # Restart current level
+            start_level(level_manager.get_current_level_index())
+        elif action == "SELECT_LEVEL":
+            scenes.reset(level_select_scene)
+        elif action == "MAIN_MENU":
+            scenes.reset(main_menu_scene)
+    
+    def update(dt):
+        """
+        Advance the game logic by one tick of the top scene.
         
-        elif current_state == GAME_OVER:
-            # Only update explosions in game over state
-            explosion_group.update()
-            game_over_menu.update(dt)
+        Args:
+            dt: Delta time in milliseconds
+        """
+        scenes.update(dt)
         
-        elif current_state == LEVEL_COMPLETE:
-            # Update explosions and level complete menu timer
-            explosion_group.update()
-            level_complete_menu.update(dt)
-
-        # Drawing
-        draw_bg()
+        # Start this tick's sounds, each at most once
+        sound.flush()
+    
+    def update_play(dt):
+        """
+        Advance gameplay by one tick (or rewind one tick while R is held).
+        
+        Args:
+            dt: Delta time in milliseconds
+        """
+        if pygame.key.get_pressed()[pygame.K_r]:
+            # Step back one recorded tick per frame instead of simulating
+            session.rewind(governor.level.explosion_step)
+            return
         
-        if current_state in [PLAYING, PAUSED, GAME_OVER, LEVEL_COMPLETE]:
-            # Draw game objects
-            player_group.draw(screen)
-            bullet_group.draw(screen)
-            enemy_group.draw(screen)
-            enemy_bullet_group.draw(screen)
-            explosion_group.draw(screen)
-            boss_group.draw(screen)  # Draw bosses
-            
-            # Draw boss HP bar if boss exists
-            if current_state == PLAYING and current_level:
+        # The player moves last, in late-latch mode
+        outcome = session.step(dt, governor.level.explosion_step, update_players=not late_input)
+        if outcome == DEATH:
+            game_over_menu.reset_timer()
+            scenes.push(game_over_scene)
+        elif outcome == COMPLETE:
+            level = session.level
+            level_complete_menu.set_level_info(
+                level.level_number,
+                level.get_level_name(),
+                session.level_elapsed,
+                level_manager.get_best_time(level_manager.get_current_level_index()),
+                session.new_best
+            )
+            level_select_menu.set_levels(level_manager.get_all_levels_info(), level_manager.get_level_preview)
+            scenes.push(level_complete_scene)
+        elif not late_input:
+            session.record()
+    
+    def update_game_over(dt):
+        """Only explosions and the menu timer move after the player is destroyed"""
+        explosion_field.update(governor.level.explosion_step)
+        game_over_menu.update(dt)
+    
+    def update_level_complete(dt):
+        """Explosions finish while the level complete menu counts down"""
+        explosion_field.update(governor.level.explosion_step)
+        level_complete_menu.update(dt)
+    
+    def capture_frame():
+        """
+        Copy what has to be drawn this tick out of the live game objects.
+        
+        Returns:
+            Immutable RenderFrame
+        """
+        nonlocal world_frame
+        if play_scene not in scenes:
+            world_frame = None
+            return RenderFrame(scenes.views(), (), None, (), (), None, None)
+        if world_frame is None or scenes.top.needs_simulation:
+            # A scene that does not need simulation (pause) leaves the world as it was
+            sprites = tuple(
+                (sprite.image, sprite.rect.topleft)
+                for group in (session.player_group, session.bullet_group,
+                              session.enemy_group, session.enemy_bullet_group)
+                for sprite in group
+            )
+            field = session.boss_bullet_field
+            field_positions = tuple(field.positions())
+            overlay = tuple(explosion_field.blits()) + tuple(
+                (sprite.image, sprite.rect.topleft) for sprite in session.boss_group
+            )
+            level = boss_info = None
+            current_level = session.level
+            if scenes.top is play_scene and current_level is not None:
                 boss = current_level.get_boss()
+                level = (current_level.level_number, current_level.get_level_name(),
+                         len(session.enemy_group), current_level.get_progress()[1])
                 if boss and not boss.is_defeated():
-                    # Draw boss HP bar at top of screen
-                    boss_name = boss.get_boss_name()
-                    boss_text = small_font.render(f"Boss: {boss_name}", True, (255, 255, 255))
-                    screen.blit(boss_text, (screenWidth // 2 - boss_text.get_width() // 2, 10))
-                    boss.draw_hp_bar(screen, screenWidth // 2 - 100, 35, 200, 15)
-            
-            # Draw level info HUD during gameplay
-            if current_state == PLAYING and current_level is not None:
-                level_info = f"Level {current_level.level_number}: {current_level.get_level_name()}"
-                level_text = small_font.render(level_info, True, (255, 255, 255))
-                screen.blit(level_text, (10, 10))
-                
-                # Draw enemy count (only if no boss or boss not spawned)
-                boss = current_level.get_boss()
-                if not boss:
-                    progress = current_level.get_progress()
-                    enemy_text = small_font.render(f"Enemies: {len(enemy_group)}/{progress[1]}", True, (255, 255, 255))
-                    screen.blit(enemy_text, (10, 40))
+                    boss_info = (boss.get_boss_name(), boss.current_hp, boss.max_hp)
+                elif boss:
+                    boss_info = ()  # Boss spawned and defeated: no bar, no enemy count
+            world_frame = RenderFrame((), sprites, field.image, field_positions,
+                                      overlay, level, boss_info)
+        return world_frame._replace(scenes=scenes.views())
+    
+    def hud_text(text):
+        """Render a HUD line, reusing the image while the text is unchanged"""
+        image = hud_texts.get(text)
+        if image is None:
+            if len(hud_texts) > 32:
+                hud_texts.clear()
+            image = hud_texts[text] = small_font.render(text, True, (255, 255, 255))
+        return image
+    
+    def draw_world(renderer, frame):
+        """
+        Draw the game world of a frame and the gameplay HUD.
+        
+        Args:
+            renderer: RenderBackend to draw with
+            frame: RenderFrame from capture_frame()
+        """
+        nonlocal hud_level, hud_boss, hud_age
+        # Under load the HUD values only refresh every few frames; a HUD
+        # appearing or disappearing is always shown at once
+        hud_age += 1
+        if (hud_age >= governor.level.hud_interval
+                or (frame.level is None) != (hud_level is None)
+                or (frame.boss is None) != (hud_boss is None) or bool(frame.boss) != bool(hud_boss)):
+            hud_level, hud_boss, hud_age = frame.level, frame.boss, 0
+        
+        draw_bg()
+        
+        # Draw game objects
+        renderer.draw_blits(frame.sprites)
+        renderer.blit_many(frame.field_image, frame.field_positions)
+        renderer.draw_blits(frame.overlay)
+        
+        if hud_level is None:
+            return
+        # The HUD draws on the UI layer, which is shown above the sprites
+        screen = renderer.ui_surface((hud_level, hud_boss))
+        if screen is None:
+            # The backend still shows this HUD
+            return
+        
+        # Draw boss HP bar if boss exists
+        if hud_boss:
+            # Draw boss HP bar at top of screen
+            boss_name, boss_hp, boss_max_hp = hud_boss
+            boss_text = hud_text(f"Boss: {boss_name}")
+            screen.blit(boss_text, (screenWidth // 2 - boss_text.get_width() // 2, 10))
+            draw_hp_bar(screen, screenWidth // 2 - 100, 35, boss_hp, boss_max_hp, 200, 15)
+        
+        # Draw level info HUD during gameplay
+        level_number, level_name, enemies, total_enemies = hud_level
+        level_text = hud_text(f"Level {level_number}: {level_name}")
+        screen.blit(level_text, (10, 10))
+        
+        # Draw enemy count (only if no boss or boss not spawned)
+        if hud_boss is None:
+            enemy_text = hud_text(f"Enemies: {enemies}/{total_enemies}")
+            screen.blit(enemy_text, (10, 40))
+    
+    def menu_backdrop(frame):
+        """The background image under the main menu and level select"""
+        image = pygame.Surface((screenWidth, screenHeight))
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        image.blit(bg, (bg_x, bg_y))
+        return image
+    
+    def frozen_world(frame):
+        """The game world as it was when the game was paused, drawn once"""
+        image = menu_backdrop(frame)
+        image.blits(frame.sprites, False)
+        if frame.field_image is not None:
+            image.blits([(frame.field_image, position) for position in frame.field_positions], False)
+        image.blits(frame.overlay, False)
+        return image
+    
+    def draw_frame(frame):
+        """
+        Draw a captured frame and present it.
+        
+        Args:
+            frame: RenderFrame from capture_frame()
+        """
+        for scene, view in frame.scenes:
+            scene.draw(renderer, frame, view)
+        renderer.present()
+    
+    # Gameplay at the bottom, menus pushed on top (see core.scenes)
+    play_scene = Scene(PLAYING, handle_event=play_input, update=update_play, draw=draw_world, opaque=True)
+    pause_scene = MenuScene(PAUSED, pause_menu, pause_action, backdrop=frozen_world)
+    game_over_scene = MenuScene(GAME_OVER, game_over_menu, game_over_action,
+                                update=update_game_over, needs_simulation=True)
+    level_complete_scene = MenuScene(LEVEL_COMPLETE, level_complete_menu, level_complete_action,
+                                     update=update_level_complete, needs_simulation=True)
+    main_menu_scene = MenuScene(MAIN_MENU, main_menu, main_menu_action, backdrop=menu_backdrop)
+    level_select_scene = MenuScene(LEVEL_SELECT, level_select_menu, level_select_action, backdrop=menu_backdrop)
+    scenes = SceneStack(main_menu_scene)
+    world_frame = None  # World part of the last frame, reused while the world is frozen
+    
+    def tick(events, dt):
+        """
+        Run one simulation tick.
+        
+        Args:
+            events: Input events received since the last tick
+            dt: Delta time in milliseconds
         
-        # Draw menus on top
-        if current_state == MAIN_MENU:
-            main_menu.draw(screen)
-        elif current_state == LEVEL_SELECT:
-            level_select_menu.draw(screen)
-        elif current_state == PAUSED:
-            pause_menu.draw(screen)
-        elif current_state == GAME_OVER:
-            game_over_menu.draw(screen)
-        elif current_state == LEVEL_COMPLETE:
-            level_complete_menu.draw(screen)
+        Returns:
+            RenderFrame of the tick, or None once the game should quit
+        """
+        for event in events:
+            handle_event(event)
+        if not run:
+            return None
+        update(dt)
+        return capture_frame()
+    
+    def latch_tick(events):
+        """
+        Finish a late-latch tick: apply the input read just now and move the player.
+        
+        Args:
+            events: Input events received since the last tick
+        
+        Returns:
+            RenderFrame of the tick, or None once the game should quit
+        """
+        for event in events:
+            handle_event(event)
+        if not run:
+            return None
+        if scenes.top is play_scene and not pygame.key.get_pressed()[pygame.K_r]:
+            session.player_group.update()
+            session.record()
+        return capture_frame()
+
+    def govern(work_ms):
+        """Report how long a frame took to simulate and draw to the quality governor"""
+        if config.QUALITY == "auto":
+            governor.frame(work_ms)
+
+    def running():
+        """Whether the game goes on (False once the player quit)"""
+        return run
+
+    def close():
+        """Record an unfinished run and close the stores"""
+        if scenes.top in (play_scene, pause_scene):
+            session.end_run("abandoned")
+        run_store.close()
+        save_manager.close()
+        if telemetry is not None:
+            telemetry.close()
+
+    run = True
+    return Game(tick, latch_tick, update, draw_frame, govern, running, close, scenes, session)
+
+
+def main():
+    pygame.init()
+
+    clock = pygame.time.Clock()
+    fps = config.FPS
+    renderer = create_backend(caption='Galaxy Shooter')
+    game = create_game(renderer)
+    tick, latch_tick, update, draw_frame, govern = (
+        game.tick, game.latch_tick, game.update, game.draw_frame, game.govern)
 
-        pygame.display.update()
+    latency = LatencyStats()
+    if config.INPUT_LATCH == "late" and config.SIM_THREAD:
+        print("GALAXY_INPUT_LATCH=late is ignored with GALAXY_SIM_THREAD=on")
+    if config.SIM_THREAD:
+        # Simulate on a worker thread; this thread only forwards input and draws
+        simulation = SimulationThread(tick, fps)
+        simulation.start()
+        drawn = 0
+        while simulation.is_alive():
+            for event in pygame.event.get():
+                simulation.post(event)
+            drawn, frame = simulation.frames.wait(drawn, timeout=0.1)
+            if frame is not None:
+                start = time.perf_counter()
+                draw_frame(frame)
+                # The threads work in parallel: the slower one sets the pace
+                govern(max((time.perf_counter() - start) * 1000, simulation.step_ms))
+        simulation.join()
+    elif config.INPUT_LATCH == "late":
+        # Simulate the world, wait, then read input as late as possible and present right away
+        latch = InputLatch(fps, latency)
+        next_report = pygame.time.get_ticks() + 5000
+        while game.running():
+            start = time.perf_counter()
+            update(latch.elapsed())
+            simulated = time.perf_counter() - start
+            latch.wait_late()
+            start = time.perf_counter()
+            frame = latch_tick(latch.take())
+            if frame is not None:
+                draw_frame(frame)
+                latch.presented()
+                govern((simulated + time.perf_counter() - start) * 1000)
+            if config.LATENCY_REPORT and pygame.time.get_ticks() >= next_report:
+                print(latency.format())
+                next_report += 5000
+    elif config.LATENCY_REPORT:
+        # Same loop as below, but input is stamped on arrival while waiting
+        latch = InputLatch(fps, latency)
+        next_report = pygame.time.get_ticks() + 5000
+        while game.running():
+            dt = latch.tick()
+            start = time.perf_counter()
+            frame = tick(latch.take(), dt)
+            if frame is not None:
+                draw_frame(frame)
+                latch.presented()
+                govern((time.perf_counter() - start) * 1000)
+            if pygame.time.get_ticks() >= next_report:
+                print(latency.format())
+                next_report += 5000
+    else:
+        while game.running():
+            dt = clock.tick(fps)
+            start = time.perf_counter()
+            frame = tick(pygame.event.get(), dt)
+            if frame is not None:
+                draw_frame(frame)
+                govern((time.perf_counter() - start) * 1000)
 
+    if config.LATENCY_REPORT and not config.SIM_THREAD:
+        print(latency.format())
+    game.close()
     pygame.quit()
 
 
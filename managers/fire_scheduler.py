@@ -0,0 +1,166 @@
+"""
+Enemy Fire Scheduler for Galaxy Shooter
+
+Regular enemies fire at random: once an enemy's shoot delay has passed, it
+fires with probability shoot_chance on every tick. Rolling that chance for
+every enemy on every tick wastes nearly all of the work, because the chance
+is tiny.
+
+The scheduler draws the number of ticks until the successful roll up front
+(a geometric distribution with the same per-tick chance) and keeps each
+enemy's resulting shot time in a priority queue. Each tick it only touches
+the enemies whose shot is due, so per-tick work scales with shots fired
+rather than with the number of enemies.
+
+Every time in the queue is game time. An enemy's first shoot delay counts
+from when it is added, never from the wall clock, so pauses, rewinds and
+the simulation thread do not shift the schedule and runs stay
+deterministic. Killed enemies are marked dead in place and the queue is
+rebuilt once they make up half of it, so dense waves do not leave it full
+of dead entries.
+
+Design principles used:
+- Single Responsibility: Decides only when enemies fire
+- Encapsulation: The heap and game clock stay inside the scheduler
+"""
+
+import heapq
+import itertools
+import math
+import random
+from core import config
+
+# Position of the enemy in a queue entry [shot_time, sequence, enemy]
+_ENEMY = 2
+
+
+class EnemyFireScheduler:
+    """
+    Priority queue of enemies keyed by their next shot time.
+
+    Time is game time: it only advances through update(dt), so pausing the
+    game does not make every enemy fire at once when play resumes.
+    """
+
+    def __init__(self, tick_ms=1000 / config.FPS):
+        """
+        Initialize the scheduler.
+
+        Args:
+            tick_ms: Duration of one game tick in milliseconds
+        """
+        self.tick_ms = tick_ms
+        self.time = 0
+        self._heap = []
+        self._entries = {}  # Enemy -> its live queue entry
+        self._dead = 0      # Entries of removed enemies still in the heap
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Forget every scheduled enemy and restart the clock"""
+        self._heap.clear()
+        self._entries.clear()
+        self._dead = 0
+        self.time = 0
+
+    def _ticks_until_shot(self, shoot_chance):
+        """
+        Draw how many eligible ticks pass before a shot succeeds.
+
+        Args:
+            shoot_chance: Probability of shooting on each eligible tick
+
+        Returns:
+            Number of failed ticks before the shot, or None if it never fires
+        """
+        if shoot_chance <= 0:
+            return None
+        if shoot_chance >= 1:
+            return 0
+        return int(math.log(1.0 - random.random()) / math.log(1.0 - shoot_chance))
+
+    def _schedule(self, enemy, eligible_time):
+        ticks = self._ticks_until_shot(enemy.shoot_chance)
+        if ticks is None:
+            return
+        entry = [eligible_time + ticks * self.tick_ms, next(self._sequence), enemy]
+        self._entries[enemy] = entry
+        heapq.heappush(self._heap, entry)
+
+    def add(self, enemy):
+        """
+        Start scheduling a newly spawned enemy's shots. Its first shoot delay
+        starts now.
+
+        Args:
+            enemy: Enemy with shoot_delay and shoot_chance
+        """
+        enemy.last_shot = self.time
+        self.resume(enemy)
+
+    def resume(self, enemy):
+        """
+        Start scheduling an enemy's shots from the game time of its last shot,
+        e.g. after a rewind restored it.
+
+        Args:
+            enemy: Enemy with last_shot (game time), shoot_delay and shoot_chance
+        """
+        self.remove(enemy)
+        # Eligible once the delay has strictly passed (next tick)
+        eligible_time = max(self.time, enemy.last_shot + enemy.shoot_delay)
+        self._schedule(enemy, eligible_time + self.tick_ms)
+
+    def remove(self, enemy):
+        """
+        Stop scheduling an enemy's shots, e.g. because it was killed.
+
+        Args:
+            enemy: A scheduled enemy (others are ignored)
+        """
+        entry = self._entries.pop(enemy, None)
+        if entry is None:
+            return
+        entry[_ENEMY] = None
+        self._dead += 1
+        if self._dead * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[_ENEMY] is not None]
+            heapq.heapify(self._heap)
+            self._dead = 0
+
+    def add_all(self, enemies):
+        """Start scheduling several enemies"""
+        for enemy in enemies:
+            self.add(enemy)
+
+    def update(self, dt):
+        """
+        Advance game time and fire every enemy whose shot is due.
+
+        Enemies that left the game without remove() are dropped when they
+        reach the front of the queue.
+
+        Args:
+            dt: Delta time in milliseconds
+
+        Returns:
+            List of EnemyBullet instances fired this tick
+        """
+        self.time += dt
+        bullets = []
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            _, _, enemy = heapq.heappop(heap)
+            if enemy is None:
+                self._dead -= 1
+                continue
+            del self._entries[enemy]
+            if not enemy.alive():
+                continue
+            bullets.append(enemy.fire(self.time))
+            # Eligible again once the new delay has strictly passed (next tick)
+            self._schedule(enemy, self.time + enemy.shoot_delay + self.tick_ms)
+        return bullets
@@ -6,6 +6,14 @@ This class manages all level-related functionality including:
 - Tracking progress and statistics
 - Managing level transitions
 - Providing level information
+- Loading additional levels from level files (see levels.level_file)
+- Persisting progress and best times through an optional SaveManager,
+  keyed by each level's stable id
+- Handing an optional Telemetry sink to every level
+- Recording runs through an optional RunStore
+- Level select thumbnails through an optional LevelPreviews cache
+- Keeping the level list shown by the menus, refreshing only the entries
+  whose completion or best time changed
 
 Design principles used:
 - Single Responsibility: Manages only level-related concerns
@@ -13,7 +21,7 @@ Design principles used:
 - Abstraction: Provides simple interface for level management
 """
 
-from levels import Level1, Level2, Level3, Level4, Level5
+from levels import Level1, Level2, Level3, Level4, Level5, load_level_files
 
 
 class LevelManager:
@@ -27,13 +35,18 @@ class LevelManager:
     - Providing level information
     """
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, save_manager=None, telemetry=None, run_store=None,
+                 previews=None):
         """
         Initialize the level manager.
         
         Args:
             screen_width: Width of the game screen
             screen_height: Height of the game screen
+            save_manager: SaveManager to load and store progress with (optional)
+            telemetry: Telemetry sink for level events (optional)
+            run_store: RunStore recording the history of every run (optional)
+            previews: LevelPreviews providing level thumbnails (optional)
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -47,12 +60,25 @@ class LevelManager:
             Level5(screen_width, screen_height)
         ]
         
+        # Data-driven levels follow the built-in ones
+        self.levels.extend(load_level_files(screen_width, screen_height, len(self.levels) + 1))
+        for level in self.levels:
+            level.telemetry = telemetry
+        
         # Current level tracking
         self.current_level_index = 0
         self.current_level = None
         
         # Statistics
-        self.levels_completed = []  # Track which levels have been completed
+        self.levels_completed = []  # Ids of the completed levels (see BaseLevel.get_level_id())
+        
+        self.run_store = run_store
+        self.save_manager = save_manager
+        self.previews = previews
+        self._levels_info = None  # Built on first use by get_all_levels_info()
+        if save_manager is not None:
+            # Ids of levels not loaded this time are kept, so their progress survives
+            self.levels_completed = save_manager.get_levels_completed()
         
     def get_level_count(self):
         """Get the total number of levels"""
@@ -77,8 +103,12 @@ class LevelManager:
             The loaded level instance, or None if invalid index
         """
         if 0 <= level_index < len(self.levels):
+            level = self.levels[level_index]
+            # The level being left would otherwise keep its last enemies alive
+            if self.current_level is not None and self.current_level is not level:
+                self.current_level.release()
             self.current_level_index = level_index
-            self.current_level = self.levels[level_index]
+            self.current_level = level
             self.current_level.spawn_enemies()
             return self.current_level
         return None
@@ -109,8 +139,60 @@ class LevelManager:
         Args:
             level_index: Index of the completed level
         """
-        if level_index not in self.levels_completed:
-            self.levels_completed.append(level_index)
+        if 0 <= level_index < len(self.levels) and not self.is_level_completed(level_index):
+            self.levels_completed.append(self.levels[level_index].get_level_id())
+            if self.save_manager is not None:
+                self.save_manager.set_levels_completed(self.levels_completed)
+            self._refresh_level_info(level_index)
+    
+    def record_level_time(self, level_index, time_ms):
+        """
+        Record how long a level took to complete.
+        
+        Args:
+            level_index: Index of the completed level
+            time_ms: Completion time in milliseconds
+            
+        Returns:
+            True if this is a new best time, False otherwise
+        """
+        if self.save_manager is None or not 0 <= level_index < len(self.levels):
+            return False
+        new_best = self.save_manager.record_time(self.levels[level_index].get_level_id(), time_ms)
+        self._refresh_level_info(level_index)
+        return new_best
+    
+    def get_best_time(self, level_index):
+        """
+        Get the best completion time of a level from the save.
+        
+        Args:
+            level_index: Index of the level
+            
+        Returns:
+            Best time in milliseconds, or None if unknown
+        """
+        if self.save_manager is None or not 0 <= level_index < len(self.levels):
+            return None
+        return self.save_manager.get_best_time(self.levels[level_index].get_level_id())
+    
+    def record_run(self, outcome, duration_ms, seed=None):
+        """
+        Record the end of a run of the current level in the run history.
+        
+        Args:
+            outcome: "complete", "death" or "abandoned"
+            duration_ms: Play time in milliseconds
+            seed: Random seed the run was played with
+        """
+        level = self.current_level
+        if self.run_store is None or level is None:
+            return
+        kills = level.enemies_killed
+        boss = level.get_boss()
+        if boss is not None and boss.is_defeated():
+            kills += 1
+        self.run_store.add_run(level.get_level_id(), outcome, duration_ms, kills, seed)
     
     def is_level_completed(self, level_index):
         """
@@ -122,7 +204,9 @@ class LevelManager:
         Returns:
             True if level has been completed, False otherwise
         """
-        return level_index in self.levels_completed
+        if not 0 <= level_index < len(self.levels):
+            return False
+        return self.levels[level_index].get_level_id() in self.levels_completed
     
     def get_level_info(self, level_index=None):
         """
@@ -148,17 +232,41 @@ class LevelManager:
             info = level.get_info()
             info['is_unlocked'] = True  # All levels are unlocked in this implementation
             info['is_completed'] = self.is_level_completed(index)
+            info['best_time'] = self.get_best_time(index)
             return info
         return None
     
     def get_all_levels_info(self):
         """
         Get information about all levels.
+        The list is built once and kept current as levels are completed and
+        times recorded, so asking for it again costs nothing.
         
         Returns:
             List of dictionaries with information for each level
         """
-        return [self.get_level_info(i) for i in range(len(self.levels))]
+        if self._levels_info is None:
+            self._levels_info = [self.get_level_info(i) for i in range(len(self.levels))]
+        return self._levels_info
+    
+    def _refresh_level_info(self, level_index):
+        """Rebuild the cached info entry of one level"""
+        if self._levels_info is not None and 0 <= level_index < len(self.levels):
+            self._levels_info[level_index] = self.get_level_info(level_index)
+    
+    def get_level_preview(self, level_index):
+        """
+        Get the thumbnail of a level for the level select menu.
+        
+        Args:
+            level_index: Index of the level
+            
+        Returns:
+            pygame Surface, or None without a preview cache or for an unknown level
+        """
+        if self.previews is None or not 0 <= level_index < len(self.levels):
+            return None
+        return self.previews.get(self.levels[level_index])
     
     def get_progress_stats(self):
         """
@@ -167,19 +275,23 @@ class LevelManager:
         Returns:
             Dictionary with progress information
         """
+        completed = sum(1 for index in range(len(self.levels)) if self.is_level_completed(index))
         return {
             'total_levels': len(self.levels),
-            'completed_levels': len(self.levels_completed),
+            'completed_levels': completed,
             'current_level': self.current_level_index + 1 if self.current_level else 0,
-            'completion_percentage': (len(self.levels_completed) / len(self.levels)) * 100
+            'completion_percentage': (completed / len(self.levels)) * 100
         }
     
     def reset_progress(self):
         """Reset all progress (for new game)"""
         self.levels_completed.clear()
+        if self.save_manager is not None:
+            self.save_manager.set_levels_completed(self.levels_completed)
         self.current_level_index = 0
         self.current_level = None
         
         # Reset all individual levels
         for level in self.levels:
-            level.reset()
\ No newline at end of file
+            level.reset()
+        self._levels_info = None
\ No newline at end of file
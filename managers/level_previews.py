@@ -0,0 +1,165 @@
+"""
+Level Previews for Galaxy Shooter
+
+This class provides the thumbnails shown next to each level in the level
+select menu: a miniature of the level's enemy formation and boss.
+
+Thumbnails are rendered offscreen once and then reused:
+- Each thumbnail is keyed by a hash of the level definition
+  (BaseLevel.get_definition(): waves, multipliers, boss), so editing a
+  level file or a level class gives it a new thumbnail and nothing else
+- Rendered thumbnails are kept in memory and written to the preview
+  directory as small PNG files; later sessions load the file instead of
+  rendering again
+- Nothing is rendered up front. The menu asks for the thumbnails of the
+  rows it shows, so opening it costs the same however many levels exist
+
+Design principles used:
+- Single Responsibility: Renders and caches level thumbnails only
+- Encapsulation: Hashing, rendering and the disk cache are hidden behind get()
+"""
+
+import hashlib
+import json
+import os
+import pygame
+from core import config
+from core.assets import load_image
+
+# Bump when the way thumbnails are drawn changes, so cached files are redrawn
+PREVIEW_VERSION = 1
+
+# Thumbnail size in pixels (the arena's 3:4 aspect ratio)
+THUMBNAIL_SIZE = (48, 64)
+
+BACKGROUND_IMAGE = 'assets/images/background2.png'
+ENEMY_IMAGES = tuple(f'assets/images/alien{i}.png' for i in range(1, 6))
+
+# Smallest size an enemy is drawn at, so formations stay readable
+MIN_ENEMY_SIZE = 5
+
+# Opacity of the enemies of later waves, drawn under the first wave
+LATER_WAVE_ALPHA = 130
+
+BORDER_COLOR = (100, 100, 100)
+
+
+class LevelPreviews:
+    """
+    Renders level thumbnails on first use and caches them in memory and on disk.
+    """
+
+    def __init__(self, cache_dir=config.PREVIEW_DIR, size=THUMBNAIL_SIZE):
+        """
+        Initialize the preview cache.
+
+        Args:
+            cache_dir: Directory the thumbnail files are kept in
+            size: Thumbnail (width, height) in pixels
+        """
+        self.cache_dir = cache_dir
+        self.size = size
+        self._images = {}  # Definition hash -> thumbnail
+        self._keys = {}  # Level -> definition hash
+        self._background = None
+        self.rendered = 0
+
+    def key(self, level):
+        """
+        Hash the definition of a level.
+
+        Args:
+            level: Level instance
+
+        Returns:
+            Hex digest identifying the level's thumbnail
+        """
+        key = self._keys.get(level)
+        if key is None:
+            data = json.dumps([PREVIEW_VERSION, self.size, level.get_definition()], sort_keys=True)
+            key = self._keys[level] = hashlib.sha1(data.encode('utf-8')).hexdigest()[:20]
+        return key
+
+    def get(self, level):
+        """
+        Get the thumbnail of a level, loading or rendering it if needed.
+
+        Args:
+            level: Level instance
+
+        Returns:
+            The shared pygame Surface of the thumbnail
+        """
+        key = self.key(level)
+        image = self._images.get(key)
+        if image is None:
+            path = os.path.join(self.cache_dir, f"{key}.png")
+            image = self._load(path)
+            if image is None:
+                image = self.render(level)
+                self._save(image, path)
+            if pygame.display.get_surface() is not None:
+                image = image.convert()
+            self._images[key] = image
+        return image
+
+    def _load(self, path):
+        """Read a cached thumbnail file, or return None if there is no usable one"""
+        try:
+            image = pygame.image.load(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, pygame.error) as e:
+            print(f"Could not read level preview {path}: {e}")
+            return None
+        return image if image.get_size() == tuple(self.size) else None
+
+    def _save(self, image, path):
+        """Write a thumbnail file through a temporary file, so no half-written file is left behind"""
+        temp_path = f"{path[:-len('.png')]}.tmp.png"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pygame.image.save(image, temp_path)
+            os.replace(temp_path, path)
+        except (OSError, pygame.error) as e:
+            print(f"Could not write level preview {path}: {e}")
+
+    def render(self, level):
+        """
+        Draw the thumbnail of a level offscreen.
+
+        Args:
+            level: Level instance
+
+        Returns:
+            New pygame Surface of the thumbnail size
+        """
+        width, height = self.size
+        scale = width / level.screen_width
+        surface = pygame.Surface(self.size)
+        if self._background is None:
+            self._background = pygame.transform.smoothscale(load_image(BACKGROUND_IMAGE), self.size)
+        surface.blit(self._background, (0, 0))
+
+        if level.has_boss:
+            boss = level.create_boss()
+            boss_size = (max(1, round(boss.rect.width * scale)), max(1, round(boss.rect.height * scale)))
+            image = pygame.transform.smoothscale(boss.image, boss_size)
+            surface.blit(image, image.get_rect(center=(boss.rect.centerx * scale, boss.rect.centery * scale)))
+
+        # Later waves first, faded, so the opening formation stays on top
+        waves = level.get_waves()
+        for index in range(len(waves) - 1, -1, -1):
+            source = load_image(ENEMY_IMAGES[index % len(ENEMY_IMAGES)])
+            enemy_size = max(MIN_ENEMY_SIZE, round(source.get_width() * scale))
+            image = pygame.transform.smoothscale(source, (enemy_size, enemy_size))
+            if index > 0:
+                image.set_alpha(LATER_WAVE_ALPHA)
+            half = enemy_size / 2
+            surface.blits([
+                (image, (x * scale - half, y * scale - half)) for x, y in waves[index][1]
+            ], False)
+
+        pygame.draw.rect(surface, BORDER_COLOR, surface.get_rect(), 1)
+        self.rendered += 1
+        return surface
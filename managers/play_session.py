@@ -0,0 +1,370 @@
+"""
+Play Session for Galaxy Shooter
+
+This class holds the game world of the level being played and the rules
+of one PLAYING tick: firing, collisions, the boss, deaths and level
+completion. Everything that plays the game goes through it:
+- main.py, with the keyboard moving a single ship
+- tools.determinism and tools.leak_check, with scripted input
+- the co-op server (net.simulation), with one ship per connected player
+  and groups that mirror their sprites to the clients
+
+Every tick of play can be packed into a TickState (see core.tick_state)
+and restored later, which the rewind buffer and the determinism check
+build on.
+
+Design principles used:
+- Single Responsibility: Plays the rules of a level, knows nothing about input or drawing
+- Encapsulation: Callers see the outcome of a tick, not how it was reached
+"""
+
+import random
+import pygame
+from core import config
+from core.sprite_group import FastGroup
+from core.tick_state import TickState
+from core.rewind import RewindBuffer
+from entities.bullet import Bullets
+from entities.enemyBullets import EnemyBullet
+from entities.explosion_field import ExplosionField
+from entities.bullet_field import BulletField
+from entities.bullet_patterns import Volley
+from managers.fire_scheduler import EnemyFireScheduler
+from managers import telemetry as events
+from managers import sound_manager as sounds
+
+# Outcomes of a tick
+DEATH = "death"
+COMPLETE = "complete"
+
+
+class PlaySession:
+    """
+    The sprites, bullets and timers of one level being played.
+    """
+
+    def __init__(self, level_manager, telemetry=None, sound=None, fps=config.FPS,
+                 screen_height=config.SCREEN_HEIGHT, bullet_group=None, enemy_group=None,
+                 enemy_bullet_group=None, boss_bullet_field=None):
+        """
+        Initialize an empty session; start() loads a level into it.
+
+        Args:
+            level_manager: LevelManager providing the levels and recording runs
+            telemetry: Telemetry sink for gameplay events (optional)
+            sound: SoundManager playing the effects of each tick (optional)
+            fps: Ticks per second
+            screen_height: Height of the game screen
+            bullet_group: Group for player bullets (a new FastGroup if None)
+            enemy_group: Group for enemies (a new FastGroup if None)
+            enemy_bullet_group: Group for enemy bullets (a new FastGroup if None)
+            boss_bullet_field: BulletField for boss patterns (a new one if None)
+        """
+        self.level_manager = level_manager
+        self.telemetry = telemetry
+        self.sound = sound
+        self.screen_height = screen_height
+        self.fire_scheduler = EnemyFireScheduler(1000 / fps)
+        self.players = []  # Every ship, in start order
+        self.spawns = {}  # Player -> (x, y) start position
+        self.player_group = FastGroup()  # The ships still flying
+        self.bullet_group = FastGroup() if bullet_group is None else bullet_group
+        self.enemy_group = FastGroup() if enemy_group is None else enemy_group
+        self.enemy_bullet_group = FastGroup() if enemy_bullet_group is None else enemy_bullet_group
+        self.boss_group = FastGroup()
+        self.boss_bullet_field = BulletField() if boss_bullet_field is None else boss_bullet_field
+        self.explosion_field = ExplosionField()
+        self.rewind_buffer = RewindBuffer(fps=fps)  # The last seconds of play, for rewinding
+        self.level = None
+        self.level_elapsed = 0  # Milliseconds of play in the current level
+        self.seed = None  # Random seed of the current run, stored with its result
+        self.boss_announced = False  # The boss arrival sound plays once per run, not again after a rewind
+        self.new_best = False  # Whether the last completed run set a best time
+
+    @property
+    def player(self):
+        """The first ship, or None before one was added"""
+        return self.players[0] if self.players else None
+
+    def add_player(self, player, flying=True):
+        """
+        Add a ship; start() puts it back at its position of now.
+
+        Args:
+            player: Player sprite
+            flying: Whether the ship takes part in the current run already
+        """
+        self.players.append(player)
+        self.spawns[player] = player.rect.center
+        if flying:
+            self.player_group.add(player)
+
+    def remove_player(self, player):
+        """Take a ship out of the game"""
+        self.players.remove(player)
+        del self.spawns[player]
+        player.kill()
+
+    def _play(self, name):
+        if self.sound is not None:
+            self.sound.play(name)
+
+    def _record(self, kind, x=0.0, y=0.0, value=0.0):
+        if self.telemetry is not None:
+            self.telemetry.record(kind, x, y, value)
+
+    def start(self, level_index, seed=None):
+        """
+        Start (or restart) a level with every ship back at its start.
+
+        Args:
+            level_index: Index of the level to start (0 = Level 1)
+            seed: Random seed of the run (a random one if None)
+        """
+        # Seed every run so its result can be replayed
+        self.seed = random.randrange(1 << 31) if seed is None else seed
+        random.seed(self.seed)
+        self.level = self.level_manager.load_level(level_index)
+
+        self.bullet_group.empty()
+        self.enemy_group.empty()
+        self.enemy_bullet_group.empty()
+        self.explosion_field.clear()
+        self.player_group.empty()
+        self.boss_group.empty()
+        self.boss_bullet_field.clear()
+        self.fire_scheduler.clear()
+        self.rewind_buffer.clear()
+
+        # The same ships fly every run, moved back to where they started
+        for player in self.players:
+            player.reset(*self.spawns[player])
+            self.player_group.add(player)
+
+        self.enemy_group.add(self.level.enemy_group)
+        self.fire_scheduler.add_all(self.enemy_group)
+        self.level_elapsed = 0
+        self.boss_announced = False
+        self.new_best = False
+
+        if self.telemetry is not None:
+            self.telemetry.level_number = self.level.level_number
+            if self.player is not None:
+                self._record(events.LEVEL_START, *self.player.rect.center)
+
+    def shoot(self, player):
+        """
+        Fire a ship's gun if it has reloaded.
+
+        Args:
+            player: Player sprite
+
+        Returns:
+            The new bullet, or None
+        """
+        bullet = player.shoot()
+        if bullet:
+            self.bullet_group.add(bullet)
+            self._play(sounds.SHOT)
+            self._record(events.SHOT, *bullet.rect.center)
+        return bullet
+
+    def target(self):
+        """Center of the first ship still flying, for aimed boss patterns"""
+        for player in self.players:
+            if player in self.player_group:
+                return player.rect.center
+        return None
+
+    def step(self, dt, explosion_step=1, update_players=True):
+        """
+        Play one tick.
+
+        Args:
+            dt: Delta time in milliseconds
+            explosion_step: Animation steps explosions advance by
+            update_players: Whether the ships move themselves (keyboard
+                            input); callers that move them pass False
+
+        Returns:
+            DEATH when the last ship was destroyed, COMPLETE when the
+            level was completed, otherwise None
+        """
+        level = self.level
+        self.level_elapsed += dt
+        if self.telemetry is not None:
+            self.telemetry.advance(dt)
+
+        # Only enemies whose next shot is due are touched
+        self.enemy_bullet_group.add(self.fire_scheduler.update(dt))
+
+        boss = level.get_boss()
+        if boss and not boss.is_defeated():
+            boss_bullet = boss.update_shooting(dt, self.target())
+            if boss_bullet:
+                for bullet in boss_bullet if isinstance(boss_bullet, list) else [boss_bullet]:
+                    if isinstance(bullet, Volley):
+                        self.boss_bullet_field.emit(bullet)
+                    else:
+                        self.enemy_bullet_group.add(bullet)
+
+            if boss not in self.boss_group:
+                self.boss_group.add(boss)
+                if not self.boss_announced:
+                    self._play(sounds.BOSS)
+                    self.boss_announced = True
+
+        for bullet in self.bullet_group:
+            hit_enemies = pygame.sprite.spritecollide(bullet, self.enemy_group, True)
+            if hit_enemies:
+                bullet.kill()
+                for enemy in hit_enemies:
+                    self.fire_scheduler.remove(enemy)
+                    self.explosion_field.add(enemy.rect.centerx, enemy.rect.centery)
+                    level.enemy_killed(enemy)
+                    self._play(sounds.EXPLOSION)
+
+        if boss and not boss.is_defeated():
+            for bullet in pygame.sprite.spritecollide(boss, self.bullet_group, True):
+                self._play(sounds.HIT)
+                if not boss.take_damage(1):
+                    self._play(sounds.EXPLOSION)
+                    self.explosion_field.add(boss.rect.centerx, boss.rect.centery)
+                    level.boss_killed()
+                    self.boss_group.remove(boss)
+                    # The other bullets of this tick hit a boss that is already down
+                    break
+
+        # An enemy reaching the bottom destroys every ship, a bullet only the ship it hits
+        landed = any(enemy.rect.bottom >= self.screen_height - 100 for enemy in self.enemy_group)
+        destroyed = [
+            player for player in self.player_group
+            if (landed or pygame.sprite.spritecollide(player, self.enemy_bullet_group, True)
+                or self.boss_bullet_field.collide_rect(player.rect))
+        ]
+        for player in destroyed:
+            self.explosion_field.add(player.rect.centerx, player.rect.centery)
+            player.kill()
+
+        outcome = None
+        # One death event, even when an enemy landed and a bullet hit on the same tick
+        if destroyed and not self.player_group:
+            last = destroyed[-1]
+            self._play(sounds.EXPLOSION)
+            self._record(events.DEATH, last.rect.centerx, last.rect.centery, self.level_elapsed)
+            self.end_run(DEATH)
+            outcome = DEATH
+
+        if level.is_level_complete():
+            index = self.level_manager.get_current_level_index()
+            self.level_manager.mark_level_completed(index)
+            self.new_best = self.level_manager.record_level_time(index, self.level_elapsed)
+            if self.player is not None:
+                self._record(events.LEVEL_COMPLETE, *self.player.rect.center, self.level_elapsed)
+            self.end_run(COMPLETE)
+            outcome = COMPLETE
+
+        if update_players:
+            self.player_group.update()
+        self.bullet_group.update()
+        self.enemy_group.update()
+        self.enemy_bullet_group.update()
+        self.boss_bullet_field.update()
+        self.explosion_field.update(explosion_step)
+        self.boss_group.update(dt)  # Boss group needs dt for timing
+
+        level.update(dt)
+        spawned = level.take_spawned()
+        self.enemy_group.add(spawned)
+        self.fire_scheduler.add_all(spawned)
+        return outcome
+
+    def end_run(self, outcome):
+        """
+        Record the current run in the run history.
+
+        Args:
+            outcome: "death", "complete" or "abandoned"
+        """
+        self.level_manager.record_run(outcome, self.level_elapsed, self.seed)
+
+    def capture_tick(self):
+        """
+        Capture the gameplay state of the tick that just finished.
+
+        Returns:
+            TickState
+        """
+        state = TickState()
+        now = pygame.time.get_ticks()
+        state.set_table("timers", 2, (self.level_elapsed, self.fire_scheduler.time))
+        state.set_table("player", 3, [
+            v for player in self.players
+            for v in (player.rect.x, player.rect.y, player.last_shot - now)
+        ])
+        self.level.capture_state(state)
+        state.set_table("bullets", 2, [v for bullet in self.bullet_group for v in bullet.rect.center])
+        state.set_table("enemy_bullets", 2, [v for bullet in self.enemy_bullet_group for v in bullet.rect.center])
+        field = self.boss_bullet_field
+        state.set_table("boss_bullets", 4, [
+            v for i in range(len(field))
+            for v in (field.xs[i], field.ys[i], field.dxs[i], field.dys[i])
+        ])
+        return state
+
+    def restore_tick(self, data):
+        """
+        Put the game back into a state packed from capture_tick().
+
+        Args:
+            data: Packed TickState bytes
+        """
+        state = TickState.from_bytes(data)
+        state.restore_rng()
+        self.level_elapsed, self.fire_scheduler.time = state.row("timers")
+        now = pygame.time.get_ticks()
+        for player, (x, y, last_shot) in zip(self.players, state.rows("player")):
+            player.rect.x, player.rect.y = x, y
+            player.last_shot = now + int(last_shot)
+
+        alive = self.level.restore_state(state)
+        self.enemy_group.empty()
+        self.enemy_group.add(alive)
+        scheduler_time = self.fire_scheduler.time
+        self.fire_scheduler.clear()
+        self.fire_scheduler.time = scheduler_time
+        for enemy in alive:
+            self.fire_scheduler.resume(enemy)
+        # A boss that was on the field at that tick stays on it
+        self.boss_group.empty()
+        boss = self.level.get_boss()
+        if boss is not None and not boss.is_defeated():
+            self.boss_group.add(boss)
+
+        self.bullet_group.empty()
+        self.bullet_group.add([Bullets(x, y) for x, y in state.rows("bullets")])
+        self.enemy_bullet_group.empty()
+        self.enemy_bullet_group.add([EnemyBullet(x, y) for x, y in state.rows("enemy_bullets")])
+        field = self.boss_bullet_field
+        field.clear()
+        values = state.values("boss_bullets")
+        field.xs.extend(values[0::4])
+        field.ys.extend(values[1::4])
+        field.dxs.extend(values[2::4])
+        field.dys.extend(values[3::4])
+
+    def record(self):
+        """Keep the tick that just finished in the rewind buffer"""
+        self.rewind_buffer.push(self.capture_tick().to_bytes())
+
+    def rewind(self, explosion_step=1):
+        """
+        Step back one recorded tick instead of simulating.
+
+        Args:
+            explosion_step: Animation steps explosions advance by
+        """
+        state = self.rewind_buffer.pop()
+        if state is not None:
+            self.restore_tick(state)
+        self.explosion_field.update(explosion_step)
@@ -0,0 +1,132 @@
+"""
+Quality Governor for Galaxy Shooter
+
+This class keeps the game inside its frame budget (1000 / FPS ms, 20 ms
+at 50 FPS) on hosts that cannot afford full quality:
+- Every frame reports how long its work took (simulation and drawing,
+  not the wait for the next tick)
+- When the average over a short window uses up most of the budget, the
+  governor steps down one quality level. Each level is cheaper than the
+  one before: fewer concurrent explosions, explosions that skip animation
+  frames, a HUD refreshed less often and finally a lower internal
+  resolution for the game world (the window keeps its size)
+- When the average stays well under the budget for longer, it steps back
+  up. If the restored level runs out of budget again soon, the next
+  restore waits twice as long, so the governor does not flip between two
+  levels every few seconds
+- Every transition is printed and kept in transitions
+
+The governor only decides. main.py applies the current QualityLevel where
+explosions are created and updated, where the HUD is drawn and, through
+on_change, to the resolution the render backend draws the world at.
+
+Design principles used:
+- Single Responsibility: Chooses the quality level, knows nothing about drawing
+- Open/Closed: Quality steps are data (QUALITY_LEVELS), not code
+"""
+
+import collections
+from core import config
+
+QualityLevel = collections.namedtuple(
+    'QualityLevel',
+    ['name', 'max_explosions', 'explosion_step', 'hud_interval', 'render_scale']
+)
+QualityLevel.__doc__ = """
+One quality step.
+
+    name: Name used in the log
+    max_explosions: Most explosions alive at once (None for no limit)
+    explosion_step: Animation frames an explosion advances per tick
+    hud_interval: The HUD values are refreshed every this many frames
+    render_scale: Factor applied to the configured render scale (world resolution only)
+"""
+
+# Best first; each step is cheaper than the one before
+QUALITY_LEVELS = (
+    QualityLevel("full", None, 1, 1, 1.0),
+    QualityLevel("fewer explosions", 12, 1, 1, 1.0),
+    QualityLevel("short explosions", 8, 2, 1, 1.0),
+    QualityLevel("slow HUD", 6, 2, 5, 1.0),
+    QualityLevel("low resolution", 4, 2, 5, 0.75),
+)
+
+
+class QualityGovernor:
+    """
+    Lowers and restores quality according to measured frame times.
+    """
+
+    def __init__(self, budget_ms=1000 / config.FPS, levels=QUALITY_LEVELS, on_change=None,
+                 degrade_frames=25, restore_frames=100, degrade_load=0.9, restore_load=0.5):
+        """
+        Args:
+            budget_ms: Time available per frame in milliseconds
+            levels: Quality levels, best first
+            on_change: Callable (old_level, new_level) run after every transition (optional)
+            degrade_frames: Frames averaged before stepping down
+            restore_frames: Frames averaged before stepping up
+            degrade_load: Step down above this fraction of the budget
+            restore_load: Step up below this fraction of the budget
+        """
+        self.budget_ms = budget_ms
+        self.levels = levels
+        self.on_change = on_change
+        self.degrade_frames = degrade_frames
+        self.restore_frames = restore_frames
+        self.degrade_load = degrade_load
+        self.restore_load = restore_load
+        self.index = 0
+        self.level = levels[0]
+        self.transitions = []  # (frame, old name, new name, average ms)
+        self.frames = 0
+        self._times = collections.deque(maxlen=max(degrade_frames, restore_frames))
+        self._restore_wait = restore_frames
+        self._last_restore = None
+
+    def frame(self, work_ms):
+        """
+        Report the work time of one frame and adjust the quality if needed.
+
+        Args:
+            work_ms: Milliseconds spent simulating and drawing the frame
+
+        Returns:
+            The QualityLevel to use from now on
+        """
+        self.frames += 1
+        times = self._times
+        times.append(work_ms)
+        count = len(times)
+
+        if count >= self.degrade_frames and self.index < len(self.levels) - 1:
+            recent = sum(times[i] for i in range(count - self.degrade_frames, count)) / self.degrade_frames
+            if recent > self.budget_ms * self.degrade_load:
+                # Stepping down soon after a restore: that level costs too much for now
+                if self._last_restore is not None and self.frames - self._last_restore < self._restore_wait * 2:
+                    self._restore_wait = min(self._restore_wait * 2, self.restore_frames * 32)
+                self._set(self.index + 1, recent)
+                return self.level
+
+        if count >= min(self._restore_wait, times.maxlen) and self.index > 0:
+            average = sum(times) / count
+            if average < self.budget_ms * self.restore_load and self._since_change() >= self._restore_wait:
+                self._last_restore = self.frames
+                self._set(self.index - 1, average)
+        return self.level
+
+    def _since_change(self):
+        if not self.transitions:
+            return self.frames
+        return self.frames - self.transitions[-1][0]
+
+    def _set(self, index, average_ms):
+        old = self.level
+        self.index = index
+        self.level = self.levels[index]
+        self._times.clear()
+        self.transitions.append((self.frames, old.name, self.level.name, average_ms))
+        print(f"[quality] {old.name} -> {self.level.name} "
+              f"(frame work {average_ms:.1f} ms of {self.budget_ms:.1f} ms)")
+        if self.on_change is not None:
+            self.on_change(old, self.level)
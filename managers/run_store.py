@@ -0,0 +1,278 @@
+"""
+Run Store for Galaxy Shooter
+
+This class keeps the history of every run in a local SQLite database:
+- Level, outcome ("complete", "death" or "abandoned") and duration. Levels
+  are stored by their stable id (BaseLevel.get_level_id(): the class name,
+  or the file name of a level file), so results stay with their level
+  when level files are added or reordered
+- Kills, the random seed the run was played with, and the game build
+
+The table is indexed for the two questions the game asks:
+- Best runs of a level: (level, outcome, duration_ms), so the fastest
+  completion is an index lookup rather than a scan
+- Most recent runs: (finished_at)
+
+Writes are batched and never made by the game: runs recorded during play
+are buffered, and a writer thread inserts them in one transaction once
+batch_size of them are waiting or flush_interval has passed since the first
+one, so a crash loses at most the runs of the last moment. Bulk imports
+(for example results of headless sweeps) insert many rows per transaction
+and build the indexes once at the end.
+
+Personal bests are cached in memory once looked up and kept current as
+runs are added, so menus can ask for them every frame.
+
+The store can be used from any thread (with GALAXY_SIM_THREAD=on runs are
+recorded on the simulation thread and the store is closed on the main
+thread): the connection is shared between threads, including the writer,
+and every access to it or to the buffers holds one lock.
+
+Design principles used:
+- Single Responsibility: Stores and queries run results only
+- Encapsulation: SQL and caching are hidden behind a small API
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from core import config
+
+OUTCOMES = ("complete", "death", "abandoned")
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    kills INTEGER NOT NULL,
+    seed INTEGER,
+    build TEXT,
+    finished_at REAL NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS runs_by_level ON runs (level, outcome, duration_ms);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (finished_at);
+"""
+
+_DROP_INDEXES = """
+DROP INDEX IF EXISTS runs_by_level;
+DROP INDEX IF EXISTS runs_by_time;
+"""
+
+_INSERT = ("INSERT INTO runs (level, outcome, duration_ms, kills, seed, build, finished_at) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+_COLUMNS = ("id", "level", "outcome", "duration_ms", "kills", "seed", "build", "finished_at")
+
+
+class RunStore:
+    """
+    SQLite-backed history of runs with cached personal bests.
+    """
+
+    def __init__(self, path=config.RUNS_PATH, batch_size=32, flush_interval=1.0):
+        """
+        Open (or create) the run database and start the writer thread.
+
+        Args:
+            path: Database file path, or ":memory:"
+            batch_size: Buffered runs that wake the writer before the flush interval
+            flush_interval: Longest time in seconds a run waits in memory
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA cache_size=-65536")
+        self.connection.executescript(_SCHEMA + _INDEXES)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._pending = []
+        self._bests = {}
+
+        self._condition = threading.Condition(self._lock)
+        self._closing = False
+        self._writer = threading.Thread(target=self._write_loop, name="run-writer", daemon=True)
+        self._writer.start()
+
+    # Writing
+
+    def add_run(self, level, outcome, duration_ms, kills, seed=None, build=config.BUILD, finished_at=None):
+        """
+        Record a run. The writer thread stores it with the next batch.
+
+        Args:
+            level: Stable level id (see BaseLevel.get_level_id())
+            outcome: One of OUTCOMES
+            duration_ms: Play time in milliseconds
+            kills: Enemies (and bosses) killed
+            seed: Random seed the run was played with
+            build: Game build identifier
+            finished_at: Unix time the run ended (now if None)
+
+        Returns:
+            True if the run is a new personal best for the level
+        """
+        with self._lock:
+            if outcome not in OUTCOMES:
+                raise ValueError(f"Unknown run outcome {outcome!r}, expected one of {', '.join(OUTCOMES)}")
+            duration_ms = int(duration_ms)
+            finished_at = time.time() if finished_at is None else finished_at
+            self._pending.append((level, outcome, duration_ms, int(kills), seed, build, finished_at))
+
+            new_best = False
+            if outcome == "complete":
+                best = self.best_time(level)
+                new_best = best is None or duration_ms < best
+                if new_best:
+                    self._bests[level] = duration_ms
+            self._condition.notify()
+            return new_best
+
+    def _write_loop(self):
+        with self._condition:
+            while True:
+                self._condition.wait_for(lambda: self._pending or self._closing)
+                if self._closing:
+                    return
+                # Runs finished soon after this one join the same transaction
+                self._condition.wait_for(lambda: len(self._pending) >= self.batch_size or self._closing,
+                                         self.flush_interval)
+                self.flush()
+
+    def flush(self):
+        """Insert every buffered run in a single transaction"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            with self.connection:
+                self.connection.executemany(_INSERT, pending)
+
+    def import_runs(self, rows, batch_size=100000, rebuild_indexes=True):
+        """
+        Bulk insert runs, many per transaction.
+
+        With rebuild_indexes the indexes are dropped for the import and
+        built once at the end, which is much faster than updating them row
+        by row for large imports.
+
+        Args:
+            rows: Iterable of (level id, outcome, duration_ms, kills, seed, build, finished_at)
+            batch_size: Rows per transaction
+            rebuild_indexes: Drop and rebuild the indexes around the import
+
+        Returns:
+            Number of rows inserted
+        """
+        with self._lock:
+            self.flush()
+            if rebuild_indexes:
+                self.connection.executescript(_DROP_INDEXES)
+            count = 0
+            try:
+                batch = []
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        with self.connection:
+                            self.connection.executemany(_INSERT, batch)
+                        count += len(batch)
+                        batch = []
+                if batch:
+                    with self.connection:
+                        self.connection.executemany(_INSERT, batch)
+                    count += len(batch)
+            finally:
+                if rebuild_indexes:
+                    self.connection.executescript(_INDEXES)
+                # Imported runs may beat the cached bests
+                self._bests.clear()
+            return count
+
+    # Queries
+
+    def best_time(self, level):
+        """
+        Get the fastest completion of a level.
+
+        Args:
+            level: Stable level id
+
+        Returns:
+            Duration in milliseconds, or None if the level was never completed
+        """
+        with self._lock:
+            if level not in self._bests:
+                row = self.connection.execute(
+                    "SELECT MIN(duration_ms) FROM runs WHERE level = ? AND outcome = 'complete'",
+                    (level,)
+                ).fetchone()
+                self._bests[level] = row[0]
+            return self._bests[level]
+
+    def top_runs(self, level, limit=10):
+        """
+        Get the fastest completions of a level.
+
+        Args:
+            level: Stable level id
+            limit: Maximum number of runs
+
+        Returns:
+            List of run dicts, fastest first
+        """
+        with self._lock:
+            self.flush()
+            cursor = self.connection.execute(
+                "SELECT * FROM runs WHERE level = ? AND outcome = 'complete' "
+                "ORDER BY duration_ms LIMIT ?",
+                (level, limit)
+            )
+            return [dict(zip(_COLUMNS, row)) for row in cursor]
+
+    def recent_runs(self, limit=10):
+        """
+        Get the most recently finished runs.
+
+        Args:
+            limit: Maximum number of runs
+
+        Returns:
+            List of run dicts, newest first
+        """
+        with self._lock:
+            self.flush()
+            cursor = self.connection.execute(
+                "SELECT * FROM runs ORDER BY finished_at DESC LIMIT ?", (limit,)
+            )
+            return [dict(zip(_COLUMNS, row)) for row in cursor]
+
+    def count(self):
+        """Return the number of stored runs"""
+        with self._lock:
+            self.flush()
+            return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def close(self):
+        """Stop the writer thread, write buffered runs and close the database"""
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._writer.join()
+        with self._lock:
+            self.flush()
+            self.connection.close()
@@ -0,0 +1,205 @@
+"""
+Save Manager for Galaxy Shooter
+
+This class persists player progress between sessions:
+- Completed levels
+- Best completion time per level
+- Settings (the sound volume chosen in the main menu)
+
+Levels are keyed by their stable id (BaseLevel.get_level_id()), so progress
+stays with its level when level files are added or reordered. The save is
+the only store of best times; the run history (managers.run_store) keeps
+every run but is not asked for personal bests.
+
+Writes never block the game loop and never leave a broken save behind:
+- The game thread only serializes the data and hands it to a writer thread
+- The writer waits a short moment so that several saves in a row (for
+  example everything recorded at level complete) become a single write
+- Each write goes to a temporary file that is fsynced and then renamed over
+  the save file, so a crash mid-write leaves the previous save intact
+
+Design principles used:
+- Single Responsibility: Handles only persistence of progress
+- Encapsulation: File format and threading are hidden behind a small API
+"""
+
+import json
+import os
+import threading
+import time
+from core import config
+
+SAVE_VERSION = 1
+
+
+class SaveManager:
+    """
+    Loads the save file at startup and writes it back asynchronously.
+    """
+
+    def __init__(self, path=config.SAVE_PATH, coalesce_delay=0.25):
+        """
+        Initialize the save manager and load any existing save.
+
+        Args:
+            path: Path of the save file
+            coalesce_delay: Seconds the writer waits for further saves before writing
+        """
+        self.path = path
+        self.coalesce_delay = coalesce_delay
+        self.data = self._load()
+        self.writes = 0
+
+        self._pending = None
+        self._condition = threading.Condition()
+        self._closing = False
+        self._writer = threading.Thread(target=self._write_loop, name="save-writer", daemon=True)
+        self._writer.start()
+
+    @staticmethod
+    def _default_data():
+        return {
+            'version': SAVE_VERSION,
+            'levels_completed': [],
+            'best_times': {},
+            'settings': {}
+        }
+
+    def _load(self):
+        """Read the save file, falling back to an empty save if it is missing or unreadable"""
+        data = self._default_data()
+        try:
+            with open(self.path, "r", encoding="utf-8") as save_file:
+                loaded = json.load(save_file)
+        except FileNotFoundError:
+            return data
+        except (OSError, ValueError) as e:
+            print(f"Could not read save file {self.path}: {e}")
+            return data
+        if isinstance(loaded, dict):
+            for key in data:
+                if key in loaded and isinstance(loaded[key], type(data[key])):
+                    data[key] = loaded[key]
+        return data
+
+    # Progress
+
+    def get_levels_completed(self):
+        """Return the list of completed level ids"""
+        return [level_id for level_id in self.data['levels_completed'] if isinstance(level_id, str)]
+
+    def set_levels_completed(self, level_ids):
+        """
+        Store the completed level ids and save.
+
+        Args:
+            level_ids: Iterable of completed level ids
+        """
+        self.data['levels_completed'] = sorted(level_ids)
+        self.save()
+
+    def get_best_time(self, level_id):
+        """
+        Get the best completion time of a level.
+
+        Args:
+            level_id: Stable level id
+
+        Returns:
+            Best time in milliseconds, or None if never completed
+        """
+        return self.data['best_times'].get(level_id)
+
+    def record_time(self, level_id, time_ms):
+        """
+        Record a completion time, keeping it only if it beats the best.
+
+        Args:
+            level_id: Stable level id
+            time_ms: Completion time in milliseconds
+
+        Returns:
+            True if this is a new best time, False otherwise
+        """
+        best = self.get_best_time(level_id)
+        if best is not None and best <= time_ms:
+            return False
+        self.data['best_times'][level_id] = int(time_ms)
+        self.save()
+        return True
+
+    # Settings
+
+    def get_setting(self, name, default=None):
+        """Get a stored setting"""
+        return self.data['settings'].get(name, default)
+
+    def set_setting(self, name, value):
+        """
+        Store a setting and save.
+
+        Args:
+            name: Setting name
+            value: JSON-serializable value
+        """
+        self.data['settings'][name] = value
+        self.save()
+
+    def reset(self):
+        """Forget all progress and settings, and save"""
+        self.data = self._default_data()
+        self.save()
+
+    # Writing
+
+    def save(self):
+        """
+        Queue the current data for writing. Returns immediately.
+
+        Saves requested while a write is waiting replace the queued data,
+        so only the latest state is written.
+        """
+        payload = json.dumps(self.data, sort_keys=True)
+        with self._condition:
+            self._pending = payload
+            self._condition.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closing:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                # Let saves requested right after this one join the same write
+                deadline = time.monotonic() + self.coalesce_delay
+                while not self._closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                payload, self._pending = self._pending, None
+            self._write(payload)
+
+    def _write(self, payload):
+        """Atomically replace the save file with payload"""
+        temp_path = self.path + ".tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as temp_file:
+                temp_file.write(payload)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, self.path)
+            self.writes += 1
+        except OSError as e:
+            print(f"Could not write save file {self.path}: {e}")
+
+    def close(self):
+        """Write any queued save and stop the writer thread"""
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._writer.join()
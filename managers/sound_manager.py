@@ -0,0 +1,203 @@
+"""
+Sound Manager for Galaxy Shooter
+
+This class plays the game's sound effects:
+- Every sound is decoded once, when the manager is created. Sounds are
+  loaded from assets/sounds/<name>.wav (or .ogg); a missing file is
+  replaced by a short synthesized effect, so the game always has audio
+- Sounds play through a fixed pool of mixer channels. Each category
+  (shot, hit, explosion, boss) owns as many channels as its voice limit,
+  so a flood of one sound can never cut off the others; when a category
+  is full its voices are replaced in turn
+- play() only counts requests. flush(), called once per tick, starts each
+  requested sound once, slightly louder when it was requested many times.
+  Fifty hits in one tick cost one channel operation, not fifty
+
+Without an audio device (or with GALAXY_SOUND=off) the manager stays
+silent and every call is a cheap no-op.
+
+Design principles used:
+- Single Responsibility: Plays sound effects, knows nothing about gameplay rules
+- Encapsulation: Mixer channels and decoded sounds stay inside the class
+"""
+
+import io
+import math
+import os
+import random
+import wave
+from array import array
+import pygame
+from core import config
+
+SOUND_DIR = 'assets/sounds'
+
+SHOT = "shot"
+HIT = "hit"
+EXPLOSION = "explosion"
+BOSS = "boss"
+
+# Channels (simultaneous voices) owned by each category
+VOICE_LIMITS = {
+    SHOT: 3,
+    HIT: 2,
+    EXPLOSION: 4,
+    BOSS: 1,
+}
+
+SAMPLE_RATE = 22050
+
+
+def _to_wav(samples):
+    """Wrap 16-bit mono samples in an in-memory WAV file"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+    buffer.seek(0)
+    return buffer
+
+
+def _synthesize(name):
+    """
+    Generate a fallback effect.
+
+    Args:
+        name: Sound name (SHOT, HIT, EXPLOSION or BOSS)
+
+    Returns:
+        array('h') of 16-bit mono samples
+    """
+    rng = random.Random(name)
+    if name == SHOT:
+        # Falling square-ish chirp
+        duration, start, end, noise = 0.09, 1400.0, 500.0, 0.0
+    elif name == HIT:
+        duration, start, end, noise = 0.05, 300.0, 200.0, 0.8
+    elif name == EXPLOSION:
+        duration, start, end, noise = 0.45, 90.0, 40.0, 1.0
+    else:
+        # Boss arrival: long low growl
+        duration, start, end, noise = 0.8, 110.0, 55.0, 0.3
+    count = int(SAMPLE_RATE * duration)
+    samples = array('h', bytes(2 * count))
+    phase = 0.0
+    smoothed = 0.0
+    for i in range(count):
+        t = i / count
+        phase += 2 * math.pi * (start + (end - start) * t) / SAMPLE_RATE
+        tone = 1.0 if math.sin(phase) >= 0 else -1.0
+        # Low-passed noise sounds like rumble rather than hiss
+        smoothed += (rng.uniform(-1.0, 1.0) - smoothed) * 0.2
+        value = tone * (1.0 - noise) + smoothed * 2.5 * noise
+        envelope = (1.0 - t) ** 2
+        samples[i] = int(max(-1.0, min(1.0, value * envelope)) * 12000)
+    return samples
+
+
+class SoundManager:
+    """
+    Coalescing sound effect player with a fixed channel pool.
+    """
+
+    def __init__(self, enabled=config.SOUND_ENABLED, volume=config.SOUND_VOLUME, voice_limits=None,
+                 sound_dir=SOUND_DIR):
+        """
+        Open the mixer (if needed), decode every sound and reserve channels.
+
+        Args:
+            enabled: Set False to stay silent
+            volume: Master volume in [0, 1]
+            voice_limits: Channels per category (defaults to VOICE_LIMITS)
+            sound_dir: Directory searched for <name>.wav / <name>.ogg
+        """
+        self.volume = volume
+        self.voice_limits = dict(VOICE_LIMITS if voice_limits is None else voice_limits)
+        self.sounds = {}
+        self.channels = {}
+        self._next_voice = {}
+        self._requests = {}
+        self.channel_plays = 0  # Channel operations performed (one per sound per flush at most)
+        self.requests = 0       # play() calls, merged or not
+        self.enabled = enabled and self._open_mixer()
+        if not self.enabled:
+            return
+
+        # One fixed block of channels per category, reserved so that
+        # pygame.mixer.Sound.play() elsewhere never steals them
+        total = sum(self.voice_limits.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for name, limit in self.voice_limits.items():
+            self.sounds[name] = self._load(name, sound_dir)
+            self.channels[name] = [pygame.mixer.Channel(index + i) for i in range(limit)]
+            self._next_voice[name] = 0
+            index += limit
+
+    def _open_mixer(self):
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init()
+            return True
+        except pygame.error as e:
+            print(f"Sound disabled: {e}")
+            return False
+
+    def _load(self, name, sound_dir):
+        """Decode a sound file, or synthesize the effect if there is none"""
+        for extension in ('.wav', '.ogg'):
+            path = os.path.join(sound_dir, name + extension)
+            if os.path.exists(path):
+                try:
+                    return pygame.mixer.Sound(path)
+                except pygame.error as e:
+                    print(f"Could not load sound {path}: {e}")
+        return pygame.mixer.Sound(file=_to_wav(_synthesize(name)))
+
+    def play(self, name):
+        """
+        Request a sound for this tick. It starts on the next flush().
+
+        Args:
+            name: Sound name (SHOT, HIT, EXPLOSION or BOSS)
+        """
+        self.requests += 1
+        if self.enabled:
+            self._requests[name] = self._requests.get(name, 0) + 1
+
+    def flush(self):
+        """Start every sound requested since the last flush, once each"""
+        if not self._requests:
+            return
+        requests, self._requests = self._requests, {}
+        for name, count in requests.items():
+            channels = self.channels.get(name)
+            if not channels:
+                continue
+            # Take a free voice of the category, else replace its voices in turn
+            channel = None
+            for candidate in channels:
+                if not candidate.get_busy():
+                    channel = candidate
+                    break
+            if channel is None:
+                voice = self._next_voice[name]
+                channel = channels[voice]
+                self._next_voice[name] = (voice + 1) % len(channels)
+            # Merged requests play once, a little louder (+1.5 dB per doubling)
+            volume = min(1.0, self.volume * count ** 0.25)
+            channel.set_volume(volume)
+            channel.play(self.sounds[name])
+            self.channel_plays += 1
+
+    def stop(self):
+        """Silence every voice and drop pending requests"""
+        self._requests.clear()
+        for channels in self.channels.values():
+            for channel in channels:
+                channel.stop()
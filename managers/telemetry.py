@@ -0,0 +1,201 @@
+"""
+Telemetry for Galaxy Shooter
+
+Gameplay events (shots, kills, boss damage, deaths, level starts and
+completions) are recorded as small typed records for per-session analytics.
+
+Recording never touches the disk on the game thread:
+- record() packs the event into a fixed-size binary record and appends it
+  to an in-memory buffer
+- A writer thread flushes the buffer in batches to an append-only session
+  file, once enough events are waiting or a flush interval has passed
+- The buffer is bounded. When it is full, record() wakes the writer and
+  waits a few milliseconds for it to drain (backpressure); events that
+  still do not fit are dropped and counted instead of stalling the game
+
+File format (little endian):
+    header: magic b"GSTL", version (u16), session start unix time (f64)
+    records: length (u16) followed by the payload
+        kind (u8), level number (u8), play time ms (u32), x, y, value (f32)
+
+All records of version 1 have the same length, so readers can map a whole
+file (or a chunk of it) onto a fixed record layout.
+
+Design principles used:
+- Single Responsibility: Records events, knows nothing about gameplay rules
+- Encapsulation: Buffering, threading and the file format stay inside the class
+"""
+
+import os
+import struct
+import threading
+import time
+from core import config
+
+TELEMETRY_MAGIC = b"GSTL"
+TELEMETRY_VERSION = 1
+
+HEADER = struct.Struct('<4sHd')
+PAYLOAD = struct.Struct('<BBIfff')
+RECORD = struct.Struct('<HBBIfff')
+
+# Event kinds
+LEVEL_START = 1
+SHOT = 2
+KILL = 3
+BOSS_SPAWN = 4
+BOSS_DAMAGE = 5
+DEATH = 6
+LEVEL_COMPLETE = 7
+
+EVENT_NAMES = {
+    LEVEL_START: "level_start",
+    SHOT: "shot",
+    KILL: "kill",
+    BOSS_SPAWN: "boss_spawn",
+    BOSS_DAMAGE: "boss_damage",
+    DEATH: "death",
+    LEVEL_COMPLETE: "level_complete",
+}
+
+
+def session_path(directory=None):
+    """
+    Build a new session file path.
+
+    Args:
+        directory: Telemetry directory (config.TELEMETRY_DIR if None)
+
+    Returns:
+        Path of a file named after the current time and process id
+    """
+    directory = config.TELEMETRY_DIR if directory is None else directory
+    name = time.strftime("session-%Y%m%d-%H%M%S") + f"-{os.getpid()}.gstl"
+    return os.path.join(directory, name)
+
+
+class Telemetry:
+    """
+    Buffers gameplay events and writes them from a background thread.
+    """
+
+    def __init__(self, path=None, capacity=8192, batch_size=1024,
+                 flush_interval=1.0, block_timeout=0.005):
+        """
+        Open the session file and start the writer thread.
+
+        Args:
+            path: Session file path (a new one in config.TELEMETRY_DIR if None)
+            capacity: Maximum number of events waiting in memory
+            batch_size: Events that wake the writer before the flush interval
+            flush_interval: Longest time in seconds an event waits in memory
+            block_timeout: Seconds record() may wait for room when the buffer is full
+        """
+        self.path = session_path() if path is None else path
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+
+        self.started = time.time()
+        self.time = 0  # Milliseconds of play in this session
+        self.level_number = 0
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+
+        self._buffer = bytearray()
+        self._count = 0
+        self._condition = threading.Condition()
+        self._closing = False
+        self._file = None
+        self._writer = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+        self._writer.start()
+
+    def advance(self, dt):
+        """
+        Advance the play clock used to timestamp events.
+
+        Args:
+            dt: Delta time in milliseconds
+        """
+        self.time += dt
+
+    def record(self, kind, x=0.0, y=0.0, value=0.0, level_number=None):
+        """
+        Record one event. Never does I/O.
+
+        Args:
+            kind: Event kind (LEVEL_START, SHOT, KILL, ...)
+            x: X position of the event in arena coordinates
+            y: Y position of the event in arena coordinates
+            value: Event-specific number (remaining boss HP, level time, ...)
+            level_number: Level the event belongs to (the current level if None)
+
+        Returns:
+            True if the event was buffered, False if it was dropped
+        """
+        if level_number is None:
+            level_number = self.level_number
+        record = RECORD.pack(PAYLOAD.size, kind, level_number & 0xFF,
+                             int(self.time) & 0xFFFFFFFF, x, y, value)
+        with self._condition:
+            if self._count >= self.capacity:
+                # Backpressure: let the writer drain before giving up on the event
+                self._condition.notify()
+                self._condition.wait_for(lambda: self._count < self.capacity or self._closing,
+                                         self.block_timeout)
+                if self._count >= self.capacity:
+                    self.dropped += 1
+                    return False
+            self._buffer += record
+            self._count += 1
+            self.recorded += 1
+            if self._count >= self.batch_size:
+                self._condition.notify()
+        return True
+
+    def _open(self):
+        """Open the session file for appending, writing the header if it is new"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(TELEMETRY_MAGIC, TELEMETRY_VERSION, self.started))
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._count >= self.batch_size or self._closing,
+                                         self.flush_interval)
+                batch, self._buffer = self._buffer, bytearray()
+                count, self._count = self._count, 0
+                closing = self._closing
+                # Wake a game thread waiting for room
+                self._condition.notify_all()
+            if batch:
+                self._write(batch, count)
+            if closing:
+                return
+
+    def _write(self, batch, count):
+        """Append a batch of records to the session file"""
+        try:
+            if self._file is None:
+                self._open()
+            self._file.write(batch)
+            self._file.flush()
+            self.written += count
+        except OSError as e:
+            print(f"Could not write telemetry file {self.path}: {e}")
+
+    def close(self):
+        """Write every buffered event and stop the writer thread"""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._writer.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
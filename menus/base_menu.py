@@ -24,6 +24,9 @@ class BaseMenu(ABC):
         self.selected_option = 0
         self.options = []
         
+        # Dim overlays, built on first use: {per-pixel alpha?: Surface}
+        self._overlays = {}
+        
     def draw_title(self, surface, title):
         """Draw the menu title"""
         title_text = self.font_large.render(title, True, self.WHITE)
@@ -49,11 +52,26 @@ class BaseMenu(ABC):
                 indicator_rect.centery = option_rect.centery
                 surface.blit(indicator, indicator_rect)
     
+    @staticmethod
+    def format_time(time_ms):
+        """Format a duration in milliseconds as M:SS.hh"""
+        minutes, seconds = divmod(time_ms / 1000, 60)
+        return f"{int(minutes)}:{seconds:05.2f}"
+    
     def draw_background(self, surface):
-        """Draw semi-transparent background overlay"""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(180)
-        overlay.fill(self.BLACK)
+        """Draw semi-transparent background overlay (built once, not every frame)"""
+        per_pixel = bool(surface.get_flags() & pygame.SRCALPHA)
+        overlay = self._overlays.get(per_pixel)
+        if overlay is None:
+            if per_pixel:
+                # Translucent UI layer (SDL2 backend): blend per-pixel alpha so it stays see-through
+                overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+                overlay.fill((0, 0, 0, 180))
+            else:
+                overlay = pygame.Surface((self.screen_width, self.screen_height))
+                overlay.set_alpha(180)
+                overlay.fill(self.BLACK)
+            self._overlays[per_pixel] = overlay
         surface.blit(overlay, (0, 0))
     
     def handle_input(self, event):
@@ -10,6 +10,9 @@ class LevelCompleteMenu(BaseMenu):
         self.current_level = 1
         self.total_levels = 5
         self.level_name = ""
+        self.time_ms = None
+        self.best_ms = None
+        self.new_best = False
         self.options = ["Restart Level", "Main Menu"]
         self.selected_option = 0
         
@@ -17,16 +20,22 @@ class LevelCompleteMenu(BaseMenu):
         self.timer = 0
         self.can_proceed = False
         
-    def set_level_info(self, level_number, level_name):
+    def set_level_info(self, level_number, level_name, time_ms=None, best_ms=None, new_best=False):
         """
         Set the current level information and update menu options.
         
         Args:
             level_number: The level that was just completed (1, 2, 3, etc.)
             level_name: The name of the completed level
+            time_ms: Completion time of this run in milliseconds (optional)
+            best_ms: Personal best time of the level in milliseconds (optional)
+            new_best: Whether this run set the personal best
         """
         self.current_level = level_number
         self.level_name = level_name
+        self.time_ms = time_ms
+        self.best_ms = best_ms
+        self.new_best = new_best
         
         self.timer = 0
         self.can_proceed = False
@@ -92,6 +101,20 @@ class LevelCompleteMenu(BaseMenu):
         else:
             self.draw_options(surface)
         
+        if self.time_ms is not None:
+            if self.new_best:
+                time_message = f"New personal best: {self.format_time(self.time_ms)}!"
+                time_color = self.YELLOW
+            elif self.best_ms is not None:
+                time_message = f"Time {self.format_time(self.time_ms)} - Best {self.format_time(self.best_ms)}"
+                time_color = self.WHITE
+            else:
+                time_message = f"Time {self.format_time(self.time_ms)}"
+                time_color = self.WHITE
+            time_text = self.font_small.render(time_message, True, time_color)
+            time_rect = time_text.get_rect(center=(self.screen_width // 2, self.screen_height - 100))
+            surface.blit(time_text, time_rect)
+        
         if self.can_proceed:
             instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
         else:
@@ -27,6 +27,39 @@ class LevelSelectMenu(BaseMenu):
             "Master - 25 enemies, ultimate challenge",
             "Return to the main menu"
         ]
+        
+        # Personal best time (ms or None) of each level
+        self.best_times = []
+        
+        # Number of entries shown at once; the list scrolls with the selection
+        self.visible_options = 7
+        
+        # Callable (level index) -> thumbnail Surface or None; only called for shown rows
+        self.get_preview = None
+        self.preview_margin = 16
+    
+    def set_levels(self, levels_info, get_preview=None):
+        """
+        Rebuild the menu entries from level information.
+        
+        Args:
+            levels_info: List of level info dicts (see LevelManager.get_all_levels_info)
+            get_preview: Callable (level index) returning the level's thumbnail
+                (see LevelManager.get_level_preview), or None for text only
+        """
+        self.get_preview = get_preview
+        self.level_names = [f"Level {info['level_number']}: {info['level_name']}" for info in levels_info]
+        self.level_names.append("Back to Main Menu")
+        self.level_descriptions = [info['description'] for info in levels_info]
+        self.level_descriptions.append("Return to the main menu")
+        self.best_times = [info.get('best_time') for info in levels_info]
+        self.options = self.level_names
+        self.selected_option = min(self.selected_option, len(self.options) - 1)
+    
+    def get_first_visible(self):
+        """Index of the first entry in the scrolled view"""
+        last_first = max(0, len(self.level_names) - self.visible_options)
+        return min(max(0, self.selected_option - self.visible_options // 2), last_first)
     
     def draw(self, surface):
         """Draw the level selection menu"""
@@ -37,21 +70,43 @@ class LevelSelectMenu(BaseMenu):
         start_y = 250
         option_spacing = 70
         
-        for i, (level_name, description) in enumerate(zip(self.level_names, self.level_descriptions)):
+        first = self.get_first_visible()
+        visible = list(zip(self.level_names, self.level_descriptions))[first:first + self.visible_options]
+        
+        # With thumbnails on the left, the text is centered in the space right of them
+        center_x = self.screen_width // 2
+        previews = {}
+        if self.get_preview is not None:
+            for row in range(len(visible)):
+                if first + row < len(self.level_names) - 1:
+                    previews[row] = self.get_preview(first + row)
+            widths = [preview.get_width() for preview in previews.values() if preview is not None]
+            if widths:
+                center_x += (max(widths) + self.preview_margin) // 2
+        
+        for row, (level_name, description) in enumerate(visible):
+            i = first + row
 
             name_color = self.YELLOW if i == self.selected_option else self.WHITE
             desc_color = self.GRAY if i == self.selected_option else (100, 100, 100)
             
             name_text = self.font_medium.render(level_name, True, name_color)
-            name_rect = name_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing))
+            name_rect = name_text.get_rect(center=(center_x, start_y + row * option_spacing))
             surface.blit(name_text, name_rect)
             
 
             if i < len(self.level_descriptions) - 1:
                 desc_text = self.font_small.render(description, True, desc_color)
-                desc_rect = desc_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing + 25))
+                desc_rect = desc_text.get_rect(center=(center_x, start_y + row * option_spacing + 25))
                 surface.blit(desc_text, desc_rect)
             
+            preview = previews.get(row)
+            if preview is not None:
+                preview_rect = preview.get_rect(midleft=(self.preview_margin, start_y + row * option_spacing + 12))
+                surface.blit(preview, preview_rect)
+                if i == self.selected_option:
+                    pygame.draw.rect(surface, self.YELLOW, preview_rect.inflate(4, 4), 2)
+            
 
             if i == self.selected_option:
                 indicator = self.font_medium.render("> ", True, self.YELLOW)
@@ -60,6 +115,13 @@ class LevelSelectMenu(BaseMenu):
                 indicator_rect.centery = name_rect.centery
                 surface.blit(indicator, indicator_rect)
         
+        if self.selected_option < len(self.best_times):
+            best = self.best_times[self.selected_option]
+            best_message = f"Personal best: {self.format_time(best)}" if best is not None else "Personal best: -"
+            best_text = self.font_small.render(best_message, True, self.WHITE)
+            best_rect = best_text.get_rect(center=(self.screen_width // 2, self.screen_height - 90))
+            surface.blit(best_text, best_rect)
+        
         instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
         instruction_text = self.font_small.render(instructions, True, self.GRAY)
         instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
@@ -67,7 +129,7 @@ class LevelSelectMenu(BaseMenu):
     
     def execute_option(self):
         """Execute the selected menu option"""
-        if self.selected_option < 5:
+        if self.selected_option < len(self.level_names) - 1:
             return f"LEVEL_{self.selected_option + 1}"
         else:
             return "MAIN_MENU"
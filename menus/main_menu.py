@@ -1,13 +1,22 @@
 from .base_menu import BaseMenu
 
+# Volume levels the volume option steps through
+VOLUME_STEPS = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
 
 class MainMenu(BaseMenu):
     """Main menu displayed when the game starts"""
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, volume=0.6):
         super().__init__(screen_width, screen_height)
-        self.options = ["Start Game", "Select Level", "Quit Game"]
+        self.options = ["Start Game", "Select Level", "", "Quit Game"]
         self.selected_option = 0
+        self.set_volume(volume)
+    
+    def set_volume(self, volume):
+        """Set the sound volume shown by the volume option"""
+        self.volume = volume
+        self.options[2] = f"Volume: {round(volume * 100)}%"
     
     def draw(self, surface):
         """Draw the main menu"""
@@ -27,6 +36,10 @@ class MainMenu(BaseMenu):
             return "START_GAME"
         elif self.selected_option == 1:  # Select Level
             return "SELECT_LEVEL"
-        elif self.selected_option == 2:  # Quit Game
+        elif self.selected_option == 2:  # Volume: the next step up, silence after the loudest
+            louder = [step for step in VOLUME_STEPS if step > self.volume + 1e-6]
+            self.set_volume(louder[0] if louder else VOLUME_STEPS[0])
+            return "VOLUME"
+        elif self.selected_option == 3:  # Quit Game
             return "QUIT_GAME"
         return None
\ No newline at end of file
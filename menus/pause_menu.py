@@ -1,4 +1,5 @@
 from .base_menu import BaseMenu
+import pygame
 
 
 class PauseMenu(BaseMenu):
@@ -27,6 +28,12 @@ class PauseMenu(BaseMenu):
         instruction_rect_2 = instruction_text_2.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
         surface.blit(instruction_text_2, instruction_rect_2)
     
+    def handle_input(self, event):
+        """Handle pause menu input; ESC or P resumes the game"""
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_p):
+            return "RESUME_GAME"
+        return super().handle_input(event)
+    
     def execute_option(self):
         """Execute the selected menu option"""
         if self.selected_option == 0:  # Resume Game
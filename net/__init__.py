@@ -0,0 +1,10 @@
+"""
+Networked two-player co-op: an authoritative UDP server and its clients
+"""
+
+from .server import GameServer
+from .client import GameClient
+from .simulation import CoopSimulation
+from .replication import ReplicatedWorld, ClientWorld
+
+__all__ = ['GameServer', 'GameClient', 'CoopSimulation', 'ReplicatedWorld', 'ClientWorld']
@@ -0,0 +1,171 @@
+"""
+Co-op client
+
+GameClient joins a GameServer, sends one input per tick and keeps a
+ClientWorld updated from the server's snapshots.
+
+The local ship is predicted: each input moves it immediately, exactly as
+the server will. Every snapshot says which input the server applied last;
+the client then puts its ship where the server has it and replays the
+inputs the server has not applied yet, so the ship never waits for a round
+trip and still ends up wherever the server decides.
+"""
+
+import collections
+import socket
+import time
+from core import config
+from entities.player import Player
+from . import protocol
+from .replication import ClientWorld
+
+
+class GameClient:
+    """
+    UDP client of the co-op server.
+    """
+
+    def __init__(self, server_address, screen_width=config.SCREEN_WIDTH, screen_height=config.SCREEN_HEIGHT):
+        """
+        Args:
+            server_address: (host, port) of the server
+            screen_width: Arena width
+            screen_height: Arena height
+        """
+        self.server_address = server_address
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.world = ClientWorld(screen_width, screen_height)
+        self.slot = None
+        self.tick_rate = config.FPS
+        self.level_number = 0
+        self.status = protocol.STATUS_PLAYING
+        self.player = None
+        self.player_id = None
+        self.player_alive = True
+        self.sequence = 0
+        self.pending = collections.deque()  # (sequence, buttons) not applied by the server yet
+        self.snapshot_time = None
+        self.bytes_received = 0
+        self.snapshots_received = 0
+        self.removed = []  # (kind, x, y) of entities removed by the last snapshots
+
+    def connect(self, timeout=3.0):
+        """
+        Ask the server for a player slot.
+
+        Raises:
+            ConnectionError: If the server is full or does not answer
+        """
+        deadline = time.monotonic() + timeout
+        next_hello = 0
+        while time.monotonic() < deadline:
+            if time.monotonic() >= next_hello:
+                self.socket.sendto(protocol.encode_hello(), self.server_address)
+                next_hello = time.monotonic() + 0.2
+            try:
+                data, _ = self.socket.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                time.sleep(0.01)
+                continue
+            if data[:1] == protocol.encode_full():
+                raise ConnectionError("Server is full")
+            if data and data[0] == protocol.WELCOME:
+                _, self.slot, self.tick_rate = protocol.WELCOME_MESSAGE.unpack_from(data)
+                self.player = Player(self.screen_width // 2, self.screen_height - 130, self.screen_width)
+                return self.slot
+        raise ConnectionError(f"No answer from {self.server_address[0]}:{self.server_address[1]}")
+
+    def send_input(self, buttons):
+        """
+        Apply one tick of input to the local ship and send it to the server.
+
+        Args:
+            buttons: Bitmask of protocol.LEFT, protocol.RIGHT and protocol.SHOOT
+        """
+        self.sequence += 1
+        self.pending.append((self.sequence, buttons))
+        if self.player_alive and self.status == protocol.STATUS_PLAYING:
+            self._move(buttons)
+        inputs = list(self.pending)[-protocol.MAX_INPUTS_PER_PACKET:]
+        packet = protocol.encode_input(self.slot, self.world.tick, self.world.ack_bits, inputs)
+        self.socket.sendto(packet, self.server_address)
+
+    def _move(self, buttons):
+        self.player.move(bool(buttons & protocol.RIGHT) - bool(buttons & protocol.LEFT))
+
+    def poll(self):
+        """
+        Apply every snapshot waiting on the socket.
+
+        Returns:
+            Number of snapshots applied
+        """
+        applied = 0
+        while True:
+            try:
+                data, _ = self.socket.recvfrom(2048)
+            except (BlockingIOError, InterruptedError, ConnectionResetError):
+                break
+            if not data or data[0] != protocol.SNAPSHOT:
+                continue
+            self.bytes_received += len(data)
+            self.snapshots_received += 1
+            tick, input_sequence, level_number, status, updates, removals = protocol.decode_snapshot(data)
+            records = self.world.records
+            removed = [records[entity_id][:3] for entity_id in removals if entity_id in records]
+            if not self.world.apply(tick, updates, removals):
+                continue
+            self.removed.extend(removed)
+            self.level_number = level_number
+            self.status = status
+            self.snapshot_time = time.monotonic()
+            for entity_id, state in updates:
+                if state[0] == protocol.PLAYER and state[5] >> 1 == self.slot:
+                    self.player_id = entity_id
+            self._reconcile(input_sequence)
+            applied += 1
+        return applied
+
+    def _reconcile(self, input_sequence):
+        """Move the local ship to where the server has it and replay newer inputs"""
+        pending = self.pending
+        while pending and pending[0][0] <= input_sequence:
+            pending.popleft()
+        record = self.world.records.get(self.player_id)
+        if record is None:
+            return
+        _, x, y, dx, dy, aux, tick = record
+        elapsed = self.world.tick - tick
+        self.player_alive = bool(aux & 1)
+        self.player.rect.center = (round(x + dx * elapsed), round(y + dy * elapsed))
+        if self.player_alive and self.status == protocol.STATUS_PLAYING:
+            for _, buttons in pending:
+                self._move(buttons)
+
+    def render_tick(self):
+        """Tick to draw: the last snapshot's tick plus the time since it arrived"""
+        if self.snapshot_time is None:
+            return self.world.tick
+        elapsed = (time.monotonic() - self.snapshot_time) * self.tick_rate
+        return self.world.tick + min(elapsed, 3.0)
+
+    def entities(self):
+        """Every entity but the local ship, extrapolated to render_tick()"""
+        return [entity for entity in self.world.entities(self.render_tick()) if entity[0] != self.player_id]
+
+    def take_removed(self):
+        """Hand over the (kind, x, y) of entities removed since the last call"""
+        removed, self.removed = self.removed, []
+        return removed
+
+    def close(self):
+        """Leave the game"""
+        if self.slot is not None:
+            try:
+                self.socket.sendto(protocol.encode_bye(self.slot), self.server_address)
+            except OSError:
+                pass
+        self.socket.close()
@@ -0,0 +1,226 @@
+"""
+Two-player co-op over UDP
+
+Usage:
+    python -m net.coop --host [--port 50050]      start a server and play on it
+    python -m net.coop --join HOST:PORT           join someone else's game
+    python -m net.coop --server [--port 50050]    run a headless server only
+
+Everything works on one machine: run --host in one terminal and
+--join 127.0.0.1:50050 in another.
+
+Controls: LEFT/RIGHT (or A/D) move, SPACE shoots, ESC leaves.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import pygame
+from core import config
+from core.assets import load_image
+from core.render_backend import create_backend
+from core.sprite_group import FastGroup
+from entities.explosion import Explosion
+from . import protocol
+from .client import GameClient
+from .server import GameServer
+
+DEFAULT_PORT = 50050
+
+STATUS_TEXT = {
+    protocol.STATUS_GAME_OVER: "GAME OVER",
+    protocol.STATUS_LEVEL_COMPLETE: "LEVEL COMPLETE",
+}
+
+
+def run_server(host, port, level_index=0):
+    """Run a headless server until interrupted"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    # Let SIGTERM/SIGINT stop the process instead of becoming SDL quit events
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    pygame.init()
+    server = GameServer(host, port, level_index=level_index)
+    print(f"Co-op server listening on {server.address[0]}:{server.address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        pygame.quit()
+
+
+def start_server_process(host, port, level_index=0):
+    """Start a headless server in a child process"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    return subprocess.Popen(
+        [sys.executable, "-m", "net.coop", "--server", "--bind", host,
+         "--port", str(port), "--level", str(level_index + 1)],
+        env=env
+    )
+
+
+class CoopView:
+    """
+    Draws the client's view of the shared game.
+    """
+
+    def __init__(self, client, renderer):
+        self.client = client
+        self.renderer = renderer
+        self.font = pygame.font.Font(None, 74)
+        self.small_font = pygame.font.Font(None, 36)
+        self.background = load_image('assets/images/background2.png')
+        self.player_image = load_image('assets/images/spaceship.png')
+        self.bullet_image = load_image('assets/images/bullet.png')
+        self.enemy_bullet_image = load_image('assets/images/alien_bullet.png')
+        self.enemy_images = [load_image(f'assets/images/alien{i}.png') for i in range(1, 6)]
+        self.boss_images = {}
+        self.explosion_group = FastGroup()
+
+    def _boss_image(self, level_number):
+        image = self.boss_images.get(level_number)
+        if image is None:
+            path = f'assets/images/boss{level_number}.png'
+            if os.path.exists(path):
+                image = pygame.transform.scale(load_image(path), (120, 90))
+            else:
+                image = pygame.Surface((120, 90))
+                image.fill((255, 0, 0))
+            self.boss_images[level_number] = image
+        return image
+
+    def _blit_centered(self, image, x, y):
+        self.renderer.blit(image, (x - image.get_width() / 2, y - image.get_height() / 2))
+
+    def draw(self):
+        client = self.client
+        renderer = self.renderer
+        renderer.blit(self.background, (0, 0))
+
+        for kind, x, y in client.take_removed():
+            if kind in (protocol.ENEMY, protocol.BOSS) and client.status == protocol.STATUS_PLAYING:
+                self.explosion_group.add(Explosion(x, y))
+        self.explosion_group.update()
+
+        boss_hp = None
+        bullets = {self.bullet_image: [], self.enemy_bullet_image: []}
+        for entity_id, kind, x, y, aux in client.entities():
+            if kind == protocol.BULLET:
+                bullets[self.bullet_image].append((x - self.bullet_image.get_width() / 2,
+                                                   y - self.bullet_image.get_height() / 2))
+            elif kind in (protocol.ENEMY_BULLET, protocol.BOSS_BULLET):
+                bullets[self.enemy_bullet_image].append((x - self.enemy_bullet_image.get_width() / 2,
+                                                         y - self.enemy_bullet_image.get_height() / 2))
+            elif kind == protocol.ENEMY:
+                self._blit_centered(self.enemy_images[entity_id % len(self.enemy_images)], x, y)
+            elif kind == protocol.BOSS:
+                self._blit_centered(self._boss_image(client.level_number), x, y)
+                boss_hp = aux
+            elif kind == protocol.PLAYER and aux & 1:
+                self._blit_centered(self.player_image, x, y)
+        if client.player_alive:
+            renderer.blit(self.player_image, client.player.rect)
+        for image, positions in bullets.items():
+            renderer.blit_many(image, positions)
+        renderer.draw_group(self.explosion_group)
+
+        # The HUD is only redrawn (and re-uploaded by texture backends) when it changes
+        screen = renderer.ui_surface((client.level_number, client.slot, boss_hp, client.player_alive, client.status))
+        if screen is not None:
+            self._draw_hud(screen, client, boss_hp)
+        renderer.present()
+
+    def _draw_hud(self, screen, client, boss_hp):
+        """Draw the level, boss and status text on the UI layer"""
+        hud = self.small_font.render(f"Level {client.level_number} - Player {client.slot + 1}", True, (255, 255, 255))
+        screen.blit(hud, (10, 10))
+        if boss_hp is not None:
+            boss_text = self.small_font.render(f"Boss HP: {boss_hp}", True, (255, 255, 255))
+            screen.blit(boss_text, (config.SCREEN_WIDTH // 2 - boss_text.get_width() // 2, 10))
+        if not client.player_alive and client.status == protocol.STATUS_PLAYING:
+            text = self.small_font.render("Destroyed - waiting for your partner", True, (255, 255, 0))
+            screen.blit(text, text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)))
+        status = STATUS_TEXT.get(client.status)
+        if status:
+            text = self.font.render(status, True, (255, 255, 255))
+            screen.blit(text, text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)))
+
+
+def play(server_address):
+    """Join a server and play until the window is closed"""
+    pygame.init()
+    renderer = create_backend(caption='Galaxy Shooter Co-op')
+    client = GameClient(server_address)
+    try:
+        client.connect()
+    except ConnectionError as e:
+        print(f"Could not join {server_address[0]}:{server_address[1]}: {e}")
+        pygame.quit()
+        return
+    view = CoopView(client, renderer)
+    clock = pygame.time.Clock()
+
+    run = True
+    while run:
+        clock.tick(client.tick_rate)
+        shoot = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                run = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    run = False
+                elif event.key == pygame.K_SPACE:
+                    shoot = True
+
+        keys = pygame.key.get_pressed()
+        buttons = 0
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            buttons |= protocol.LEFT
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            buttons |= protocol.RIGHT
+        if shoot:
+            buttons |= protocol.SHOOT
+        client.send_input(buttons)
+        client.poll()
+        view.draw()
+
+    client.close()
+    pygame.quit()
+
+
+def _parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Galaxy Shooter two-player co-op")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--host", action="store_true", help="start a server and join it")
+    mode.add_argument("--join", metavar="HOST:PORT", help="join a running server")
+    mode.add_argument("--server", action="store_true", help="run a headless server")
+    parser.add_argument("--bind", default="127.0.0.1", help="address the server listens on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="UDP port of the server")
+    parser.add_argument("--level", type=int, default=1, help="level to start on")
+    args = parser.parse_args(argv)
+
+    if args.server:
+        run_server(args.bind, args.port, args.level - 1)
+    elif args.host:
+        server = start_server_process(args.bind, args.port, args.level - 1)
+        try:
+            time.sleep(0.5)
+            play(("127.0.0.1" if args.bind in ("0.0.0.0", "") else args.bind, args.port))
+        finally:
+            server.terminate()
+            server.wait()
+    else:
+        play(_parse_address(args.join))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Wire protocol for networked co-op
+
+Every datagram starts with a one-byte message type. All numbers are little
+endian.
+
+Client -> server:
+    HELLO   type
+    INPUT   type, slot (u8), acked snapshot tick (u32), ack bits (u32),
+            count (u8), then count x (input sequence (u32), buttons (u8)),
+            newest last. Bit i of the ack bits is set if the snapshot of
+            tick (acked - 1 - i) was applied too. Recent inputs are
+            repeated in every packet so a lost datagram does not lose input.
+    BYE     type, slot (u8)
+
+Server -> client:
+    WELCOME type, slot (u8), tick rate (u8)
+    FULL    type (server has no free slot)
+    SNAPSHOT
+            type, tick (u32), last applied input seq (u32), level (u8),
+            status (u8), update count (u16), removal count (u16),
+            then updates (ENTITY each), then removals (entity id u32 each)
+
+Entities are sent quantized: positions in quarter pixels offset by
+POSITION_OFFSET so slightly off-screen objects stay positive, velocities
+in 1/64 pixel per tick. The receiver extrapolates every entity linearly
+from the tick it was sent, so entities moving in a straight line (all
+bullets) are sent once and never again until they are removed.
+"""
+
+import struct
+
+HELLO = 1
+WELCOME = 2
+FULL = 3
+INPUT = 4
+SNAPSHOT = 5
+BYE = 6
+
+# Input buttons
+LEFT = 1
+RIGHT = 2
+SHOOT = 4
+
+# Entity kinds
+PLAYER = 1
+ENEMY = 2
+BOSS = 3
+BULLET = 4
+ENEMY_BULLET = 5
+BOSS_BULLET = 6
+
+# Game status carried by every snapshot
+STATUS_PLAYING = 0
+STATUS_GAME_OVER = 1
+STATUS_LEVEL_COMPLETE = 2
+
+POSITION_SCALE = 4
+POSITION_OFFSET = 1024
+VELOCITY_SCALE = 64
+
+# Payload budget of one snapshot datagram (stays below a typical MTU)
+MAX_SNAPSHOT_BYTES = 1200
+
+MESSAGE = struct.Struct('<B')
+WELCOME_MESSAGE = struct.Struct('<BBB')
+INPUT_HEADER = struct.Struct('<BBIIB')
+INPUT_ENTRY = struct.Struct('<IB')
+BYE_MESSAGE = struct.Struct('<BB')
+SNAPSHOT_HEADER = struct.Struct('<BIIBBHH')
+ENTITY = struct.Struct('<IBHHhhH')
+REMOVAL = struct.Struct('<I')
+
+MAX_INPUTS_PER_PACKET = 8
+
+
+def quantize_position(value):
+    """Quarter-pixel fixed point of a coordinate"""
+    return max(0, min(0xFFFF, round((value + POSITION_OFFSET) * POSITION_SCALE)))
+
+
+def dequantize_position(value):
+    return value / POSITION_SCALE - POSITION_OFFSET
+
+
+def quantize_velocity(value):
+    """1/64 pixel per tick fixed point of a velocity"""
+    return max(-0x8000, min(0x7FFF, round(value * VELOCITY_SCALE)))
+
+
+def dequantize_velocity(value):
+    return value / VELOCITY_SCALE
+
+
+def quantize_entity(kind, x, y, dx, dy, aux):
+    """
+    Quantize an entity state.
+
+    Returns:
+        Tuple (kind, qx, qy, qdx, qdy, aux) as sent on the wire
+    """
+    return (kind, quantize_position(x), quantize_position(y),
+            quantize_velocity(dx), quantize_velocity(dy), int(aux) & 0xFFFF)
+
+
+def encode_hello():
+    return MESSAGE.pack(HELLO)
+
+
+def encode_welcome(slot, tick_rate):
+    return WELCOME_MESSAGE.pack(WELCOME, slot, tick_rate)
+
+
+def encode_full():
+    return MESSAGE.pack(FULL)
+
+
+def encode_bye(slot):
+    return BYE_MESSAGE.pack(BYE, slot)
+
+
+def encode_input(slot, acked_tick, ack_bits, inputs):
+    """
+    Encode an input packet.
+
+    Args:
+        slot: Player slot
+        acked_tick: Newest snapshot tick the client applied
+        ack_bits: Which of the 32 snapshots before acked_tick were applied
+        inputs: Sequence of (sequence, buttons), oldest first
+    """
+    inputs = inputs[-MAX_INPUTS_PER_PACKET:]
+    parts = [INPUT_HEADER.pack(INPUT, slot, acked_tick, ack_bits, len(inputs))]
+    parts.extend(INPUT_ENTRY.pack(sequence, buttons) for sequence, buttons in inputs)
+    return b''.join(parts)
+
+
+def decode_input(data):
+    """
+    Returns:
+        Tuple (slot, acked_tick, ack_bits, [(sequence, buttons), ...])
+    """
+    _, slot, acked_tick, ack_bits, count = INPUT_HEADER.unpack_from(data)
+    offset = INPUT_HEADER.size
+    inputs = []
+    for _ in range(count):
+        inputs.append(INPUT_ENTRY.unpack_from(data, offset))
+        offset += INPUT_ENTRY.size
+    return slot, acked_tick, ack_bits, inputs
+
+
+def snapshot_capacity(removals=0):
+    """Number of entity updates that fit in one snapshot next to some removals"""
+    free = MAX_SNAPSHOT_BYTES - SNAPSHOT_HEADER.size - removals * REMOVAL.size
+    return max(0, free // ENTITY.size)
+
+
+def encode_snapshot(tick, input_sequence, level, status, updates, removals):
+    """
+    Encode a snapshot.
+
+    Args:
+        tick: Server tick of the snapshot
+        input_sequence: Last input sequence applied for the receiving client
+        level: Current level number
+        status: STATUS_PLAYING, STATUS_GAME_OVER or STATUS_LEVEL_COMPLETE
+        updates: Sequence of (entity_id, quantized entity tuple)
+        removals: Sequence of entity ids
+    """
+    parts = [SNAPSHOT_HEADER.pack(SNAPSHOT, tick, input_sequence, level, status,
+                                  len(updates), len(removals))]
+    parts.extend(ENTITY.pack(entity_id, *state) for entity_id, state in updates)
+    parts.extend(REMOVAL.pack(entity_id) for entity_id in removals)
+    return b''.join(parts)
+
+
+def decode_snapshot(data):
+    """
+    Returns:
+        Tuple (tick, input_sequence, level, status, updates, removals) where
+        updates is a list of (entity_id, quantized entity tuple)
+    """
+    _, tick, input_sequence, level, status, update_count, removal_count = SNAPSHOT_HEADER.unpack_from(data)
+    offset = SNAPSHOT_HEADER.size
+    updates = []
+    for _ in range(update_count):
+        entity_id, *state = ENTITY.unpack_from(data, offset)
+        updates.append((entity_id, tuple(state)))
+        offset += ENTITY.size
+    removals = [REMOVAL.unpack_from(data, offset + i * REMOVAL.size)[0] for i in range(removal_count)]
+    return tick, input_sequence, level, status, updates, removals
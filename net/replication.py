@@ -0,0 +1,352 @@
+"""
+Snapshot replication for networked co-op
+
+The server keeps a ReplicatedWorld: the quantized state of every networked
+entity, stamped with the tick it was last changed. Entities are
+extrapolated linearly from that tick, and an entity only counts as changed
+when it leaves its extrapolated path:
+- Bullets move in straight lines, so they change when spawned and removed
+  and never in between
+- Players, enemies and the boss are observed every tick with track() and
+  change only when they turn, stop or take damage
+
+Each client has a ClientView queueing the changes it has not received.
+A snapshot takes changes off the queues (most important kinds first)
+until the datagram budget is used, and what a lost snapshot carried is
+queued again. Encoding cost and snapshot size depend on how many entities
+changed, never on how many exist.
+
+On the client, ClientWorld applies snapshots and extrapolates every entity
+to the tick being drawn.
+"""
+
+import collections
+import heapq
+from core import config
+from . import protocol
+
+# Lower sorts first when a snapshot cannot carry every change
+KIND_PRIORITY = {
+    protocol.PLAYER: 0,
+    protocol.BOSS: 1,
+    protocol.ENEMY: 2,
+    protocol.ENEMY_BULLET: 3,
+    protocol.BOSS_BULLET: 3,
+    protocol.BULLET: 4,
+}
+
+PRIORITY_LEVELS = max(KIND_PRIORITY.values()) + 1
+
+BULLET_KINDS = (protocol.BULLET, protocol.ENEMY_BULLET, protocol.BOSS_BULLET)
+
+# Largest extrapolation error (pixels) tolerated before an entity is resent
+TOLERANCE = 0.5
+
+# Removals carried by one snapshot at most
+MAX_REMOVALS = 64
+
+# Unacknowledged snapshots remembered per client; older ones count as lost
+MAX_IN_FLIGHT = 32
+
+
+def _extrapolate(state, tick, now):
+    """Position of a quantized entity state recorded at tick, at tick now"""
+    _, qx, qy, qdx, qdy, _ = state
+    elapsed = now - tick
+    return (protocol.dequantize_position(qx) + protocol.dequantize_velocity(qdx) * elapsed,
+            protocol.dequantize_position(qy) + protocol.dequantize_velocity(qdy) * elapsed)
+
+
+def linear_expiry(x, y, dx, dy, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT, margin=32):
+    """
+    Ticks until a point moving in a straight line leaves the arena.
+
+    Returns:
+        Number of ticks, or None if it never leaves
+    """
+    limits = []
+    if dx > 0:
+        limits.append((width + margin - x) / dx)
+    elif dx < 0:
+        limits.append((x + margin) / -dx)
+    if dy > 0:
+        limits.append((height + margin - y) / dy)
+    elif dy < 0:
+        limits.append((y + margin) / -dy)
+    if not limits:
+        return None
+    return max(0, int(min(limits)) + 1)
+
+
+class ReplicatedWorld:
+    """
+    Server-side registry of networked entities and their last changes.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.records = {}   # id -> (quantized state, tick recorded)
+        self.versions = {}  # id -> tick of the last change
+        self.views = []
+        self._last_seen = {}
+        self._expiry = []
+        self._next_id = 1
+
+    def _changed(self, entity_id, kind):
+        self.versions[entity_id] = self.tick
+        for view in self.views:
+            view.queue(entity_id, kind)
+
+    def spawn(self, kind, x, y, dx=0.0, dy=0.0, aux=0, expires_in=None):
+        """
+        Register a new entity.
+
+        Args:
+            kind: Entity kind (protocol.PLAYER, protocol.BULLET, ...)
+            x: X position
+            y: Y position
+            dx: X velocity in pixels per tick
+            dy: Y velocity in pixels per tick
+            aux: Extra 16-bit value (HP, alive flag, ...)
+            expires_in: Ticks after which the entity is forgotten without a
+                        removal message (clients cull it themselves), or None
+
+        Returns:
+            The new entity id
+        """
+        entity_id = self._next_id
+        self._next_id += 1
+        self.records[entity_id] = (protocol.quantize_entity(kind, x, y, dx, dy, aux), self.tick)
+        self._last_seen[entity_id] = (x, y)
+        if expires_in is not None:
+            heapq.heappush(self._expiry, (self.tick + expires_in, entity_id))
+        self._changed(entity_id, kind)
+        return entity_id
+
+    def track(self, entity_id, kind, x, y, aux=0):
+        """
+        Observe an entity that does not move in a straight line.
+
+        It is only marked as changed if it left its extrapolated path.
+
+        Args:
+            entity_id: Entity id (created with spawn())
+            kind: Entity kind
+            x: Current x position
+            y: Current y position
+            aux: Extra 16-bit value
+        """
+        record = self.records.get(entity_id)
+        last_x, last_y = self._last_seen.get(entity_id, (x, y))
+        self._last_seen[entity_id] = (x, y)
+        if record is not None:
+            state, tick = record
+            predicted_x, predicted_y = _extrapolate(state, tick, self.tick)
+            if (abs(predicted_x - x) <= TOLERANCE and abs(predicted_y - y) <= TOLERANCE
+                    and state[5] == (int(aux) & 0xFFFF)):
+                return
+        state = protocol.quantize_entity(kind, x, y, x - last_x, y - last_y, aux)
+        self.records[entity_id] = (state, self.tick)
+        self._changed(entity_id, kind)
+
+    def despawn(self, entity_id):
+        """Remove an entity and tell clients about it"""
+        record = self.records.pop(entity_id, None)
+        if record is not None:
+            del self._last_seen[entity_id], self.versions[entity_id]
+            for view in self.views:
+                view.queue_removal(entity_id, record[0][0])
+
+    def clear(self):
+        """Remove every entity"""
+        for entity_id in list(self.records):
+            self.despawn(entity_id)
+        self._expiry.clear()
+
+    def advance(self):
+        """Move to the next tick and forget the entities that expired"""
+        self.tick += 1
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= self.tick:
+            _, entity_id = heapq.heappop(expiry)
+            if self.records.pop(entity_id, None) is not None:
+                del self._last_seen[entity_id], self.versions[entity_id]
+
+    def add_view(self):
+        """Create the view of a newly connected client; every entity starts queued"""
+        view = ClientView(self)
+        self.views.append(view)
+        return view
+
+    def remove_view(self, view):
+        if view in self.views:
+            self.views.remove(view)
+
+
+class ClientView:
+    """
+    What one client still has to receive.
+
+    Changed entities wait in one FIFO per priority; removals in another.
+    Once sent, an entry is in flight until the client acknowledges that
+    snapshot or a newer one. Entries of snapshots the client did not apply
+    are queued again, unless the entity changed in the meantime (its newer
+    version is queued already). Building a snapshot only touches the
+    entries it sends, however long the queues are.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self.queues = [collections.OrderedDict() for _ in range(PRIORITY_LEVELS)]
+        self.removals = collections.OrderedDict()
+        self.acked_tick = 0
+        self._in_flight = collections.OrderedDict()  # tick -> {id: version, or None for a removal}
+        for entity_id, (state, _) in world.records.items():
+            self.queue(entity_id, state[0])
+
+    def __len__(self):
+        """Number of queued entries"""
+        return sum(len(queue) for queue in self.queues) + len(self.removals)
+
+    def queue(self, entity_id, kind):
+        """Queue an entity's latest state; it keeps its place if already queued"""
+        queue = self.queues[KIND_PRIORITY[kind]]
+        if entity_id not in queue:
+            queue[entity_id] = None
+
+    def queue_removal(self, entity_id, kind):
+        self.queues[KIND_PRIORITY[kind]].pop(entity_id, None)
+        self.removals[entity_id] = None
+
+    def _lost(self, sent):
+        """Queue again what a snapshot the client never applied carried"""
+        world = self.world
+        for entity_id, version in sent.items():
+            if version is None:
+                if entity_id not in world.records:
+                    self.removals[entity_id] = None
+            elif world.versions.get(entity_id) == version:
+                self.queue(entity_id, world.records[entity_id][0][0])
+
+    def acknowledge(self, tick, ack_bits=0):
+        """
+        Handle a client acknowledging snapshots.
+
+        Args:
+            tick: Newest snapshot tick the client applied
+            ack_bits: Bit i set if the snapshot of tick - 1 - i was applied too
+        """
+        if tick <= self.acked_tick:
+            return
+        self.acked_tick = tick
+        in_flight = self._in_flight
+        while in_flight:
+            sent_tick = next(iter(in_flight))
+            if sent_tick > tick:
+                break
+            sent = in_flight.pop(sent_tick)
+            age = tick - 1 - sent_tick
+            if sent_tick < tick and not (age < 32 and ack_bits >> age & 1):
+                self._lost(sent)
+
+    def build_snapshot(self):
+        """
+        Choose what the next snapshot carries, within the datagram budget.
+
+        Returns:
+            Tuple (updates, removals) ready for protocol.encode_snapshot
+        """
+        world = self.world
+        records = world.records
+        versions = world.versions
+        sent = {}
+
+        removals = []
+        while self.removals and len(removals) < MAX_REMOVALS:
+            entity_id, _ = self.removals.popitem(last=False)
+            removals.append(entity_id)
+            sent[entity_id] = None
+
+        capacity = protocol.snapshot_capacity(len(removals))
+        updates = []
+        for queue in self.queues:
+            while queue and len(updates) < capacity:
+                entity_id, _ = queue.popitem(last=False)
+                record = records.get(entity_id)
+                if record is None:
+                    continue  # Expired while queued
+                state, tick = record
+                # Send the state as extrapolated to now, so the client needs no history
+                x, y = _extrapolate(state, tick, world.tick)
+                kind, _, _, qdx, qdy, aux = state
+                updates.append((entity_id, (kind, protocol.quantize_position(x), protocol.quantize_position(y),
+                                            qdx, qdy, aux)))
+                sent[entity_id] = versions[entity_id]
+
+        in_flight = self._in_flight
+        in_flight[world.tick] = sent
+        while len(in_flight) > MAX_IN_FLIGHT:
+            self._lost(in_flight.popitem(last=False)[1])
+        return updates, removals
+
+
+class ClientWorld:
+    """
+    Client-side copy of the networked entities, extrapolated between snapshots.
+    """
+
+    def __init__(self, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT, margin=32):
+        self.tick = 0
+        self.ack_bits = 0  # Bit i: the snapshot of tick - 1 - i was applied
+        self.records = {}  # id -> (kind, x, y, dx, dy, aux, tick)
+        self.bounds = (-margin, -margin, width + margin, height + margin)
+
+    def apply(self, tick, updates, removals):
+        """
+        Apply a snapshot. Snapshots older than the last applied one are ignored.
+
+        Returns:
+            True if the snapshot was applied
+        """
+        if tick <= self.tick:
+            return False
+        shift = tick - self.tick
+        if self.tick and shift <= 32:
+            self.ack_bits = ((self.ack_bits << shift) | (1 << (shift - 1))) & 0xFFFFFFFF
+        else:
+            self.ack_bits = 0
+        self.tick = tick
+        records = self.records
+        for entity_id, (kind, qx, qy, qdx, qdy, aux) in updates:
+            records[entity_id] = (kind,
+                                  protocol.dequantize_position(qx), protocol.dequantize_position(qy),
+                                  protocol.dequantize_velocity(qdx), protocol.dequantize_velocity(qdy),
+                                  aux, tick)
+        for entity_id in removals:
+            records.pop(entity_id, None)
+        return True
+
+    def entities(self, now):
+        """
+        Extrapolate every entity to a tick. Bullets that left the arena are dropped.
+
+        Args:
+            now: Tick to extrapolate to (may be fractional)
+
+        Returns:
+            List of (entity_id, kind, x, y, aux)
+        """
+        min_x, min_y, max_x, max_y = self.bounds
+        result = []
+        expired = []
+        for entity_id, (kind, x, y, dx, dy, aux, tick) in self.records.items():
+            elapsed = now - tick
+            x += dx * elapsed
+            y += dy * elapsed
+            if kind in BULLET_KINDS and not (min_x <= x <= max_x and min_y <= y <= max_y):
+                expired.append(entity_id)
+                continue
+            result.append((entity_id, kind, x, y, aux))
+        for entity_id in expired:
+            del self.records[entity_id]
+        return result
@@ -0,0 +1,176 @@
+"""
+Authoritative co-op server
+
+The server owns the only real game state. It runs CoopSimulation at a
+fixed tick rate and talks to clients over one non-blocking UDP socket:
+- HELLO gives the client a player slot (or FULL if there is none)
+- INPUT packets carry the client's recent inputs; each is applied once,
+  in sequence order, one per tick (two while a client is catching up)
+- Every tick each client gets one SNAPSHOT with the entities it has not
+  acknowledged yet, within protocol.MAX_SNAPSHOT_BYTES
+
+Clients that stay silent for CLIENT_TIMEOUT seconds are dropped.
+"""
+
+import socket
+import time
+from core import config
+from . import protocol
+from .simulation import CoopSimulation, MAX_PLAYERS
+
+CLIENT_TIMEOUT = 5.0
+
+# Inputs queued beyond this are applied two per tick until caught up
+CATCH_UP_THRESHOLD = 4
+
+
+class _Client:
+    """Connection state of one player slot"""
+
+    def __init__(self, slot, address, view):
+        self.slot = slot
+        self.address = address
+        self.view = view
+        self.inputs = {}        # sequence -> buttons not applied yet
+        self.last_applied = 0   # newest input sequence applied
+        self.last_seen = time.monotonic()
+
+
+class GameServer:
+    """
+    UDP server running the co-op simulation.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, tick_rate=config.FPS, level_index=0):
+        """
+        Args:
+            host: Address to bind
+            port: UDP port to bind (0 picks a free one; see address)
+            tick_rate: Simulation ticks (and snapshots) per second
+            level_index: Level to start with
+        """
+        self.tick_rate = tick_rate
+        self.simulation = CoopSimulation(level_index, tick_rate)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((host, port))
+        self.socket.setblocking(False)
+        self.address = self.socket.getsockname()
+        self.clients = {}   # address -> _Client
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+        self.running = False
+
+    def _free_slot(self):
+        used = {client.slot for client in self.clients.values()}
+        for slot in range(MAX_PLAYERS):
+            if slot not in used:
+                return slot
+        return None
+
+    def _receive(self):
+        """Handle every datagram waiting on the socket"""
+        while True:
+            try:
+                data, address = self.socket.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionResetError:
+                continue
+            if not data:
+                continue
+            try:
+                self._handle(data, address)
+            except Exception as e:
+                print(f"Ignoring malformed packet from {address}: {e}")
+
+    def _handle(self, data, address):
+        message = data[0]
+        client = self.clients.get(address)
+        if message == protocol.HELLO:
+            if client is None:
+                slot = self._free_slot()
+                if slot is None:
+                    self.socket.sendto(protocol.encode_full(), address)
+                    return
+                client = _Client(slot, address, self.simulation.world.add_view())
+                self.clients[address] = client
+                self.simulation.join(slot)
+            client.last_seen = time.monotonic()
+            self.socket.sendto(protocol.encode_welcome(client.slot, self.tick_rate), address)
+        elif client is None:
+            return
+        elif message == protocol.INPUT:
+            _, acked_tick, ack_bits, inputs = protocol.decode_input(data)
+            client.last_seen = time.monotonic()
+            client.view.acknowledge(acked_tick, ack_bits)
+            for sequence, buttons in inputs:
+                if sequence > client.last_applied:
+                    client.inputs[sequence] = buttons
+        elif message == protocol.BYE:
+            self._drop(client)
+
+    def _drop(self, client):
+        del self.clients[client.address]
+        self.simulation.world.remove_view(client.view)
+        self.simulation.leave(client.slot)
+
+    def _take_inputs(self, client):
+        """Inputs to apply this tick, in sequence order"""
+        count = 2 if len(client.inputs) > CATCH_UP_THRESHOLD else 1
+        taken = []
+        for sequence in sorted(client.inputs)[:count]:
+            taken.append(client.inputs.pop(sequence))
+            client.last_applied = sequence
+        return taken
+
+    def _send_snapshots(self):
+        simulation = self.simulation
+        tick = simulation.world.tick
+        for client in list(self.clients.values()):
+            updates, removals = client.view.build_snapshot()
+            data = protocol.encode_snapshot(tick, client.last_applied, simulation.level_number,
+                                            simulation.status, updates, removals)
+            try:
+                self.socket.sendto(data, client.address)
+            except OSError:
+                continue
+            self.bytes_sent += len(data)
+            self.snapshots_sent += 1
+
+    def tick(self):
+        """Receive input, advance the simulation one tick and send snapshots"""
+        self._receive()
+        now = time.monotonic()
+        for client in list(self.clients.values()):
+            if now - client.last_seen > CLIENT_TIMEOUT:
+                self._drop(client)
+        self.simulation.step({client.slot: self._take_inputs(client) for client in self.clients.values()})
+        self._send_snapshots()
+
+    def serve_forever(self, duration=None):
+        """
+        Run ticks at the fixed rate until stop() is called.
+
+        Args:
+            duration: Stop after this many seconds (None runs until stopped)
+        """
+        self.running = True
+        interval = 1.0 / self.tick_rate
+        start = next_tick = time.monotonic()
+        while self.running:
+            self.tick()
+            next_tick += interval
+            now = time.monotonic()
+            if duration is not None and now - start >= duration:
+                break
+            if next_tick > now:
+                time.sleep(next_tick - now)
+            else:
+                next_tick = now  # Fell behind: don't try to catch up in a burst
+        self.running = False
+
+    def stop(self):
+        self.running = False
+
+    def close(self):
+        self.socket.close()
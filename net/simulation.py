@@ -0,0 +1,312 @@
+"""
+Headless co-op simulation run by the server
+
+CoopSimulation plays the PLAYING rules of main.py through the same
+PlaySession (see managers.play_session), for up to MAX_PLAYERS ships
+driven by network input instead of the keyboard.
+Every networked object is mirrored into a ReplicatedWorld:
+- Bullet sprites live in NetGroups, which register a sprite once it has
+  survived its first tick and remove it when it dies
+- Boss pattern bullets live in a NetBulletField, which registers whole
+  volleys with velocities snapped to the wire precision, so clients
+  extrapolate them exactly and they are never sent twice
+- Players, enemies and the boss are tracked every tick and only resent
+  when they change direction, die or take damage
+
+When every ship is destroyed (or an enemy reaches the bottom) the level
+restarts after a short pause; a completed level moves on to the next one.
+"""
+
+from array import array
+from core import config
+from core.sprite_group import FastGroup
+from entities.player import Player
+from entities.bullet_field import BulletField
+from entities.bullet_patterns import Volley
+from managers.level_manager import LevelManager
+from managers.play_session import PlaySession, DEATH, COMPLETE
+from . import protocol
+from .replication import ReplicatedWorld, linear_expiry
+
+MAX_PLAYERS = 2
+
+# Ticks the game over / level complete status is shown before moving on
+TRANSITION_TICKS = 150
+
+
+class NetGroup(FastGroup):
+    """
+    FastGroup whose sprites are mirrored into a ReplicatedWorld.
+
+    Sprites are registered by sync(), after the tick's movement, so a sprite
+    that dies on the tick it was created is never sent at all.
+    """
+
+    def __init__(self, world, kind, velocity=(0, 0)):
+        """
+        Args:
+            world: ReplicatedWorld to mirror into
+            kind: Entity kind of every sprite in the group
+            velocity: Constant (dx, dy) per tick for straight-moving sprites
+        """
+        self.world = world
+        self.kind = kind
+        self.velocity = velocity
+        self.net_ids = {}
+        self._pending = []
+        super().__init__()
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._pending.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        entity_id = self.net_ids.pop(sprite, None)
+        if entity_id is not None:
+            self.world.despawn(entity_id)
+
+    def empty(self):
+        for entity_id in self.net_ids.values():
+            self.world.despawn(entity_id)
+        self.net_ids.clear()
+        self._pending.clear()
+        super().empty()
+
+    def sync(self):
+        """Register the sprites added since the last call that are still alive"""
+        dx, dy = self.velocity
+        for sprite in self._pending:
+            if self.has_internal(sprite) and sprite not in self.net_ids:
+                x, y = sprite.rect.center
+                self.net_ids[sprite] = self.world.spawn(self.kind, x, y, dx, dy)
+        self._pending.clear()
+
+    def track(self):
+        """Report the position of every registered sprite"""
+        world, kind = self.world, self.kind
+        for sprite, entity_id in self.net_ids.items():
+            world.track(entity_id, kind, *sprite.rect.center)
+
+
+class NetBulletField(BulletField):
+    """
+    BulletField that mirrors its bullets into a ReplicatedWorld.
+    """
+
+    def __init__(self, world, **kwargs):
+        super().__init__(**kwargs)
+        self.world = world
+        self.ids = array('q')
+
+    def emit(self, volley):
+        """
+        Add a volley, snapping its velocities to the wire precision first.
+
+        Each bullet is registered at the position it has after this tick's
+        update(), and expires from the world once it leaves the arena.
+        """
+        dxs = array('d', (protocol.dequantize_velocity(protocol.quantize_velocity(v)) for v in volley.dxs))
+        dys = array('d', (protocol.dequantize_velocity(protocol.quantize_velocity(v)) for v in volley.dys))
+        super().emit(Volley(volley.x, volley.y, dxs, dys))
+        world = self.world
+        for dx, dy in zip(dxs, dys):
+            x, y = volley.x + dx, volley.y + dy
+            self.ids.append(world.spawn(protocol.BOSS_BULLET, x, y, dx, dy,
+                                        expires_in=linear_expiry(x, y, dx, dy)))
+
+    def clear(self):
+        super().clear()
+        del self.ids[:]
+
+    def update(self):
+        """Move every bullet and drop those that left the arena (clients cull them too)"""
+        xs, ys, dxs, dys, ids = self.xs, self.ys, self.dxs, self.dys, self.ids
+        min_x = -self.half_width
+        max_x = self.width + self.half_width
+        min_y = -self.half_height
+        max_y = self.height + self.half_height
+        kept = 0
+        for i in range(len(xs)):
+            x = xs[i] + dxs[i]
+            y = ys[i] + dys[i]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                xs[kept] = x
+                ys[kept] = y
+                dxs[kept] = dxs[i]
+                dys[kept] = dys[i]
+                ids[kept] = ids[i]
+                kept += 1
+        if kept < len(xs):
+            del xs[kept:], ys[kept:], dxs[kept:], dys[kept:], ids[kept:]
+
+    def collide_rect(self, rect, dokill=True):
+        """Check whether any bullet overlaps a rect; bullets that hit are removed for clients too"""
+        left = rect.left - self.half_width
+        right = rect.right + self.half_width
+        top = rect.top - self.half_height
+        bottom = rect.bottom + self.half_height
+        xs, ys = self.xs, self.ys
+        hits = [
+            i for i in range(len(xs))
+            if top < ys[i] < bottom and left < xs[i] < right
+        ]
+        if dokill:
+            for i in reversed(hits):
+                self.world.despawn(self.ids[i])
+                del self.xs[i], self.ys[i], self.dxs[i], self.dys[i], self.ids[i]
+        return len(hits)
+
+
+class CoopSimulation:
+    """
+    Authoritative co-op game state, advanced one fixed tick at a time.
+    """
+
+    def __init__(self, level_index=0, tick_rate=config.FPS,
+                 screen_width=config.SCREEN_WIDTH, screen_height=config.SCREEN_HEIGHT):
+        """
+        Args:
+            level_index: Level to start with (0 = Level 1)
+            tick_rate: Ticks per second
+            screen_width: Arena width
+            screen_height: Arena height
+        """
+        self.tick_rate = tick_rate
+        self.dt = 1000 / tick_rate
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.world = ReplicatedWorld()
+        self.level_manager = LevelManager(screen_width, screen_height)
+
+        world = self.world
+        self.session = PlaySession(
+            self.level_manager, fps=tick_rate, screen_height=screen_height,
+            bullet_group=NetGroup(world, protocol.BULLET, (0, -7)),
+            enemy_group=NetGroup(world, protocol.ENEMY),
+            enemy_bullet_group=NetGroup(world, protocol.ENEMY_BULLET, (0, 3)),
+            boss_bullet_field=NetBulletField(world, width=screen_width, height=screen_height),
+        )
+
+        self.players = {}      # slot -> Player
+        self.player_ids = {}   # slot -> entity id
+        self.boss = None
+        self.boss_id = None
+        self.status = protocol.STATUS_PLAYING
+        self._transition = 0
+        self.start_level(level_index)
+
+    @property
+    def level(self):
+        return self.session.level
+
+    @property
+    def level_number(self):
+        return self.level.level_number if self.level is not None else 0
+
+    def _spawn_x(self, slot):
+        return self.screen_width * (slot + 1) // (MAX_PLAYERS + 1)
+
+    def _player_aux(self, slot):
+        return (slot << 1) | int(self.players[slot] in self.session.player_group)
+
+    def join(self, slot):
+        """Add a ship for a player slot; it flies from the next level start if the game is over"""
+        player = Player(self._spawn_x(slot), self.screen_height - 130, self.screen_width)
+        self.players[slot] = player
+        self.session.add_player(player, flying=self.status == protocol.STATUS_PLAYING)
+        self.player_ids[slot] = self.world.spawn(protocol.PLAYER, *player.rect.center,
+                                                 aux=self._player_aux(slot))
+
+    def leave(self, slot):
+        """Remove a player's ship"""
+        if slot in self.players:
+            self.session.remove_player(self.players.pop(slot))
+            self.world.despawn(self.player_ids.pop(slot))
+
+    def start_level(self, level_index):
+        """Load a level and put every ship back at its start"""
+        if self.boss_id is not None:
+            self.world.despawn(self.boss_id)
+        self.boss = self.boss_id = None
+        self.session.start(level_index)
+        self.world.clear()
+
+        self.session.enemy_group.sync()
+        self.status = protocol.STATUS_PLAYING
+        for slot, player in self.players.items():
+            self.player_ids[slot] = self.world.spawn(protocol.PLAYER, *player.rect.center,
+                                                     aux=self._player_aux(slot))
+
+    def _end(self, status):
+        self.status = status
+        self._transition = TRANSITION_TICKS
+
+    def step(self, inputs):
+        """
+        Advance the game by one tick.
+
+        Args:
+            inputs: Dict slot -> list of button bitmasks to apply this tick
+                    (usually one; more when a client catches up)
+        """
+        world = self.world
+        world.advance()
+        session = self.session
+
+        if self.status != protocol.STATUS_PLAYING:
+            self._transition -= 1
+            if self._transition <= 0:
+                index = self.level_manager.get_current_level_index()
+                if self.status == protocol.STATUS_LEVEL_COMPLETE:
+                    index = (index + 1) % self.level_manager.get_level_count()
+                self.start_level(index)
+            else:
+                # Ships and enemies stop; bullets fly on, as clients expect
+                session.bullet_group.update()
+                session.enemy_bullet_group.update()
+                session.boss_bullet_field.update()
+                self._replicate()
+            return
+
+        for slot, buttons_list in inputs.items():
+            player = self.players.get(slot)
+            if player is None or player not in session.player_group:
+                continue
+            for buttons in buttons_list:
+                player.move(bool(buttons & protocol.RIGHT) - bool(buttons & protocol.LEFT))
+                if buttons & protocol.SHOOT:
+                    session.shoot(player)
+
+        # The rules of main.py's PLAYING scene, with the ships moved above
+        outcome = session.step(self.dt, update_players=False)
+        self._sync_boss()
+        if outcome == DEATH:
+            self._end(protocol.STATUS_GAME_OVER)
+        elif outcome == COMPLETE:
+            self._end(protocol.STATUS_LEVEL_COMPLETE)
+        self._replicate()
+
+    def _sync_boss(self):
+        """Register the boss when it enters the field and remove it when it goes down"""
+        boss = self.level.get_boss()
+        on_field = boss is not None and boss in self.session.boss_group
+        if on_field and self.boss_id is None:
+            self.boss = boss
+            self.boss_id = self.world.spawn(protocol.BOSS, *boss.rect.center, aux=boss.current_hp)
+        elif not on_field and self.boss_id is not None:
+            self.world.despawn(self.boss_id)
+            self.boss_id = None
+
+    def _replicate(self):
+        """Mirror this tick's changes into the replicated world"""
+        world = self.world
+        session = self.session
+        session.bullet_group.sync()
+        session.enemy_bullet_group.sync()
+        session.enemy_group.sync()
+        session.enemy_group.track()
+        for slot, player in self.players.items():
+            world.track(self.player_ids[slot], protocol.PLAYER, *player.rect.center, aux=self._player_aux(slot))
+        if self.boss_id is not None:
+            world.track(self.boss_id, protocol.BOSS, *self.boss.rect.center, aux=self.boss.current_hp)
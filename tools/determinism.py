@@ -0,0 +1,161 @@
+"""
+Determinism check for Galaxy Shooter
+
+Plays a fixed script headless and records a hash of the world state after
+every tick (see core.state_hash). The ship follows the lowest enemy (or
+the boss) and fires on a fixed rhythm. Every tick is played and captured
+by the same PlaySession the game uses (see managers.play_session), so any
+change to the collision, firing or spawning rules shows up in the hashes. A death restarts the level, and a completed
+level moves on to the next one. pygame.time.get_ticks() is replaced by
+the game's own clock for the run, so wall-clock timing cannot change
+the outcome.
+
+Record a reference before changing gameplay code, then compare after:
+    python -m tools.determinism --record before.hashes
+    python -m tools.determinism --reference before.hashes
+
+A comparison stops at the first tick that differs from the reference. It
+prints the differing fields with this run's values and exits with
+status 1.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+
+class GameClock:
+    """Game time in milliseconds, standing in for pygame.time.get_ticks()"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return int(self.now)
+
+
+def scripted_input(session, tick):
+    """
+    Steer the first ship of a PlaySession: follow the lowest enemy (else the
+    boss) and fire every sixth tick.
+
+    Args:
+        session: PlaySession being played
+        tick: Tick number since the check started
+    """
+    player = session.player
+    boss = session.level.get_boss()
+    target = max(session.enemy_group, key=lambda sprite: sprite.rect.bottom, default=None)
+    if target is None and boss is not None and not boss.is_defeated():
+        target = boss
+    if target is not None:
+        offset = target.rect.centerx - player.rect.centerx
+        player.rect.x += max(-player.speed, min(player.speed, offset))
+    if tick % 6 == 0:
+        session.shoot(player)
+
+
+def field_values(state, field, limit=8):
+    """
+    The values of one hashed field of a TickState, for the report.
+
+    Args:
+        state: TickState
+        field: Field name from core.state_hash ("enemies.x", "rng", ...)
+        limit: Most values shown
+
+    Returns:
+        Short text
+    """
+    from core.state_hash import column_name
+
+    if field == "rng":
+        return "random number generator state"
+    for table, (width, values) in state.tables.items():
+        for column in range(width):
+            if column_name(table, column) == field:
+                shown = [round(value, 3) for value in values[column::width]]
+                more = f" ... ({len(shown)} values)" if len(shown) > limit else ""
+                return f"{shown[:limit]}{more}"
+    return "(not in this run)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Galaxy Shooter per-tick determinism check")
+    parser.add_argument("--ticks", type=int, default=6000, help="Ticks to play")
+    parser.add_argument("--level", type=int, default=1, help="Level to start on (1-based)")
+    parser.add_argument("--record", metavar="PATH", help="Write the hash stream of this run to PATH")
+    parser.add_argument("--reference", metavar="PATH", help="Compare every tick against a recorded stream")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from core import config
+    from core.state_hash import HashStream
+    from entities.player import Player
+    from managers.level_manager import LevelManager
+    from managers.play_session import PlaySession, DEATH, COMPLETE
+
+    reference = HashStream.load(args.reference) if args.reference else None
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    clock = GameClock()
+    real_get_ticks = pygame.time.get_ticks
+    pygame.time.get_ticks = clock
+    level_manager = LevelManager(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+    session = PlaySession(level_manager)
+    session.add_player(Player(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 130, config.SCREEN_WIDTH))
+    dt = 1000 / config.FPS
+    stream = HashStream()
+    runs = deaths = completed = 0
+    started = time.perf_counter()
+    try:
+        # Every run gets the next seed, so the whole script is reproducible
+        session.start(args.level - 1, seed=runs)
+        for tick in range(args.ticks):
+            clock.now += dt
+            scripted_input(session, tick)
+            outcome = session.step(dt, update_players=False)
+            state = session.capture_tick()
+            stream.record(tick, state)
+            if reference is not None:
+                index = len(stream) - 1
+                if index >= len(reference) or reference.tick(index) != stream.tick(index):
+                    divergence = stream.compare(reference)
+                    print(f"DIVERGED at tick {divergence.tick} (level {session.level.level_number}): "
+                          f"{', '.join(divergence.fields)}")
+                    for field in divergence.fields:
+                        print(f"  {field}: {field_values(state, field)}")
+                    return 1
+            if outcome == DEATH:
+                deaths += 1
+                runs += 1
+                session.start(level_manager.get_current_level_index(), seed=runs)
+            elif outcome == COMPLETE:
+                completed += 1
+                runs += 1
+                next_index = (level_manager.get_current_level_index() + 1) % level_manager.get_level_count()
+                session.start(next_index, seed=runs)
+    finally:
+        pygame.time.get_ticks = real_get_ticks
+        pygame.quit()
+
+    elapsed = time.perf_counter() - started
+    print(f"{len(stream)} ticks in {elapsed:.1f} s: {completed} levels completed, {deaths} deaths, "
+          f"digest {stream.digest:08x}")
+    if args.record:
+        stream.save(args.record)
+        print(f"Hash stream written to {args.record} ({os.path.getsize(args.record) // 1024} KiB)")
+    if reference is not None:
+        if len(reference) > len(stream):
+            print(f"DIVERGED: the reference has {len(reference)} ticks, this run {len(stream)}")
+            return 1
+        print(f"OK: identical to the reference (digest {reference.digest:08x})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
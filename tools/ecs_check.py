@@ -0,0 +1,137 @@
+"""
+ECS parity check for Galaxy Shooter
+
+Builds a mixed scene of sprites (the ship, formations at several speeds
+and near both edges, every boss, both kinds of bullets and explosions at
+every stage), spawns each one into an ECS World from its to_bundle(), then
+steps the sprites with their update() and the World with its systems (see
+core.systems) side by side. After every tick each entity must still be
+alive exactly when its sprite is, at the sprite's rect position and with
+the sprite's image.
+
+    python -m tools.ecs_check --ticks 3000
+
+The first disagreement is printed and the check exits with status 1.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+
+def build_sprites(screen_width, screen_height):
+    """
+    Create the sprites of the check scene.
+
+    Args:
+        screen_width: Arena width
+        screen_height: Arena height
+
+    Returns:
+        List of sprite groups, updated in this order every tick
+    """
+    import pygame
+    from entities.player import Player
+    from entities.enemy import Enemy
+    from entities.boss3 import Boss3
+    from entities.boss4 import Boss4
+    from entities.boss5 import Boss5
+    from entities.bullet import Bullets
+    from entities.enemyBullets import EnemyBullet
+    from entities.explosion import Explosion
+
+    ships = pygame.sprite.Group(Player(screen_width // 2, screen_height - 130, screen_width))
+    enemies = pygame.sprite.Group()
+    # Level speed multipliers make fractional speeds; edge columns bounce early
+    for row, speed in enumerate((1, 1.5, 2.25, 3)):
+        for x in (10, 100, screen_width // 2, screen_width - 60, screen_width - 10):
+            enemy = Enemy(x, 60 + row * 40, screen_width)
+            enemy.speed = speed
+            enemies.add(enemy)
+    bosses = pygame.sprite.Group(Boss3(screen_width, screen_height), Boss4(screen_width, screen_height),
+                                 Boss5(screen_width, screen_height))
+    bullets = pygame.sprite.Group()
+    for _ in range(100):
+        bullets.add(Bullets(random.randrange(screen_width), random.randrange(screen_height)))
+        bullets.add(EnemyBullet(random.randrange(screen_width), random.randrange(screen_height)))
+    explosions = pygame.sprite.Group()
+    for stage in range(25):
+        explosion = Explosion(random.randrange(screen_width), random.randrange(screen_height))
+        for _ in range(stage):
+            explosion.update()
+        explosions.add(explosion)
+    return [ships, enemies, bosses, bullets, explosions]
+
+
+def first_mismatch(world, pairs):
+    """
+    Compare every sprite with its entity.
+
+    Args:
+        world: World holding the entities
+        pairs: List of (sprite, entity id)
+
+    Returns:
+        Description of the first difference, or None if they all agree
+    """
+    from core.components import Position, Renderable
+
+    for sprite, entity in pairs:
+        name = type(sprite).__name__
+        if sprite.alive() != world.is_alive(entity):
+            return f"{name} {entity}: sprite alive {sprite.alive()}, entity alive {world.is_alive(entity)}"
+        if not sprite.alive():
+            continue
+        position = world.get(entity, Position)
+        if (position['x'], position['y']) != tuple(sprite.rect.topleft):
+            return f"{name} {entity}: sprite at {tuple(sprite.rect.topleft)}, entity at ({position['x']}, {position['y']})"
+        if world.get(entity, Renderable)['image'] is not sprite.image:
+            return f"{name} {entity}: different image"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Galaxy Shooter ECS parity check")
+    parser.add_argument("--ticks", type=int, default=3000, help="Ticks to step")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for the scene layout")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from core import config
+    from core.ecs import World
+    from core.systems import add_default_systems
+
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    random.seed(args.seed)
+    try:
+        groups = build_sprites(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        world = World()
+        add_default_systems(world)
+        pairs = []
+        for group in groups:
+            sprites = group.sprites()
+            pairs.extend(zip(sprites, world.spawn_batch(sprite.to_bundle() for sprite in sprites)))
+
+        dt = 1000 / config.FPS
+        for tick in range(args.ticks):
+            for group in groups:
+                group.update()
+            world.run(dt)
+            mismatch = first_mismatch(world, pairs)
+            if mismatch is not None:
+                print(f"DIVERGED at tick {tick}: {mismatch}")
+                return 1
+    finally:
+        pygame.quit()
+
+    print(f"OK: {len(pairs)} entities matched their sprites for {args.ticks} ticks "
+          f"({len(world)} still alive)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+Scripted leak check for Galaxy Shooter
+
+Plays every level headless, the way a long kiosk session does, through
+the game of main.py itself (main.create_game()): menus, scene stack,
+play session, rewind buffer, telemetry, run store, sounds and rendering
+are the ones the game runs. Input is scripted: menus are navigated with
+key presses, and the ship follows the lowest enemy (else the boss) and
+fires on a fixed rhythm. Every level is started from the level select
+menu, restarted halfway from the pause menu, then played until it is
+won, lost or the tick budget runs out, and left for the main menu.
+
+After a few warm-up cycles (image cache, enemy pools and restart
+snapshots are filled on the first runs) the memory of every later cycle
+is compared with the warmed-up state using core.diagnostics. The check
+fails with exit status 1 when Python allocations grow by more than
+--max-growth-kb or when the live object count of any counted class
+grows by more than --max-object-growth.
+
+Saves, run history, telemetry and thumbnails go to a temporary
+directory that is removed afterwards.
+
+Usage (from the repository root):
+    python -m tools.leak_check
+    python -m tools.leak_check --cycles 10 --max-growth-kb 64 --verbose
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+
+class ScriptedKeys:
+    """The keys held down, standing in for pygame.key.get_pressed()"""
+
+    def __init__(self):
+        self.held = set()
+
+    def __call__(self):
+        return self
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedPlayer:
+    """
+    Plays a game built by main.create_game() through scripted input.
+    """
+
+    def __init__(self, game, clock, keys):
+        """
+        Args:
+            game: main.Game to play
+            clock: GameClock standing in for pygame.time.get_ticks()
+            keys: ScriptedKeys standing in for pygame.key.get_pressed()
+        """
+        self.game = game
+        self.clock = clock
+        self.keys = keys
+        self.ticks = 0
+
+    @property
+    def scene(self):
+        """Name of the top scene"""
+        return self.game.scenes.top.name
+
+    def step(self, *keys):
+        """
+        Run and draw one tick of the game.
+
+        Args:
+            *keys: Keys pressed (KEYDOWN) on this tick
+        """
+        import pygame
+        from core import config
+
+        dt = 1000 / config.FPS
+        self.clock.now += dt
+        self.ticks += 1
+        events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in keys]
+        frame = self.game.tick(events, dt)
+        if frame is not None:
+            self.game.draw_frame(frame)
+
+    def choose(self, option):
+        """
+        Pick an option of the menu on top, as a player would with the arrow keys.
+
+        Args:
+            option: Option text, or option index (negative counts from the end)
+        """
+        import pygame
+        import main
+
+        if self.scene == main.GAME_OVER:
+            self.step(pygame.K_ESCAPE)  # Any key skips the game over delay
+        menu = self.game.scenes.top.menu
+        while not getattr(menu, "can_proceed", True):
+            self.step()
+        index = option if isinstance(option, int) else menu.options.index(option)
+        moves = (index - menu.selected_option) % len(menu.options)
+        self.step(*[pygame.K_DOWN] * moves, pygame.K_RETURN)
+
+    def play(self, ticks):
+        """
+        Play the current level for a number of ticks or until it is won or lost.
+
+        Args:
+            ticks: Most ticks to play
+        """
+        import pygame
+        import main
+
+        for tick in range(ticks):
+            if self.scene != main.PLAYING:
+                break
+            self.steer()
+            self.step(*[pygame.K_SPACE] * (tick % 8 == 0))
+        self.keys.held.clear()
+
+    def steer(self):
+        """Hold the arrow key towards the lowest enemy, else the boss"""
+        import pygame
+
+        session = self.game.session
+        player = session.player
+        boss = session.level.get_boss()
+        target = max(session.enemy_group, key=lambda sprite: sprite.rect.bottom, default=None)
+        if target is None and boss is not None and not boss.is_defeated():
+            target = boss
+        self.keys.held.clear()
+        if target is not None and target.rect.centerx < player.rect.centerx - player.speed:
+            self.keys.held.add(pygame.K_LEFT)
+        elif target is not None and target.rect.centerx > player.rect.centerx + player.speed:
+            self.keys.held.add(pygame.K_RIGHT)
+
+    def cycle(self, ticks):
+        """Play through every level once, restarting each run halfway first"""
+        import pygame
+        import main
+
+        level_count = self.game.session.level_manager.get_level_count()
+        for level_index in range(level_count):
+            # The game seeds each run from the global generator: seeding it here makes
+            # every cycle play the same runs, so what they leave behind compares
+            random.seed(level_index)
+            self.choose("Select Level")
+            self.choose(level_index)
+            self.play(ticks // 2)
+            if self.scene == main.PLAYING:
+                self.step(pygame.K_ESCAPE)
+                random.seed(level_index)
+                self.choose("Restart Game")
+                self.play(ticks)
+            if self.scene == main.PLAYING:
+                self.step(pygame.K_ESCAPE)
+            # The last option of the pause, game over and level complete menus leads to the main menu
+            self.choose(-1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Galaxy Shooter scripted memory leak check")
+    parser.add_argument("--cycles", type=int, default=6, help="Measured cycles through all levels")
+    parser.add_argument("--warmup", type=int, default=2, help="Cycles played before the baseline")
+    parser.add_argument("--ticks", type=int, default=1500, help="Most ticks per level run")
+    parser.add_argument("--max-growth-kb", type=float, default=128.0,
+                        help="Allowed growth of traced allocations after warm-up")
+    parser.add_argument("--max-object-growth", type=int, default=0,
+                        help="Allowed growth of live objects of any counted class after warm-up")
+    parser.add_argument("--verbose", action="store_true", help="Print the report of every cycle")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # Keep the player's saves and history out of it; read by core.config on import
+    data_dir = tempfile.mkdtemp(prefix="galaxy_leak_check_")
+    os.environ["GALAXY_SAVE_PATH"] = os.path.join(data_dir, "save.json")
+    os.environ["GALAXY_RUNS_PATH"] = os.path.join(data_dir, "runs.sqlite3")
+    os.environ["GALAXY_PREVIEW_DIR"] = os.path.join(data_dir, "previews")
+    os.environ["GALAXY_TELEMETRY_DIR"] = os.path.join(data_dir, "telemetry")
+    os.environ["GALAXY_TELEMETRY"] = "on"
+    import pygame
+    from core.diagnostics import MemoryTracker, format_report
+    from core.render_backend import create_backend
+    from main import create_game
+    from tools.determinism import GameClock
+
+    pygame.init()
+    clock = GameClock()
+    keys = ScriptedKeys()
+    real_get_ticks, real_get_pressed = pygame.time.get_ticks, pygame.key.get_pressed
+    pygame.time.get_ticks, pygame.key.get_pressed = clock, keys
+    try:
+        game = create_game(create_backend())
+        player = ScriptedPlayer(game, clock, keys)
+        tracker = MemoryTracker(frames=1)
+        for _ in range(args.warmup):
+            player.cycle(args.ticks)
+        baseline = tracker.checkpoint("baseline")
+        print(format_report(baseline))
+
+        report = baseline
+        for index in range(args.cycles):
+            player.cycle(args.ticks)
+            report = tracker.checkpoint(f"cycle {index + 1}")
+            if args.verbose:
+                print(format_report(report))
+        tracker.stop()
+        game.close()
+    finally:
+        pygame.time.get_ticks, pygame.key.get_pressed = real_get_ticks, real_get_pressed
+        pygame.quit()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    growth = report.traced_bytes - baseline.traced_bytes
+    object_growth = {
+        name: count - baseline.counts.get(name, 0)
+        for name, count in report.counts.items()
+        if count - baseline.counts.get(name, 0) > args.max_object_growth
+    }
+    print(f"{player.ticks} ticks, {args.cycles} measured cycles: "
+          f"{growth / 1024:+.1f} KiB traced since the baseline")
+    failed = False
+    if growth > args.max_growth_kb * 1024:
+        print(f"FAIL: allocations grew by more than {args.max_growth_kb} KiB")
+        failed = True
+    if object_growth:
+        changes = ", ".join(f"{name} {change:+d}" for name, change in sorted(object_growth.items()))
+        print(f"FAIL: live objects grew: {changes}")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""
+Offline analytics over Galaxy Shooter telemetry logs
+
+Streams session files written by managers.telemetry in fixed-size chunks,
+so memory use depends on the chunk size and not on the size of the logs.
+Each chunk is viewed as a NumPy record array and aggregated with vector
+operations:
+- Death heatmap over the 600x800 arena
+- Time to clear each level (level start -> level complete)
+- Time to kill each level's boss (boss spawn -> HP reaches 0)
+- Shots per kill for each level
+
+Writes the summary tables as CSV files and the heatmap as a PNG image to
+the output directory, and prints the tables.
+
+Usage (from the repository root):
+    python -m tools.telemetry_report ~/.galaxy_shooter/telemetry
+    python -m tools.telemetry_report logs/*.gstl --out report --cell 20
+
+Requires NumPy (pip install numpy).
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from core import config
+from managers.telemetry import (
+    HEADER, PAYLOAD, RECORD, TELEMETRY_MAGIC, TELEMETRY_VERSION,
+    LEVEL_START, SHOT, KILL, BOSS_SPAWN, BOSS_DAMAGE, DEATH, LEVEL_COMPLETE
+)
+
+# Level numbers are stored in one byte
+MAX_LEVELS = 256
+
+
+def record_dtype():
+    """NumPy layout of one version 1 telemetry record"""
+    return np.dtype([
+        ('length', '<u2'), ('kind', 'u1'), ('level', 'u1'), ('time', '<u4'),
+        ('x', '<f4'), ('y', '<f4'), ('value', '<f4'),
+    ])
+
+
+def read_chunks(path, chunk_records=1 << 20):
+    """
+    Stream the records of one session file.
+
+    Args:
+        path: Session file path
+        chunk_records: Records read per chunk
+
+    Yields:
+        NumPy record arrays of at most chunk_records records
+    """
+    dtype = record_dtype()
+    with open(path, "rb") as log_file:
+        header = log_file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        magic, version, _ = HEADER.unpack(header)
+        if magic != TELEMETRY_MAGIC or version != TELEMETRY_VERSION:
+            print(f"Skipping {path}: not a version {TELEMETRY_VERSION} telemetry file")
+            return
+        while True:
+            data = log_file.read(chunk_records * RECORD.size)
+            usable = len(data) - len(data) % RECORD.size
+            if usable == 0:
+                return
+            records = np.frombuffer(data, dtype=dtype, count=usable // RECORD.size)
+            if np.any(records['length'] != PAYLOAD.size):
+                print(f"Stopping early in {path}: unexpected record length")
+                return
+            yield records
+
+
+class Report:
+    """
+    Running aggregates over any number of session files.
+    """
+
+    def __init__(self, cell=10, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT):
+        """
+        Args:
+            cell: Heatmap cell size in pixels
+            width: Arena width
+            height: Arena height
+        """
+        self.cell = cell
+        self.columns = -(-width // cell)
+        self.rows = -(-height // cell)
+        self.heatmap = np.zeros(self.rows * self.columns, dtype=np.int64)
+        self.shots = np.zeros(MAX_LEVELS, dtype=np.int64)
+        self.kills = np.zeros(MAX_LEVELS, dtype=np.int64)
+        self.deaths = np.zeros(MAX_LEVELS, dtype=np.int64)
+        # (count, total ms, min ms, max ms) per level
+        self.clear_times = self._new_timing()
+        self.boss_times = self._new_timing()
+        self.records = 0
+        self.sessions = 0
+
+    @staticmethod
+    def _new_timing():
+        return {
+            'count': np.zeros(MAX_LEVELS, dtype=np.int64),
+            'total': np.zeros(MAX_LEVELS, dtype=np.float64),
+            'min': np.full(MAX_LEVELS, np.inf),
+            'max': np.zeros(MAX_LEVELS, dtype=np.float64),
+        }
+
+    def add_session(self, path, chunk_records=1 << 20):
+        """
+        Aggregate one session file.
+
+        Interval events (starts, spawns, completions, boss kills) are a tiny
+        fraction of a log; they are collected per session and paired at the
+        end, while the bulk events are counted chunk by chunk.
+
+        Args:
+            path: Session file path
+            chunk_records: Records read per chunk
+        """
+        starts, completes, spawns, boss_kills = [], [], [], []
+        offset = 0
+        for records in read_chunks(path, chunk_records):
+            self.records += len(records)
+            kind = records['kind']
+            level = records['level']
+            # Position in the file orders events that share a timestamp
+            sequence = np.arange(offset, offset + len(records))
+            offset += len(records)
+            self.shots += np.bincount(level[kind == SHOT], minlength=MAX_LEVELS)
+            self.kills += np.bincount(level[kind == KILL], minlength=MAX_LEVELS)
+
+            deaths = records[kind == DEATH]
+            self.deaths += np.bincount(deaths['level'], minlength=MAX_LEVELS)
+            self._add_to_heatmap(deaths['x'], deaths['y'])
+
+            for events, mask in ((starts, kind == LEVEL_START),
+                                 (completes, kind == LEVEL_COMPLETE),
+                                 (spawns, kind == BOSS_SPAWN),
+                                 (boss_kills, (kind == BOSS_DAMAGE) & (records['value'] <= 0))):
+                events.append((sequence[mask], records['time'][mask], level[mask]))
+
+        if not starts:
+            return
+        self.sessions += 1
+        self._add_intervals(self.clear_times, self._join(starts), self._join(completes))
+        self._add_intervals(self.boss_times, self._join(spawns), self._join(boss_kills))
+
+    @staticmethod
+    def _join(parts):
+        """Concatenate per-chunk (sequence, time, level) arrays"""
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def _add_to_heatmap(self, xs, ys):
+        columns = np.clip((xs // self.cell).astype(np.int64), 0, self.columns - 1)
+        rows = np.clip((ys // self.cell).astype(np.int64), 0, self.rows - 1)
+        self.heatmap += np.bincount(rows * self.columns + columns, minlength=self.heatmap.size)
+
+    @staticmethod
+    def _add_intervals(timing, begins, ends):
+        """
+        Pair every end event with the latest begin event before it.
+
+        Args:
+            timing: Timing aggregate dict to update
+            begins: (sequence, time, level) arrays of the interval starts
+            ends: (sequence, time, level) arrays of the interval ends
+        """
+        begin_sequence, begin_times, begin_levels = begins
+        end_sequence, end_times, end_levels = ends
+        if len(begin_sequence) == 0 or len(end_sequence) == 0:
+            return
+        begin_times = begin_times.astype(np.int64)
+        end_times = end_times.astype(np.int64)
+        index = np.searchsorted(begin_sequence, end_sequence) - 1
+        valid = index >= 0
+        index = index[valid]
+        levels = end_levels[valid]
+        # Only pair an end with a begin of the same level
+        same_level = begin_levels[index] == levels
+        durations = (end_times[valid] - begin_times[index])[same_level].astype(np.float64)
+        levels = levels[same_level]
+        timing['count'] += np.bincount(levels, minlength=MAX_LEVELS)
+        timing['total'] += np.bincount(levels, weights=durations, minlength=MAX_LEVELS)
+        np.minimum.at(timing['min'], levels, durations)
+        np.maximum.at(timing['max'], levels, durations)
+
+    def level_table(self):
+        """
+        Per-level summary rows.
+
+        Returns:
+            List of dicts, one per level that appears in the logs
+        """
+        rows = []
+        played = np.flatnonzero(self.shots + self.kills + self.deaths + self.clear_times['count']
+                                + self.boss_times['count'])
+        for level in played:
+            clears = self.clear_times['count'][level]
+            boss_kills = self.boss_times['count'][level]
+            kills = self.kills[level] + boss_kills
+            rows.append({
+                'level': int(level),
+                'shots': int(self.shots[level]),
+                'kills': int(kills),
+                'shots_per_kill': round(self.shots[level] / kills, 2) if kills else '',
+                'deaths': int(self.deaths[level]),
+                'clears': int(clears),
+                'clear_mean_s': self._seconds(self.clear_times['total'][level] / clears) if clears else '',
+                'clear_best_s': self._seconds(self.clear_times['min'][level]) if clears else '',
+                'boss_kills': int(boss_kills),
+                'boss_ttk_mean_s': self._seconds(self.boss_times['total'][level] / boss_kills) if boss_kills else '',
+                'boss_ttk_best_s': self._seconds(self.boss_times['min'][level]) if boss_kills else '',
+            })
+        return rows
+
+    @staticmethod
+    def _seconds(ms):
+        return round(float(ms) / 1000, 2)
+
+    def heatmap_grid(self):
+        """Return the death counts as a (rows, columns) array"""
+        return self.heatmap.reshape(self.rows, self.columns)
+
+    def heatmap_image(self):
+        """
+        Render the heatmap as an RGB array covering the whole arena.
+
+        Returns:
+            uint8 array of shape (width, height, 3), as pygame.surfarray expects
+        """
+        grid = self.heatmap_grid().astype(np.float64)
+        heat = np.log1p(grid)
+        if heat.max() > 0:
+            heat /= heat.max()
+        # Black -> red -> yellow -> white
+        rgb = np.stack([
+            np.clip(heat * 3, 0, 1),
+            np.clip(heat * 3 - 1, 0, 1),
+            np.clip(heat * 3 - 2, 0, 1),
+        ], axis=-1)
+        image = (rgb * 255).astype(np.uint8)
+        image = image.repeat(self.cell, axis=0).repeat(self.cell, axis=1)
+        return image.transpose(1, 0, 2)
+
+
+def write_csv(path, rows):
+    """Write a list of dicts as a CSV table"""
+    import csv
+
+    with open(path, "w", newline="", encoding="utf-8") as csv_file:
+        if not rows:
+            return
+        writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def print_table(rows):
+    """Print a list of dicts as an aligned text table"""
+    if not rows:
+        print("No level events found")
+        return
+    columns = list(rows[0])
+    widths = [max(len(column), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[column]).rjust(width) for column, width in zip(columns, widths)))
+
+
+def save_heatmap(path, image):
+    """Save an RGB heatmap array as an image"""
+    import pygame
+
+    pygame.image.save(pygame.surfarray.make_surface(image), path)
+
+
+def find_logs(paths):
+    """Expand directories into the telemetry files they contain"""
+    logs = []
+    for path in paths:
+        if os.path.isdir(path):
+            logs.extend(sorted(glob.glob(os.path.join(path, "*.gstl"))))
+        else:
+            logs.append(path)
+    return logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Galaxy Shooter telemetry report")
+    parser.add_argument("paths", nargs="*", default=[config.TELEMETRY_DIR],
+                        help="Session files or directories (default: the telemetry directory)")
+    parser.add_argument("--out", default="telemetry_report", help="Output directory")
+    parser.add_argument("--cell", type=int, default=10, help="Heatmap cell size in pixels")
+    parser.add_argument("--chunk", type=int, default=1 << 20, help="Records read per chunk")
+    args = parser.parse_args()
+
+    if np is None:
+        sys.exit("The telemetry report needs NumPy: pip install numpy")
+
+    report = Report(cell=args.cell)
+    for path in find_logs(args.paths):
+        try:
+            report.add_session(path, args.chunk)
+        except OSError as e:
+            print(f"Could not read {path}: {e}")
+
+    os.makedirs(args.out, exist_ok=True)
+    rows = report.level_table()
+    write_csv(os.path.join(args.out, "levels.csv"), rows)
+    np.savetxt(os.path.join(args.out, "death_heatmap.csv"), report.heatmap_grid(), fmt="%d", delimiter=",")
+    save_heatmap(os.path.join(args.out, "death_heatmap.png"), report.heatmap_image())
+
+    print(f"{report.sessions} sessions, {report.records} events")
+    print_table(rows)
+    print(f"Wrote {args.out}/levels.csv, death_heatmap.csv and death_heatmap.png")
+
+
+if __name__ == "__main__":
+    main()